@@ -0,0 +1,85 @@
+"""
+Import-time report for a backend module.
+
+Runs `python -X importtime` in a fresh interpreter so nothing is already
+cached, then lists the slowest modules and totals per top-level package.
+Exits non-zero when the total is over `--budget-ms`, so it can guard
+startup cost in CI.
+
+    cd backend && python -m benchmarks.importProfile main --top 25 --budget-ms 1500
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _profile(module: str) -> list[tuple[int, int, str]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        tail = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise SystemExit(f"Importing {module} failed: {tail[0]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+        self_us, cumulative_us, name = fields
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def _report(module: str, rows: list[tuple[int, int, str]], top: int) -> float:
+    # The requested module's own row carries the cumulative total
+    total_us = next(
+        (cum for _, cum, name in rows if name.strip() == module),
+        sum(own for own, _, _ in rows),
+    )
+
+    by_package: dict[str, int] = defaultdict(int)
+    for own, _, name in rows:
+        by_package[name.strip().split(".")[0]] += own
+
+    print(f"import {module}: {total_us / 1000:.1f} ms, {len(rows)} modules\n")
+
+    print(f"{'self ms':>9} {'cum ms':>9}  module")
+    for own, cum, name in sorted(rows, key=lambda r: r[0], reverse=True)[:top]:
+        print(f"{own / 1000:>9.1f} {cum / 1000:>9.1f}  {name.strip()}")
+
+    print(f"\n{'self ms':>9}  package")
+    for package, own in sorted(by_package.items(), key=lambda p: p[1], reverse=True)[
+        :top
+    ]:
+        print(f"{own / 1000:>9.1f}  {package}")
+
+    return total_us / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("module", nargs="?", default="main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    total_ms = _report(args.module, _profile(args.module), args.top)
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"\nOver budget: {total_ms:.1f} ms > {args.budget_ms:g} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
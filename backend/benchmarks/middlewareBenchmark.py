@@ -0,0 +1,168 @@
+"""
+Per-request overhead of the HTTP middleware stack.
+
+Compares the previous BaseHTTPMiddleware-based layers against the pure ASGI
+middleware now mounted in main.py, driving each stack directly over ASGI
+(no server, no network) so only middleware cost is measured.
+
+    cd backend && python -m benchmarks.middlewareBenchmark --requests 20000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import logging
+import time
+import uuid
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from middleware.httpLogger import HTTPLoggerMiddleware
+from middleware.rateLimiterMiddleware import RateLimiterMiddleware
+from middleware.requestScopeMiddleware import RequestScopeMiddleware
+from middleware.securityMiddleware import (
+    SECURITY_HEADERS,
+    RequestIDMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+PATH = "/bench"
+
+
+class _BenchContainer:
+    @asynccontextmanager
+    async def create_scope(self):
+        yield {}
+
+
+async def _endpoint(request):
+    return PlainTextResponse("ok")
+
+
+def _router():
+    return Starlette(routes=[Route(PATH, _endpoint)])
+
+
+def _host():
+    host = Starlette()
+    host.state.container = _BenchContainer()
+    return host
+
+
+# --------------------------------------------------
+# Previous BaseHTTPMiddleware layers, reproduced for comparison
+# --------------------------------------------------
+async def _legacy_rate_limiter(request, call_next):
+    # Benchmark path is excluded, matching the ASGI stack below
+    if any(request.url.path.startswith(p) for p in [PATH]):
+        return await call_next(request)
+    return await call_next(request)
+
+
+async def _legacy_security(request, call_next):
+    response = await call_next(request)
+    for name, value in SECURITY_HEADERS.items():
+        response.headers[name] = value
+    return response
+
+
+async def _legacy_logger(request, call_next):
+    start = time.time()
+    response = await call_next(request)
+    print(request.method, request.url.path, response.status_code, time.time() - start)
+    return response
+
+
+async def _legacy_request_id(request, call_next):
+    rid = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+    response = await call_next(request)
+    response.headers["X-Request-ID"] = rid
+    return response
+
+
+async def _legacy_scope(request, call_next):
+    async with request.app.state.container.create_scope() as scope:
+        request.state.scope = scope
+        return await call_next(request)
+
+
+def legacy_stack():
+    app = _router()
+    for dispatch in (
+        _legacy_rate_limiter,
+        _legacy_security,
+        _legacy_logger,
+        _legacy_request_id,
+        _legacy_scope,
+    ):
+        app = BaseHTTPMiddleware(app, dispatch=dispatch)
+    return app
+
+
+def asgi_stack():
+    app = _router()
+    app = RateLimiterMiddleware(app, excluded_paths=[PATH])
+    app = SecurityHeadersMiddleware(app)
+    app = HTTPLoggerMiddleware(app)
+    app = RequestIDMiddleware(app)
+    app = RequestScopeMiddleware(app)
+    return app
+
+
+async def _run(app, host, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    def scope():
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": PATH,
+            "raw_path": PATH.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"bench")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("bench", 80),
+            "app": host,
+        }
+
+    for _ in range(min(500, requests)):
+        await app(scope(), receive, send)
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(scope(), receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def main(requests: int) -> None:
+    host = _host()
+    logging.disable(logging.CRITICAL)
+    with contextlib.redirect_stdout(io.StringIO()):
+        bare = await _run(_router(), host, requests)
+        legacy = await _run(legacy_stack(), host, requests)
+        asgi = await _run(asgi_stack(), host, requests)
+
+    print(f"{'stack':<22}{'us/request':>12}{'overhead':>12}")
+    print(f"{'no middleware':<22}{bare:>12.1f}{0:>12.1f}")
+    print(f"{'BaseHTTPMiddleware':<22}{legacy:>12.1f}{legacy - bare:>12.1f}")
+    print(f"{'pure ASGI':<22}{asgi:>12.1f}{asgi - bare:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
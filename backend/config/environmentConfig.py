@@ -30,6 +30,7 @@ class Settings(BaseSettings):
 
     secret_key: str = "default-key"
     algorithm: str = "HS256"
+    auth_token_cache_size: int = 4096
 
     email: Optional[str] = None
     password: Optional[str] = None
@@ -49,6 +50,44 @@ class Settings(BaseSettings):
     paypal_client_id: Optional[str] = None
     paypal_secret_key: Optional[str] = None
 
+    cache_local_enabled: bool = False
+    cache_local_maxsize: int = 1024
+    cache_local_ttl: float = 30.0
+    cache_local_prefixes: List[str] = ["category:", "restaurant:"]
+    cache_codec: str = "orjson"
+    cache_compression: Optional[str] = "zstd"
+    cache_compress_min_bytes: int = 1024
+    cache_schema_version: str = "1"
+    cache_negative_ttl: int = 30
+
+    metrics_enabled: bool = True
+    container_trace_sample_rate: float = 0.0
+
+    redis_max_connections: int = 50
+    redis_pool_timeout: float = 5.0
+    redis_socket_timeout: float = 5.0
+    redis_connect_timeout: float = 5.0
+    redis_health_check_interval: int = 30
+    redis_keepalive: bool = True
+
+    startup_redis_timeout: float = 10.0
+    startup_mongo_timeout: float = 15.0
+    warmup_enabled: bool = True
+    warmup_timeout: float = 10.0
+    warmup_pool_connections: int = 5
+
+    ratelimit_local_enabled: bool = False
+    ratelimit_sync_interval_ms: int = 100
+    ratelimit_local_error_budget: float = 0.1
+
+    circuit_failure_rate: float = 0.5
+    circuit_minimum_calls: int = 20
+    circuit_window_seconds: float = 30.0
+    circuit_recovery_timeout: float = 30.0
+    circuit_half_open_max_calls: int = 3
+    circuit_shared_enabled: bool = False
+    circuit_sync_interval_ms: int = 1000
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -1,10 +1,58 @@
+import time
 from contextlib import asynccontextmanager
-from typing import Any, Awaitable, Callable, Dict, Literal, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, Literal, Optional
 
 from utilities.logger import logger
+from utilities.metrics import metrics
+
+from .containerLifetimes import stateful_reason
+from .containerLoader import ClassRef, load_class
 
 Lifetime = Literal["singleton", "transient", "scoped"]
 
+_RESOLVE_SECONDS = metrics.histogram(
+    "container_resolve_seconds", "Container.resolve latency per requested service"
+)
+_CONSTRUCT_SECONDS = metrics.histogram(
+    "container_construct_seconds", "Time spent constructing each dependency"
+)
+_CREATED = metrics.counter(
+    "container_instances_created_total", "Instances created per service and lifetime"
+)
+_SCOPE_INSTANCES = metrics.histogram(
+    "container_scope_instances",
+    "Scoped instances created per request scope",
+    buckets=(0, 1, 2, 4, 8, 16, 32),
+)
+_SCOPE_SECONDS = metrics.histogram(
+    "container_scope_seconds", "Lifetime of request scopes"
+)
+
+
+class _Step:
+    """
+    One node of a precompiled resolution plan. `cls` steps are built
+    synchronously from already-resolved dependencies (a 'module:Class'
+    path is imported on first construction); `factory` steps are opaque
+    (possibly async) registrations.
+    """
+
+    __slots__ = ("name", "lifetime", "cls", "factory", "deps")
+
+    def __init__(
+        self,
+        name: str,
+        lifetime: Lifetime,
+        cls: Optional[ClassRef],
+        factory: Callable,
+        deps: tuple[tuple[str, str], ...],
+    ):
+        self.name = name
+        self.lifetime = lifetime
+        self.cls = cls
+        self.factory = factory
+        self.deps = deps
+
 
 class Container:
     """
@@ -27,6 +75,9 @@ class Container:
             self._factories: Dict[str, Callable[["Container"], Any]] = {}
             self._lifetimes: Dict[str, Lifetime] = {}
             self._instances: Dict[str, Any] = {}
+            self._classes: Dict[str, ClassRef] = {}
+            self._deps: Dict[str, dict[str, str]] = {}
+            self._plans: Dict[str, tuple[_Step, ...]] = {}
             self._initialized = True
         except Exception as e:
             logger.error(
@@ -39,23 +90,253 @@ class Container:
         name: str,
         factory: Callable[["Container"], Any | Awaitable[Any]],
         lifetime: Lifetime = "singleton",
+        *,
+        cls: Optional[ClassRef] = None,
+        deps: Optional[dict[str, str]] = None,
     ) -> None:
+        """
+        `cls` and `deps` ({kwarg: dependency name}) declare how the factory
+        builds its instance so `compile()` can plan it; registrations
+        without them are resolved by calling the factory.
+        """
         try:
             self._factories[name] = factory
             self._lifetimes[name] = lifetime
+            self._deps[name] = dict(deps or {})
+            if cls is not None:
+                self._classes[name] = cls
+            else:
+                self._classes.pop(name, None)
+            self._plans.clear()
         except Exception as e:
             logger.error(
                 f"[Container] Registering resources failed: {e}", exc_info=True
             )
             raise SystemExit(1)
 
+    # --------------------------------------------------
+    # Lifetime promotion
+    # --------------------------------------------------
+    def promote_stateless(self, exclude: Iterable[str] = ()) -> list[str]:
+        """
+        Promotes scoped/transient class registrations to singletons when the
+        class keeps no state outside `__init__` and every dependency is
+        (or has just become) a singleton. Returns the promoted names.
+        """
+        exclude = set(exclude)
+        promoted: list[str] = []
+        kept: dict[str, str] = {}
+
+        for name in self._topological_order():
+            lifetime = self._lifetimes[name]
+            if lifetime == "singleton":
+                continue
+
+            cls = self._classes.get(name)
+            if name in exclude:
+                kept[name] = "excluded"
+            elif cls is None:
+                kept[name] = "opaque factory"
+            elif reason := stateful_reason(cls):
+                kept[name] = reason
+            elif blocking := [
+                dep
+                for dep in self._deps[name].values()
+                if self._lifetimes[dep] != "singleton"
+            ]:
+                kept[name] = (
+                    f"depends on {blocking[0]} ({self._lifetimes[blocking[0]]})"
+                )
+            else:
+                self._lifetimes[name] = "singleton"
+                promoted.append(name)
+
+        self._plans.clear()
+
+        logger.info(
+            f"[Container] Promoted {len(promoted)} stateless services to singleton: "
+            f"{', '.join(promoted) or 'none'}"
+        )
+        for name, reason in kept.items():
+            logger.info(f"[Container] Kept {name} {self._lifetimes[name]}: {reason}")
+
+        return promoted
+
+    # --------------------------------------------------
+    # Dependency graph
+    # --------------------------------------------------
+    def compile(self) -> None:
+        """
+        Validates the dependency graph (missing names, cycles) and
+        precomputes a topologically ordered resolution plan per service.
+        """
+        for name, deps in self._deps.items():
+            for dep in deps.values():
+                if dep not in self._factories:
+                    raise KeyError(f"'{name}' depends on unregistered '{dep}'")
+
+        order = self._topological_order()
+
+        for name in order:
+            lifetime = self._lifetimes[name]
+            for dep in self._deps[name].values():
+                dep_lifetime = self._lifetimes[dep]
+                if lifetime == "singleton" and dep_lifetime != "singleton":
+                    logger.warn(
+                        f"[Container] Singleton '{name}' captures "
+                        f"{dep_lifetime} dependency '{dep}'"
+                    )
+
+        self._plans = {name: self._plan(name) for name in order}
+        logger.info(f"[Container] Compiled resolution plans for {len(order)} services")
+
+    def _topological_order(self) -> list[str]:
+        visiting: list[str] = []
+        done: set[str] = set()
+        order: list[str] = []
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                cycle = visiting[visiting.index(name) :] + [name]
+                raise RuntimeError(f"Dependency cycle: {' -> '.join(cycle)}")
+
+            visiting.append(name)
+            for dep in self._deps[name].values():
+                visit(dep)
+            visiting.pop()
+
+            done.add(name)
+            order.append(name)
+
+        for name in self._factories:
+            visit(name)
+        return order
+
+    def _plan(self, root: str) -> tuple[_Step, ...]:
+        seen: set[str] = set()
+        steps: list[_Step] = []
+
+        def visit(name: str) -> None:
+            if name in seen:
+                return
+            seen.add(name)
+            for dep in self._deps[name].values():
+                visit(dep)
+            steps.append(
+                _Step(
+                    name,
+                    self._lifetimes[name],
+                    self._classes.get(name),
+                    self._factories[name],
+                    tuple(self._deps[name].items()),
+                )
+            )
+
+        visit(root)
+        return tuple(steps)
+
+    # --------------------------------------------------
+    # Resolution
+    # --------------------------------------------------
     async def resolve(self, name: str, scope: Optional[dict] = None) -> Any:
+        if not metrics.enabled:
+            return await self._resolve(name, scope)
+
+        started = time.perf_counter()
+        try:
+            return await self._resolve(name, scope)
+        finally:
+            _RESOLVE_SECONDS.observe(time.perf_counter() - started, service=name)
+
+    async def _resolve(self, name: str, scope: Optional[dict]) -> Any:
+        plan = self._plans.get(name)
+        if plan is None:
+            return await self._resolve_dynamic(name, scope)
+
+        # Fast path: root already built for this process / request
+        lifetime = plan[-1].lifetime
+        if lifetime == "singleton":
+            instance = self._instances.get(name)
+            if instance is not None:
+                return instance
+        elif lifetime == "scoped":
+            if scope is None:
+                raise RuntimeError(
+                    f"Scope required to resolve scoped dependency '{name}'"
+                )
+            instance = scope.get(name)
+            if instance is not None:
+                return instance
+
+        return await self._run_plan(plan, scope)
+
+    async def _run_plan(self, plan: tuple[_Step, ...], scope: Optional[dict]) -> Any:
+        resolved: dict[str, Any] = {}
+
+        # Backward pass: reuse cached instances and find what must be built
+        needed = {plan[-1].name}
+        for step in reversed(plan):
+            if step.name not in needed:
+                continue
+
+            if step.lifetime == "singleton":
+                instance = self._instances.get(step.name)
+            elif step.lifetime == "scoped":
+                if scope is None:
+                    raise RuntimeError(
+                        f"Scope required to resolve scoped dependency '{step.name}'"
+                    )
+                instance = scope.get(step.name)
+            else:
+                instance = None
+
+            if instance is not None:
+                resolved[step.name] = instance
+                continue
+
+            for _, dep in step.deps:
+                needed.add(dep)
+
+        # Forward pass: dependencies always precede their dependents
+        observe = metrics.enabled
+        for step in plan:
+            if step.name in resolved or step.name not in needed:
+                continue
+
+            started = time.perf_counter() if observe else 0.0
+            if step.cls is not None:
+                if isinstance(step.cls, str):
+                    step.cls = load_class(step.cls)
+                instance = step.cls(**{arg: resolved[dep] for arg, dep in step.deps})
+            else:
+                instance = step.factory(self, scope)
+                if isinstance(instance, Awaitable):
+                    instance = await instance
+            if observe:
+                _CONSTRUCT_SECONDS.observe(
+                    time.perf_counter() - started, service=step.name
+                )
+                _CREATED.inc(service=step.name, lifetime=step.lifetime)
+
+            if step.lifetime == "singleton":
+                self._instances[step.name] = instance
+            elif step.lifetime == "scoped":
+                scope[step.name] = instance
+            resolved[step.name] = instance
+
+        return resolved[plan[-1].name]
+
+    async def _resolve_dynamic(self, name: str, scope: Optional[dict] = None) -> Any:
         lifetime = self._lifetimes.get(name, "singleton")
 
         async def _create_instance():
             result = self._factories[name](self, scope)
             if isinstance(result, Awaitable):
-                return await result
+                result = await result
+            if metrics.enabled:
+                _CREATED.inc(service=name, lifetime=lifetime)
             return result
 
         if lifetime == "singleton":
@@ -89,6 +370,7 @@ class Container:
     @asynccontextmanager
     async def create_scope(self):
         scope: dict[str, Any] = {}
+        started = time.perf_counter()
         try:
             yield scope
         except Exception as e:
@@ -101,19 +383,55 @@ class Container:
                     maybe_await = close_fn()
                     if isinstance(maybe_await, Awaitable):
                         await maybe_await
+            if metrics.enabled:
+                _SCOPE_INSTANCES.observe(len(scope))
+                _SCOPE_SECONDS.observe(time.perf_counter() - started)
             scope.clear()
 
     async def build(self) -> "Container":
+        """
+        Validates the graph and compiles resolution plans. Nothing is
+        instantiated; singletons are created on first resolve.
+        """
         try:
-            await self.resolve("CacheService")
-            await self.resolve("FileService")
-            await self.resolve("BasicTokenService")
-            logger.info("Core services initialized successfully.")
+            self.compile()
+            logger.info("Core services compiled successfully.")
         except Exception as e:
             logger.error(f"[Container] Core bootstrap failed: {e}", exc_info=True)
             raise SystemExit(1)
         return self
 
+    async def instantiate_singletons(
+        self, names: Optional[Iterable[str]] = None
+    ) -> int:
+        """
+        Builds the given singletons (every singleton when `names` is None)
+        in dependency order, so their first use only does dictionary
+        lookups. Returns how many were built.
+        """
+        wanted = None if names is None else set(names)
+        built = 0
+        for name in self._topological_order():
+            if wanted is not None and name not in wanted:
+                continue
+            if self._lifetimes[name] == "singleton" and name not in self._instances:
+                await self.resolve(name)
+                built += 1
+        return built
+
+    async def close(self) -> None:
+        """Closes singletons that own resources (HTTP clients, pools)."""
+        for name, instance in list(self._instances.items()):
+            close_fn = getattr(instance, "close", None)
+            if not callable(close_fn):
+                continue
+            try:
+                maybe_await = close_fn()
+                if isinstance(maybe_await, Awaitable):
+                    await maybe_await
+            except Exception as e:
+                logger.warn(f"[Container] Closing '{name}' failed: {e}")
+
     def summary(self):
         try:
             logger.info("[Container Summary]")
@@ -1,10 +1,33 @@
+from config.environmentConfig import settings
+from utilities.circuitBreaker import breakers
 from utilities.logger import logger
 
 from .container import Container
 from .containerControllers import register_controllers
-from .containerCore import init_connections
+from .containerCore import close_connections, init_connections
 from .containerRepositories import register_repositories
 from .containerServices import register_services
+from .containerWarmup import WARMUP_SERVICES, warmup
+
+
+def register_all(container: Container) -> None:
+    """Registers every repository, service and controller. Imports nothing."""
+    register_repositories(container)
+    register_services(
+        container,
+        default_lifetime="scoped",
+        overrides={
+            "CacheService": "singleton",
+            "FileService": "singleton",
+            "BasicTokenService": "singleton",
+            "EmailService": "transient",
+            "OAuthService": "transient",
+            "WebService": "singleton",
+            "TokenService": "transient",
+        },
+    )
+    register_controllers(container)
+    container.promote_stateless()
 
 
 async def bootstrap() -> Container:
@@ -13,26 +36,65 @@ async def bootstrap() -> Container:
 
         container = Container()
         await init_connections()
-        register_repositories(container)
-        register_services(
-            container,
-            default_lifetime="scoped",
-            overrides={
-                "CacheService": "singleton",
-                "FileService": "singleton",
-                "BasicTokenService": "singleton",
-                "EmailService": "transient",
-                "OAuthService": "transient",
-                "WebService": "transient",
-                "TokenService": "transient",
-            },
-        )
-        register_controllers(container)
+        register_all(container)
 
         await container.build()
+        await container.instantiate_singletons(WARMUP_SERVICES)
+
+        cache = await container.resolve("CacheService")
+        await cache.start_listener()
+
+        if settings.warmup_enabled and settings.mode not in {"ci", "testing", "test"}:
+            await warmup(container)
+
         # container.summary()
         logger.info("IoC container Bootstrap completed.")
         return container
     except Exception as e:
         logger.error(f"[Container] Bootstrap failed: {e}")
         raise
+
+
+async def bootstrap_worker() -> Container:
+    """
+    Worker variant: opens the connections and compiles the graph, nothing
+    more. Tasks resolve (and import) only the services they use, so there
+    is no invalidation listener, warmup or eager singleton.
+    """
+    try:
+        logger.info("Bootstrapping worker IoC container...")
+
+        container = Container()
+        await init_connections()
+        register_all(container)
+        await container.build()
+
+        logger.info("Worker IoC container Bootstrap completed.")
+        return container
+    except Exception as e:
+        logger.error(f"[Container] Worker bootstrap failed: {e}")
+        raise
+
+
+async def shutdown(container: Container) -> None:
+    try:
+        cache = await container.resolve("CacheService")
+        await cache.shutdown()
+        await container.close()
+        await breakers.close()
+        logger.info("IoC container shutdown completed.")
+    except Exception as e:
+        logger.error(f"[Container] Shutdown failed: {e}")
+    finally:
+        await close_connections()
+
+
+async def shutdown_worker(container: Container) -> None:
+    try:
+        await container.close()
+        await breakers.close()
+        logger.info("Worker IoC container shutdown completed.")
+    except Exception as e:
+        logger.error(f"[Container] Worker shutdown failed: {e}")
+    finally:
+        await close_connections()
@@ -1,104 +1,88 @@
-from typing import Literal, Type, TypedDict
-
-from controller.authController import AuthController
-from controller.bookingController import BookingController
-from controller.categoryController import CategoryController
-from controller.comboController import ComboControler
-from controller.deliveryController import DeliveryController
-from controller.discountController import DiscountController
-from controller.drinkController import DrinkController
-from controller.driverController import DriverController
-from controller.employeeController import EmployeeController
-from controller.favouriteController import FavouriteController
-from controller.fileController import FileController
-from controller.foodController import FoodController
-from controller.orderController import OrderController
-from controller.paymentController import PaymentController
-from controller.reservationController import ReservationController
-from controller.restaurantController import RestaurantController
-from controller.reviewController import ReviewController
-from controller.userController import UserController
+from typing import Literal, TypedDict
+
 from utilities.logger import logger
 
+from .containerLoader import load_class
+
 Lifetime = Literal["singleton", "transient", "scoped"]
 
 
 class ControllerSpec(TypedDict):
-    controller: Type
+    controller: str
     service: str
 
 
 CONTROLLERS: dict[str, ControllerSpec] = {
     "AuthController": {
-        "controller": AuthController,
+        "controller": "controller.authController:AuthController",
         "service": "AuthService",
     },
     "UserController": {
-        "controller": UserController,
+        "controller": "controller.userController:UserController",
         "service": "UserService",
     },
     "FileController": {
-        "controller": FileController,
+        "controller": "controller.fileController:FileController",
         "service": "FileService",
     },
     "PaymentController": {
-        "controller": PaymentController,
+        "controller": "controller.paymentController:PaymentController",
         "service": "PaymentService",
     },
     "OrderController": {
-        "controller": OrderController,
+        "controller": "controller.orderController:OrderController",
         "service": "OrderService",
     },
     "CategoryController": {
-        "controller": CategoryController,
+        "controller": "controller.categoryController:CategoryController",
         "service": "CategoryService",
     },
     "RestaurantController": {
-        "controller": RestaurantController,
+        "controller": "controller.restaurantController:RestaurantController",
         "service": "RestaurantService",
     },
     "BookingController": {
-        "controller": BookingController,
+        "controller": "controller.bookingController:BookingController",
         "service": "BookingService",
     },
     "ComboController": {
-        "controller": ComboControler,
+        "controller": "controller.comboController:ComboControler",
         "service": "ComboService",
     },
     "DeliveryController": {
-        "controller": DeliveryController,
+        "controller": "controller.deliveryController:DeliveryController",
         "service": "DeliveryService",
     },
     "DiscountController": {
-        "controller": DiscountController,
+        "controller": "controller.discountController:DiscountController",
         "service": "DiscountService",
     },
     "DrinkController": {
-        "controller": DrinkController,
+        "controller": "controller.drinkController:DrinkController",
         "service": "DrinkService",
     },
     "EmployeeController": {
-        "controller": EmployeeController,
+        "controller": "controller.employeeController:EmployeeController",
         "service": "EmployeeService",
     },
     "FavouriteController": {
-        "controller": FavouriteController,
+        "controller": "controller.favouriteController:FavouriteController",
         "service": "FavouriteService",
     },
     "FoodController": {
-        "controller": FoodController,
+        "controller": "controller.foodController:FoodController",
         "service": "FoodService",
     },
     "ReservationController": {
-        "controller": ReservationController,
+        "controller": "controller.reservationController:ReservationController",
         "service": "ReservationService",
     },
     "DriverController": {
-        "controller": DriverController,
+        "controller": "controller.driverController:DriverController",
         "service": "DriverService",
     },
     "ReviewController": {
-        "controller": ReviewController,
+        "controller": "controller.reviewController:ReviewController",
         "service": "ReviewService",
     },
 }
@@ -107,7 +91,7 @@ CONTROLLERS: dict[str, ControllerSpec] = {
 def make_controller_factory(controller_cls, service_name: str):
     async def factory(container, scope):
         service = await container.resolve(service_name, scope)
-        return controller_cls(**{service_name.lower(): service})
+        return load_class(controller_cls)(**{service_name.lower(): service})
 
     return factory
 
@@ -140,6 +124,8 @@ def register_controllers(
                     spec["service"],
                 ),
                 lifetime,
+                cls=spec["controller"],
+                deps={spec["service"].lower(): spec["service"]},
             )
 
         logger.info("[Container] Controllers registered successfully")
@@ -1,13 +1,56 @@
-from resources.mongo_client import init_mongo
-from resources.redis_client import init_redis
+import asyncio
+
+from config.environmentConfig import settings
+from resources.mongo_client import close_mongo, init_mongo
+from resources.redis_client import close_redis, init_redis
 from utilities.logger import logger
 
 
+async def _init_with_timeout(name: str, init, timeout: float) -> None:
+    try:
+        await asyncio.wait_for(init(), timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"{name} did not become ready within {timeout:g}s")
+
+
+async def _close(name: str, close) -> None:
+    try:
+        result = close()
+        if asyncio.iscoroutine(result):
+            await result
+    except Exception as e:
+        logger.warn(f"[Container] Closing {name} after a failed startup failed: {e}")
+
+
 async def init_connections():
+    connections = (
+        ("Redis", init_redis, close_redis, settings.startup_redis_timeout),
+        ("MongoDB", init_mongo, close_mongo, settings.startup_mongo_timeout),
+    )
     try:
-        await init_redis()
-        await init_mongo()
+        # Independent resources — connect concurrently, and close whichever
+        # came up if its sibling did not
+        results = await asyncio.gather(
+            *(_init_with_timeout(name, init, t) for name, init, _, t in connections),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            for (name, _, close, _), result in zip(connections, results):
+                if not isinstance(result, BaseException):
+                    await _close(name, close)
+            raise errors[0]
+
         logger.info("[Container] Core connections succeeded")
     except Exception as e:
         logger.error(f"[Container] Connections failed: {e}")
         raise
+
+
+async def close_connections():
+    try:
+        await close_redis()
+        close_mongo()
+        logger.info("[Container] Core connections closed")
+    except Exception as e:
+        logger.error(f"[Container] Closing connections failed: {e}")
@@ -0,0 +1,211 @@
+import ast
+import inspect
+import sys
+import textwrap
+from functools import lru_cache
+from typing import Optional, Type
+
+from .containerLoader import ClassRef, find_class, import_class, resolve_name
+
+
+def _self_writes(func: ast.AST) -> list[str]:
+    """Attributes of `self` assigned (directly or by item/slice) in `func`."""
+    written = []
+    for node in ast.walk(func):
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, (ast.AugAssign, ast.AnnAssign)):
+            targets = [node.target]
+        else:
+            continue
+
+        for target in targets:
+            for sub in ast.walk(target):
+                if (
+                    isinstance(sub, ast.Attribute)
+                    and isinstance(sub.value, ast.Name)
+                    and sub.value.id == "self"
+                ):
+                    written.append(sub.attr)
+    return written
+
+
+_MUTABLE_FACTORIES = {
+    "list",
+    "dict",
+    "set",
+    "bytearray",
+    "deque",
+    "defaultdict",
+    "OrderedDict",
+    "Counter",
+}
+_MUTATORS = {
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "add",
+    "discard",
+    "update",
+    "setdefault",
+    "pop",
+    "popitem",
+    "clear",
+    "appendleft",
+    "extendleft",
+    "popleft",
+}
+
+
+def _is_self_attr(node: ast.AST) -> bool:
+    return (
+        isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "self"
+    )
+
+
+def _is_mutable(value: Optional[ast.AST]) -> bool:
+    if isinstance(
+        value,
+        (ast.List, ast.Dict, ast.Set, ast.ListComp, ast.DictComp, ast.SetComp),
+    ):
+        return True
+    if isinstance(value, ast.Call):
+        func = value.func
+        name = (
+            func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+        )
+        return name in _MUTABLE_FACTORIES
+    return False
+
+
+def _init_containers(tree: ast.AST) -> set[str]:
+    """Attributes `__init__` sets to a mutable container (list, dict, set...)."""
+    containers = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if node.name != "__init__":
+            continue
+
+        for stmt in ast.walk(node):
+            if isinstance(stmt, ast.Assign):
+                targets, value = stmt.targets, stmt.value
+            elif isinstance(stmt, ast.AnnAssign):
+                targets, value = [stmt.target], stmt.value
+            else:
+                continue
+            if _is_mutable(value):
+                containers.update(t.attr for t in targets if _is_self_attr(t))
+    return containers
+
+
+def _self_mutations(func: ast.AST, containers: set[str]) -> list[str]:
+    """In-place changes to `self`: setattr/del, or mutators on its containers."""
+    mutated = []
+    for node in ast.walk(func):
+        if isinstance(node, ast.Delete):
+            mutated.extend(
+                sub.attr
+                for target in node.targets
+                for sub in ast.walk(target)
+                if _is_self_attr(sub)
+            )
+        elif isinstance(node, ast.Call):
+            func_node = node.func
+            if (
+                isinstance(func_node, ast.Name)
+                and func_node.id in {"setattr", "delattr"}
+                and node.args
+                and isinstance(node.args[0], ast.Name)
+                and node.args[0].id == "self"
+            ):
+                mutated.append("__dict__")
+            elif (
+                isinstance(func_node, ast.Attribute)
+                and func_node.attr in _MUTATORS
+                and _is_self_attr(func_node.value)
+                and func_node.value.attr in containers
+            ):
+                mutated.append(func_node.value.attr)
+    return mutated
+
+
+def _method_writes(name: str, tree: ast.AST) -> Optional[str]:
+    containers = _init_containers(tree)
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if node.name == "__init__":
+            continue
+
+        written = _self_writes(node)
+        if written:
+            return f"{name}.{node.name} assigns self.{written[0]}"
+
+        mutated = _self_mutations(node, containers)
+        if mutated:
+            return f"{name}.{node.name} mutates self.{mutated[0]}"
+    return None
+
+
+def _stateful_type(cls: Type) -> Optional[str]:
+    for klass in cls.__mro__:
+        if klass is object:
+            continue
+
+        try:
+            tree = ast.parse(textwrap.dedent(inspect.getsource(klass)))
+        except (OSError, TypeError, SyntaxError):
+            return f"source of {klass.__name__} unavailable"
+
+        reason = _method_writes(klass.__name__, tree)
+        if reason:
+            return reason
+    return None
+
+
+def _stateful_path(path: str) -> Optional[str]:
+    # Reads the source from disk so lazily registered classes stay unimported
+    found = find_class(path)
+    if found is None:
+        # Frozen/compiled modules (e.g. abc) — fine if already imported
+        module_name = path.partition(":")[0]
+        if module_name in sys.modules:
+            return _stateful_type(import_class(path))
+        return f"source of {path} unavailable"
+
+    module_name, node = found
+    reason = _method_writes(node.name, node)
+    if reason:
+        return reason
+
+    for base in node.bases:
+        if not isinstance(base, ast.Name):
+            return f"{node.name} has a dynamic base class"
+        if base.id == "object":
+            continue
+
+        base_path = resolve_name(module_name, base.id)
+        if base_path is None:
+            return f"base {base.id} of {node.name} not found"
+        reason = stateful_reason(base_path)
+        if reason:
+            return reason
+    return None
+
+
+@lru_cache(maxsize=None)
+def stateful_reason(cls: ClassRef) -> Optional[str]:
+    """
+    Returns why instances of `cls` (a class or 'module:Class' path) may carry
+    per-request state, or None if the class only sets attributes in
+    `__init__` (and never changes the containers it created there) and is
+    safe to share. Classes whose source cannot be read
+    are treated as stateful.
+    """
+    if isinstance(cls, str):
+        return _stateful_path(cls)
+    return _stateful_type(cls)
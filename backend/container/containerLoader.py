@@ -0,0 +1,59 @@
+import ast
+import importlib
+import importlib.util
+from functools import lru_cache
+from typing import Optional, Type, Union
+
+ClassRef = Union[str, Type]
+
+
+@lru_cache(maxsize=None)
+def import_class(path: str) -> Type:
+    """Imports 'package.module:ClassName' on first use."""
+    module_name, _, class_name = path.partition(":")
+    if not class_name:
+        raise ValueError(f"Class path '{path}' must look like 'module:ClassName'")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def load_class(ref: ClassRef) -> Type:
+    return import_class(ref) if isinstance(ref, str) else ref
+
+
+@lru_cache(maxsize=None)
+def module_tree(module_name: str) -> Optional[ast.Module]:
+    """Parses a module's source without importing (executing) it."""
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+        return None
+    with open(spec.origin, encoding="utf-8") as f:
+        return ast.parse(f.read())
+
+
+def find_class(path: str) -> Optional[tuple[str, ast.ClassDef]]:
+    """Returns (module name, ClassDef) for 'module:ClassName' without importing."""
+    module_name, _, class_name = path.partition(":")
+    tree = module_tree(module_name)
+    if tree is None:
+        return None
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            return module_name, node
+    return None
+
+
+def resolve_name(module_name: str, name: str) -> Optional[str]:
+    """Maps a name used in `module_name` to 'origin.module:Name'."""
+    tree = module_tree(module_name)
+    if tree is None:
+        return None
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == name:
+            return f"{module_name}:{name}"
+        if isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            for alias in node.names:
+                if (alias.asname or alias.name) == name:
+                    return f"{node.module}:{alias.name}"
+    return None
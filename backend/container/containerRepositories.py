@@ -1,33 +1,32 @@
-from typing import Literal, Type, TypedDict
+from typing import Literal, TypedDict
 
-from repository.categoryRepository import CatagoryRepository
-from repository.restaurantRepository import RestaurantRepository
-from repository.userRepository import UserRepository
 from utilities.logger import logger
 
+from .containerLoader import load_class
+
 Lifetime = Literal["singleton", "transient", "scoped"]
 
 
 class RepositorySpec(TypedDict):
-    cls: Type
+    cls: str
 
 
 REPOSITORIES: dict[str, RepositorySpec] = {
     "UserRepository": {
-        "cls": UserRepository,
+        "cls": "repository.userRepository:UserRepository",
     },
     "CategoryRepository": {
-        "cls": CatagoryRepository,
+        "cls": "repository.categoryRepository:CatagoryRepository",
     },
     "RestaurantRepository": {
-        "cls": RestaurantRepository,
+        "cls": "repository.restaurantRepository:RestaurantRepository",
     },
 }
 
 
 def make_repository_factory(cls):
     async def factory(container, scope):
-        return cls()
+        return load_class(cls)()
 
     return factory
 
@@ -56,6 +55,7 @@ def register_repositories(
                 name,
                 make_repository_factory(spec["cls"]),
                 lifetime,
+                cls=spec["cls"],
             )
 
         logger.info("[Container] Repositories registered successfully")
@@ -1,97 +1,75 @@
-from typing import Literal, Type, TypedDict
-
-from service.authService import AuthService
-from service.basicTokenService import BasicTokenService
-from service.bookingService import BookingService
-from service.cacheService import CacheService
-from service.categoryService import CategoryService
-from service.comboService import ComboService
-from service.deliveryService import DeliveryService
-from service.discountService import DiscountService
-from service.drinkService import DrinkService
-from service.driverService import DriverService
-from service.emailService import EmailService
-from service.employeeService import EmployeeService
-from service.favouriteService import FavouriteService
-from service.fileService import FileService
-from service.foodService import FoodService
-from service.oauthService import OAuthService
-from service.orderService import OrderService
-from service.paymentService import PaymentService
-from service.reservationService import ReservationService
-from service.restaurantService import RestaurantService
-from service.reviewService import ReviewService
-from service.tokenService import TokenService
-from service.userService import UserService
-from service.webService import WebService
+from typing import Literal, TypedDict
+
 from utilities.logger import logger
 
+from .containerLoader import load_class
+
 Lifetime = Literal["singleton", "transient", "scoped"]
 
 
 class ServiceSpec(TypedDict):
-    cls: Type
+    cls: str
     deps: dict[str, str]
 
 
 SERVICES: dict[str, ServiceSpec] = {
     "CacheService": {
-        "cls": CacheService,
+        "cls": "service.cacheService:CacheService",
         "deps": {},
     },
     "FileService": {
-        "cls": FileService,
+        "cls": "service.fileService:FileService",
         "deps": {},
     },
     "BasicTokenService": {
-        "cls": BasicTokenService,
+        "cls": "service.basicTokenService:BasicTokenService",
         "deps": {},
     },
     "EmailService": {
-        "cls": EmailService,
+        "cls": "service.emailService:EmailService",
         "deps": {},
     },
     "OAuthService": {
-        "cls": OAuthService,
+        "cls": "service.oauthService:OAuthService",
         "deps": {},
     },
     "WebService": {
-        "cls": WebService,
+        "cls": "service.webService:WebService",
         "deps": {},
     },
     "TokenService": {
-        "cls": TokenService,
+        "cls": "service.tokenService:TokenService",
         "deps": {
             "cache_service": "CacheService",
         },
     },
     "PaymentService": {
-        "cls": PaymentService,
+        "cls": "service.paymentService:PaymentService",
         "deps": {
             "web_service": "WebService",
         },
     },
     "UserService": {
-        "cls": UserService,
+        "cls": "service.userService:UserService",
         "deps": {
             "user_repository": "UserRepository",
             "file_service": "FileService",
         },
     },
     "OrderService": {
-        "cls": OrderService,
+        "cls": "service.orderService:OrderService",
         "deps": {
             "payment_service": "PaymentService",
         },
     },
     "CategoryService": {
-        "cls": CategoryService,
+        "cls": "service.categoryService:CategoryService",
         "deps": {
             "cache_service": "CacheService",
         },
     },
     "RestaurantService": {
-        "cls": RestaurantService,
+        "cls": "service.restaurantService:RestaurantService",
         "deps": {
             "user_service": "UserService",
             "category_service": "CategoryService",
@@ -100,35 +78,35 @@ SERVICES: dict[str, ServiceSpec] = {
         },
     },
     "FoodService": {
-        "cls": FoodService,
+        "cls": "service.foodService:FoodService",
         "deps": {
             "restaurant_service": "RestaurantService",
             "cache_service": "CacheService",
         },
     },
     "DrinkService": {
-        "cls": DrinkService,
+        "cls": "service.drinkService:DrinkService",
         "deps": {
             "restaurant_service": "RestaurantService",
             "cache_service": "CacheService",
         },
     },
     "ReviewService": {
-        "cls": ReviewService,
+        "cls": "service.reviewService:ReviewService",
         "deps": {
             "restaurant_service": "RestaurantService",
             "cache_service": "CacheService",
         },
     },
     "ReservationService": {
-        "cls": ReservationService,
+        "cls": "service.reservationService:ReservationService",
         "deps": {
             "restaurant_service": "RestaurantService",
             "cache_service": "CacheService",
         },
     },
     "EmployeeService": {
-        "cls": EmployeeService,
+        "cls": "service.employeeService:EmployeeService",
         "deps": {
             "user_service": "UserService",
             "restaurant_service": "RestaurantService",
@@ -136,7 +114,7 @@ SERVICES: dict[str, ServiceSpec] = {
         },
     },
     "FavouriteService": {
-        "cls": FavouriteService,
+        "cls": "service.favouriteService:FavouriteService",
         "deps": {
             "user_service": "UserService",
             "restaurant_service": "RestaurantService",
@@ -144,20 +122,20 @@ SERVICES: dict[str, ServiceSpec] = {
         },
     },
     "DriverService": {
-        "cls": DriverService,
+        "cls": "service.driverService:DriverService",
         "deps": {
             "cache_service": "CacheService",
         },
     },
     "DeliveryService": {
-        "cls": DeliveryService,
+        "cls": "service.deliveryService:DeliveryService",
         "deps": {
             "user_service": "UserService",
             "cache_service": "CacheService",
         },
     },
     "BookingService": {
-        "cls": BookingService,
+        "cls": "service.bookingService:BookingService",
         "deps": {
             "user_service": "UserService",
             "reservation_service": "ReservationService",
@@ -166,7 +144,7 @@ SERVICES: dict[str, ServiceSpec] = {
         },
     },
     "ComboService": {
-        "cls": ComboService,
+        "cls": "service.comboService:ComboService",
         "deps": {
             "food_service": "FoodService",
             "drink_service": "DrinkService",
@@ -174,7 +152,7 @@ SERVICES: dict[str, ServiceSpec] = {
         },
     },
     "DiscountService": {
-        "cls": DiscountService,
+        "cls": "service.discountService:DiscountService",
         "deps": {
             "combo_service": "ComboService",
             "food_service": "FoodService",
@@ -183,7 +161,7 @@ SERVICES: dict[str, ServiceSpec] = {
         },
     },
     "AuthService": {
-        "cls": AuthService,
+        "cls": "service.authService:AuthService",
         "deps": {
             "user_repository": "UserRepository",
             "token_service": "TokenService",
@@ -201,7 +179,7 @@ def make_service_factory(cls, deps: dict[str, str]):
             arg: await container.resolve(service_name, scope)
             for arg, service_name in deps.items()
         }
-        return cls(**resolved)
+        return load_class(cls)(**resolved)
 
     return factory
 
@@ -232,6 +210,8 @@ def register_services(
                 name,
                 make_service_factory(spec["cls"], spec["deps"]),
                 lifetime,
+                cls=spec["cls"],
+                deps=spec["deps"],
             )
 
         logger.info("[Container] Services registered successfully")
@@ -0,0 +1,64 @@
+import asyncio
+
+from config.environmentConfig import settings
+from resources.mongo_client import db
+from resources.redis_client import redis_client
+from utilities.logger import logger
+
+from .container import Container
+
+
+# Singletons warmup resolves; bootstrap creates these and leaves the rest lazy
+WARMUP_SERVICES = ("CacheService", "CategoryService", "WebService")
+
+
+async def _prime_redis(connections: int) -> None:
+    # Concurrent pings force the pool to open that many sockets
+    await asyncio.gather(*(redis_client.ping() for _ in range(connections)))
+
+
+async def _prime_mongo(connections: int) -> None:
+    await asyncio.gather(*(db.command("ping") for _ in range(connections)))
+
+
+async def _preload_categories(container: Container) -> None:
+    category_service = await container.resolve("CategoryService")
+    await category_service.getCategoryPage()
+
+
+async def _prime_http(container: Container) -> None:
+    if not settings.paypal_client_id:
+        return
+    web_service = await container.resolve("WebService")
+    await web_service.warmup()
+
+
+async def _step(name: str, coro) -> None:
+    try:
+        await coro
+        logger.info(f"[Warmup] {name} done")
+    except Exception as e:
+        logger.warn(f"[Warmup] {name} failed — continuing: {e}")
+
+
+async def warmup(container: Container) -> None:
+    """
+    Best-effort warmup run before the server reports ready: opens pooled
+    connections and preloads hot cache keys. Never fails startup.
+    """
+    connections = settings.warmup_pool_connections
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(
+                _step("Redis pool", _prime_redis(connections)),
+                _step("MongoDB pool", _prime_mongo(connections)),
+                _step("HTTP pool", _prime_http(container)),
+                _step("Category cache", _preload_categories(container)),
+            ),
+            settings.warmup_timeout,
+        )
+    except asyncio.TimeoutError:
+        logger.warn(
+            f"[Warmup] Not finished after {settings.warmup_timeout:.0f}s — continuing"
+        )
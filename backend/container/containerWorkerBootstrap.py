@@ -1,32 +1,118 @@
 import asyncio
+import threading
+from typing import Any, Coroutine, Optional
+
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
 
-from container.container import Container
-from container.containerControllers import register_controllers
-from container.containerCore import init_connections
-from container.containerServices import register_services
 from utilities.logger import logger
 
+from .container import Container
+from .containerBootstrap import bootstrap_worker, shutdown_worker
+
+# One event loop per worker process, running in a background thread for the
+# life of the process. The container, Redis/Mongo pools and the httpx client
+# all belong to this loop, so tasks reuse them instead of reconnecting.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_container: Optional[Container] = None
+_lock = threading.Lock()
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+async def _bootstrap() -> Container:
+    # SystemExit would unwind the loop thread and leave the caller waiting
+    try:
+        return await bootstrap_worker()
+    except SystemExit as e:
+        raise RuntimeError("Container build failed") from e
+
 
-async def async_bootstrap_worker() -> Container:
+def start_worker() -> Container:
     """
-    Asynchronous bootstrap for Celery workers.
-    Builds the same IoC container used by FastAPI,
-    but without depending on FastAPI lifespan.
+    Starts the process event loop and bootstraps the IoC container on it.
+    Services are created (and imported) on first resolve by a task.
+    Safe to call repeatedly; only the first call does any work.
     """
-    try:
-        logger.info("[Worker] Bootstrapping IoC container...")
+    global _loop, _thread, _container
 
-        container = Container()
-        await init_connections()
-        register_services(container)
-        register_controllers(container)
+    with _lock:
+        if _container is not None:
+            return _container
+
+        logger.info("[Worker] Starting event loop...")
+        _loop = asyncio.new_event_loop()
+        _thread = threading.Thread(
+            target=_run_loop, args=(_loop,), name="worker-event-loop", daemon=True
+        )
+        _thread.start()
+
+        try:
+            _container = asyncio.run_coroutine_threadsafe(_bootstrap(), _loop).result()
+        except Exception as e:
+            logger.error(f"[Worker] Container bootstrap failed: {e}")
+            _loop.call_soon_threadsafe(_loop.stop)
+            _thread.join()
+            _loop.close()
+            _loop = _thread = None
+            raise
 
-        await container.build()
         logger.info("[Worker] IoC container initialized.")
-        return container
-    except Exception as e:
-        logger.error(f"[Worker] Container bootstrap failed: {e}")
+        return _container
+
+
+def stop_worker() -> None:
+    global _loop, _thread, _container
+
+    with _lock:
+        if _loop is None:
+            return
+
+        try:
+            if _container is not None:
+                asyncio.run_coroutine_threadsafe(
+                    shutdown_worker(_container), _loop
+                ).result()
+        except Exception as e:
+            logger.error(f"[Worker] Container shutdown failed: {e}")
+        finally:
+            _loop.call_soon_threadsafe(_loop.stop)
+            _thread.join()
+            _loop.close()
+            _loop = _thread = _container = None
+            logger.info("[Worker] Event loop stopped.")
+
+
+def get_container() -> Container:
+    return _container if _container is not None else start_worker()
+
+
+def run_async(coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+    """
+    Runs `coro` on the worker event loop and blocks the calling task thread
+    until it finishes. Concurrent task threads share the loop, so their I/O
+    overlaps.
+    """
+    get_container()
+    future = asyncio.run_coroutine_threadsafe(coro, _loop)
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
         raise
 
 
-container = asyncio.run(async_bootstrap_worker())
+# Prefork children get their own loop after the fork; solo/threads pools
+# start lazily on the first task instead.
+@worker_process_init.connect
+def _on_process_init(**_):
+    start_worker()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _on_process_shutdown(**_):
+    stop_worker()
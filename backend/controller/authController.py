@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 
@@ -10,9 +14,12 @@ from dtos.authDtos import (
     MicrosoftAuthRequest,
     SignupRequestDto,
 )
-from service.authService import AuthService
 from utilities.errorRaiser import AppHttpException, UnauthorizedException, raise_error
 from utilities.logger import logger
+from utilities.requestContext import get_request
+
+if TYPE_CHECKING:
+    from service.authService import AuthService
 
 
 class AuthController:
@@ -21,7 +28,10 @@ class AuthController:
         auth_service: instance of AuthService (which uses TokenService internally)
         """
         self.auth_service = authservice
-        self.request: Request | None = None
+
+    @property
+    def request(self) -> Request:
+        return get_request()
 
     async def login(self, request: LoginRequestDto):
         try:
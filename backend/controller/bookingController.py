@@ -1,4 +1,9 @@
-from service.bookingService import BookingService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from service.bookingService import BookingService
 
 
 class BookingController:
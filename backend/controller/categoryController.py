@@ -1,17 +1,22 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
 from bson import ObjectId
-from fastapi import Request
 from fastapi.responses import JSONResponse
 
 from dtos.categoryDtos import CreateCategoryRequest, UpdateCategoryRequest
-from service.categoryService import CategoryService
 from utilities.errorRaiser import BadRequestException, raise_error
 from utilities.logger import logger
+from utilities.pagination import stream_response
+
+if TYPE_CHECKING:
+    from service.categoryService import CategoryService
 
 
 class CategoryController:
     def __init__(self, categoryservice: CategoryService):
         self.category_service = categoryservice
-        self.request: Request | None = None
 
     async def createCategory(self, dto: CreateCategoryRequest):
         try:
@@ -62,15 +67,23 @@ class CategoryController:
         except Exception as e:
             raise_error(e)
 
-    async def getCategories(self):
+    async def getCategories(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        total: bool = False,
+        stream: Optional[str] = None,
+        fields: Optional[str] = None,
+    ):
         try:
-            cats = await self.category_service.getAllCategory()
-            return JSONResponse(
-                {
-                    "status": "success",
-                    "count": len(cats),
-                    "data": [c.model_dump(mode="json") for c in cats],
-                }
+            if stream:
+                return stream_response(
+                    self.category_service.streamCategories(fields), stream
+                )
+
+            page = await self.category_service.getCategoryPage(
+                limit, cursor, total, fields
             )
+            return JSONResponse(page.to_dict(lambda c: c.model_dump(mode="json")))
         except Exception as e:
             raise_error(e)
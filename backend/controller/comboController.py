@@ -1,4 +1,9 @@
-from service.comboService import ComboService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from service.comboService import ComboService
 
 
 class ComboControler:
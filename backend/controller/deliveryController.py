@@ -1,4 +1,9 @@
-from service.deliveryService import DeliveryService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from service.deliveryService import DeliveryService
 
 
 class DeliveryController:
@@ -1,4 +1,9 @@
-from service.discountService import DiscountService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from service.discountService import DiscountService
 
 
 class DiscountController:
@@ -1,4 +1,9 @@
-from service.drinkService import DrinkService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from service.drinkService import DrinkService
 
 
 class DrinkController:
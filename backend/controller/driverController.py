@@ -1,4 +1,9 @@
-from service.driverService import DriverService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from service.driverService import DriverService
 
 
 class DriverController:
@@ -1,4 +1,9 @@
-from service.employeeService import EmployeeService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from service.employeeService import EmployeeService
 
 
 class EmployeeController:
@@ -1,4 +1,9 @@
-from service.favouriteService import FavouriteService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from service.favouriteService import FavouriteService
 
 
 class FavouriteController:
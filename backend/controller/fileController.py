@@ -1,7 +1,13 @@
-from service.fileService import FileService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from utilities.errorRaiser import AppHttpException, raise_error
 from utilities.logger import logger
 
+if TYPE_CHECKING:
+    from service.fileService import FileService
+
 
 class FileController:
     def __init__(self, fileservice: FileService):
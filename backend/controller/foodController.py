@@ -1,4 +1,9 @@
-from service.foodService import FoodService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from service.foodService import FoodService
 
 
 class FoodController:
@@ -1,14 +1,18 @@
-from typing import List, Optional
+from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from typing import TYPE_CHECKING, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 
 from dtos.orderDtos import CancelOrderDto, CreateOrderDto
-from service.orderService import OrderService
-from service.paymentService import PaymentService
 from utilities.errorRaiser import raise_error
 from utilities.logger import logger
 
+if TYPE_CHECKING:
+    from service.orderService import OrderService
+    from service.paymentService import PaymentService
+
 
 class OrderController:
     def __init__(self, orderservice: OrderService):
@@ -16,7 +20,6 @@ class OrderController:
         order_service: instance of AuthService (which uses PaymentService internally)
         """
         self.order_service = orderservice
-        self.request: Request | None = None
 
     async def create_order(self, payload: CreateOrderDto):
         """
@@ -1,9 +1,15 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from fastapi import HTTPException
 
 from dtos.paymentDtos import PaymentCancelDto, PaymentCaptureDto, PaymentCreateDto
-from service.paymentService import PaymentService
 from utilities.logger import logger
 
+if TYPE_CHECKING:
+    from service.paymentService import PaymentService
+
 
 class PaymentController:
     """
@@ -1,4 +1,9 @@
-from service.reservationService import ReservationService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from service.reservationService import ReservationService
 
 
 class ReservationController:
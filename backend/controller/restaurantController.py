@@ -1,6 +1,37 @@
-from service.restaurantService import RestaurantService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from fastapi.responses import JSONResponse
+
+from utilities.errorRaiser import raise_error
+from utilities.pagination import stream_response
+
+if TYPE_CHECKING:
+    from service.restaurantService import RestaurantService
 
 
 class RestaurantController:
     def __init__(self, restaurantservice: RestaurantService):
         self.restaurant_service = restaurantservice
+
+    async def getRestaurants(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        total: bool = False,
+        stream: Optional[str] = None,
+        fields: Optional[str] = None,
+    ):
+        try:
+            if stream:
+                return stream_response(
+                    self.restaurant_service.streamRestaurants(fields), stream
+                )
+
+            page = await self.restaurant_service.getRestaurantPage(
+                limit, cursor, total, fields
+            )
+            return JSONResponse(page.to_dict(lambda r: r.model_dump(mode="json")))
+        except Exception as e:
+            raise_error(e)
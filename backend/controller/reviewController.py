@@ -1,4 +1,9 @@
-from service.reviewService import ReviewService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from service.reviewService import ReviewService
 
 
 class ReviewController:
@@ -1,21 +1,25 @@
+from __future__ import annotations
+
 import io
+from typing import TYPE_CHECKING
 
 import filetype
-from fastapi import File, HTTPException, Request, UploadFile
-from PIL import Image
+from fastapi import File, HTTPException, UploadFile
 
 from dtos.userDtos import UpdateUserDto
-from service.userService import UserService
 from utilities.errorRaiser import AppHttpException, raise_error
 from utilities.logger import logger
 
+if TYPE_CHECKING:
+    from service.userService import UserService
+
+
 MAX_FILE_SIZE = 10 * 1024 * 1024
 
 
 class UserController:
     def __init__(self, userservice: UserService):
         self.user_service = userservice
-        self.request: Request | None = None
 
     async def getUserByID(self, id: int):
         try:
@@ -75,6 +79,9 @@ class UserController:
                 raise HTTPException(400, "Only JPG and PNG files are allowed")
 
             try:
+                # Pillow is only needed here; keep it out of module import
+                from PIL import Image
+
                 Image.open(io.BytesIO(data)).verify()
             except Exception:
                 raise HTTPException(400, "Invalid or corrupted image")
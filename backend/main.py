@@ -2,15 +2,17 @@ import os
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from config.environmentConfig import settings
-from container.containerBootstrap import bootstrap
+from container.containerBootstrap import bootstrap, shutdown
+from middleware.authContextMiddleware import AuthContextMiddleware
 from middleware.errorHandlerMiddleware import setup_exception_handlers
 from middleware.httpLogger import HTTPLoggerMiddleware
 from middleware.rateLimiterMiddleware import RateLimiterMiddleware
+from middleware.requestScopeMiddleware import RequestScopeMiddleware
 from middleware.securityMiddleware import (
     RequestIDMiddleware,
     SecurityHeadersMiddleware,
@@ -34,11 +36,17 @@ async def lifespan(app: FastAPI):
         app.state.container = container
         port = int(settings.port)
         logger.info(f"Server starting at http://localhost:{port}")
-        yield
     except Exception as e:
         logger.error(f"[Server] Container startup failed: {e}", exc_info=True)
         raise
 
+    yield
+
+    limiter = getattr(app.state, "local_rate_limiter", None)
+    if limiter is not None:
+        await limiter.close()
+    await shutdown(app.state.container)
+
 
 app = FastAPI(title="EasyFood", lifespan=lifespan)
 
@@ -47,32 +55,11 @@ setup_cors(app)
 setup_exception_handlers(app)
 
 app.add_middleware(RateLimiterMiddleware)
+app.add_middleware(AuthContextMiddleware)
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(HTTPLoggerMiddleware)
 app.add_middleware(RequestIDMiddleware)
-
-
-@app.middleware("http")
-async def createRequestScope(request: Request, call_next):
-    container = request.app.state.container
-
-    async with container.create_scope() as scope:
-        request.state.scope = scope
-
-        try:
-            response = await call_next(request)
-        except Exception as e:
-            logger.error(f"[Scope] Error during request: {e}", exc_info=True)
-            raise
-
-        try:
-            logger.info(f"[Scope] Resolved services: {list(scope.keys())}")
-            for name, instance in scope.items():
-                logger.info(f"[Scope] {name}: {type(instance).__name__}")
-        except Exception as e:
-            logger.error(f"[Scope] Failed to inspect scope: {e}")
-
-        return response
+app.add_middleware(RequestScopeMiddleware)
 
 
 PUBLIC_DIR = os.path.join(os.path.dirname(__file__), "public")
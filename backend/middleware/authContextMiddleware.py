@@ -0,0 +1,68 @@
+from typing import Any, Mapping, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from utilities.logger import logger
+
+
+class AuthContext:
+    """
+    Result of verifying the request's bearer token, stored on
+    `request.state.auth`. `claims` is a read-only mapping, or None when
+    the token was rejected.
+    """
+
+    __slots__ = ("token", "claims")
+
+    def __init__(self, token: str, claims: Optional[Mapping[str, Any]]):
+        self.token = token
+        self.claims = claims
+
+    @property
+    def user_id(self) -> Optional[str]:
+        return self.claims.get("id") if self.claims else None
+
+
+def bearer_token(scope: Scope) -> Optional[str]:
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                return token
+            return None
+    return None
+
+
+class AuthContextMiddleware:
+    """
+    Verifies the bearer token once per request so the rate limiter and the
+    auth dependencies share the same claims. Never rejects a request itself.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._token_service = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = bearer_token(scope)
+        if token is not None:
+            scope.setdefault("state", {})["auth"] = await self._authenticate(
+                scope, token
+            )
+
+        await self.app(scope, receive, send)
+
+    async def _authenticate(self, scope: Scope, token: str) -> AuthContext:
+        try:
+            if self._token_service is None:
+                container = scope["app"].state.container
+                self._token_service = await container.resolve("BasicTokenService")
+
+            return AuthContext(token, self._token_service.decodeAccessToken(token))
+        except Exception as e:
+            logger.debug(f"[AuthContext] Token rejected: {e}")
+            return AuthContext(token, None)
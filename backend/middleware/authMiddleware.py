@@ -2,7 +2,7 @@ from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 
-from service.basicTokenService import BasicTokenService
+from middleware.authContextMiddleware import AuthContext
 from utilities.errorRaiser import ForbiddenException, UnauthorizedException, raise_error
 from utilities.logger import logger
 
@@ -19,7 +19,6 @@ async def getBasicTokenService(request: Request):
         scope = request.state.scope
 
         controller = await container.resolve("BasicTokenService", scope)
-        controller.request = request
 
         return controller
 
@@ -31,15 +30,23 @@ async def getBasicTokenService(request: Request):
 async def get_current_user(
     request: Request,
     token: str = Depends(require_auth_token),
-    token_service: BasicTokenService = Depends(getBasicTokenService),
 ):
     """
     Extract and validate the current user from the JWT access token.
-    Uses the TokenService resolved from IoC container.
+    Reuses the claims verified by AuthContextMiddleware, falling back to
+    the TokenService resolved from the IoC container.
     """
-    try:
-        payload = token_service.decodeAccessToken(token)
-    except JWTError:
+    auth = getattr(request.state, "auth", None)
+    if auth is None or auth.token != token:
+        token_service = await getBasicTokenService(request)
+        try:
+            auth = AuthContext(token, token_service.decodeAccessToken(token))
+        except (JWTError, UnauthorizedException):
+            auth = AuthContext(token, None)
+        request.state.auth = auth
+
+    payload = auth.claims
+    if payload is None:
         raise UnauthorizedException("Invalid or expired access token")
 
     required = ("id", "email", "role")
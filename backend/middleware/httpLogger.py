@@ -3,8 +3,7 @@ import time
 from datetime import datetime
 
 from colorama import Fore, Style
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("http_logger")
 logger.setLevel(logging.INFO)
@@ -14,28 +13,39 @@ console_handler.setFormatter(console_formatter)
 logger.addHandler(console_handler)
 
 
-class HTTPLoggerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+class HTTPLoggerMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
         request_time = datetime.utcnow().isoformat()
 
-        response = await call_next(request)
-        duration = (time.time() - start_time) * 1000
+        async def send_and_log(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                duration = (time.time() - start_time) * 1000
+                status_code = message["status"]
+
+                method_color = f"{Fore.CYAN}{scope['method']}{Style.RESET_ALL}"
+                path_color = f"{Fore.YELLOW}{scope['path']}{Style.RESET_ALL}"
+                status_color = (
+                    Fore.GREEN
+                    if status_code < 300
+                    else Fore.YELLOW if status_code < 400 else Fore.RED
+                )
+                status_text = f"{status_color}{status_code}{Style.RESET_ALL}"
 
-        method_color = f"{Fore.CYAN}{request.method}{Style.RESET_ALL}"
-        path_color = f"{Fore.YELLOW}{request.url.path}{Style.RESET_ALL}"
-        status_color = (
-            Fore.GREEN
-            if response.status_code < 300
-            else Fore.YELLOW if response.status_code < 400 else Fore.RED
-        )
-        status_text = f"{status_color}{response.status_code}{Style.RESET_ALL}"
+                log_line = (
+                    f"[{request_time}] {method_color} {path_color} "
+                    f"-> {status_text} ({duration:.2f}ms)"
+                )
 
-        log_line = (
-            f"[{request_time}] {method_color} {path_color} "
-            f"-> {status_text} ({duration:.2f}ms)"
-        )
+                print(log_line)
 
-        print(log_line)
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_and_log)
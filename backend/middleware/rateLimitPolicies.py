@@ -0,0 +1,159 @@
+from typing import Iterable, Optional
+
+TOKEN_BUCKET = "token_bucket"
+GCRA = "gcra"
+SLIDING_WINDOW = "sliding_window"
+
+ALGORITHMS = (TOKEN_BUCKET, GCRA, SLIDING_WINDOW)
+
+
+class RateLimitPolicy:
+    """
+    `limit` requests per `window` seconds for paths under `pattern`.
+    Pattern segments written as `*` or `{name}` match any single segment,
+    and a pattern also covers everything below it.
+
+    `roles` / `users` override the limit for a role or user id; an override
+    of None exempts them from this policy.
+    """
+
+    __slots__ = (
+        "name",
+        "pattern",
+        "limit",
+        "window",
+        "algorithm",
+        "methods",
+        "roles",
+        "users",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        pattern: str,
+        limit: int,
+        window: float,
+        algorithm: str = TOKEN_BUCKET,
+        methods: Optional[Iterable[str]] = None,
+        roles: Optional[dict[str, Optional[int]]] = None,
+        users: Optional[dict[str, Optional[int]]] = None,
+    ):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm '{algorithm}'")
+        if limit <= 0 or window <= 0:
+            raise ValueError(
+                f"Rate limit policy '{name}' needs a positive limit and window"
+            )
+
+        self.name = name
+        self.pattern = pattern
+        self.limit = limit
+        self.window = window
+        self.algorithm = algorithm
+        self.methods = frozenset(m.upper() for m in methods) if methods else None
+        self.roles = roles or {}
+        self.users = users or {}
+
+    def applies_to(self, method: str) -> bool:
+        return self.methods is None or method in self.methods
+
+    def limit_for(
+        self, role: Optional[str] = None, user_id: Optional[str] = None
+    ) -> Optional[int]:
+        if user_id is not None and user_id in self.users:
+            return self.users[user_id]
+        if role is not None and role in self.roles:
+            return self.roles[role]
+        return self.limit
+
+
+class _Node:
+    __slots__ = ("children", "wildcard", "policies")
+
+    def __init__(self):
+        self.children: dict[str, "_Node"] = {}
+        self.wildcard: Optional["_Node"] = None
+        self.policies: list[RateLimitPolicy] = []
+
+    def select(self, method: str) -> Optional[RateLimitPolicy]:
+        for policy in self.policies:
+            if policy.applies_to(method):
+                return policy
+        return None
+
+
+def _segments(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+class PolicyTrie:
+    """
+    Path-segment trie over policy patterns, built once at startup.
+    The deepest matching pattern wins; literal segments beat wildcards.
+    """
+
+    def __init__(self, policies: Iterable[RateLimitPolicy]):
+        self._root = _Node()
+        for policy in policies:
+            self.add(policy)
+
+    def add(self, policy: RateLimitPolicy) -> None:
+        node = self._root
+        for segment in _segments(policy.pattern):
+            if segment == "*" or (segment.startswith("{") and segment.endswith("}")):
+                if node.wildcard is None:
+                    node.wildcard = _Node()
+                node = node.wildcard
+            else:
+                node = node.children.setdefault(segment, _Node())
+
+        # Method-specific policies are checked before catch-alls
+        node.policies.append(policy)
+        node.policies.sort(key=lambda p: p.methods is None)
+
+    def match(self, method: str, path: str) -> Optional[RateLimitPolicy]:
+        found = self._match(self._root, _segments(path), 0, method.upper())
+        return found[1] if found else None
+
+    def _match(
+        self, node: _Node, segments: list[str], depth: int, method: str
+    ) -> Optional[tuple[int, RateLimitPolicy]]:
+        policy = node.select(method)
+        best = (depth, policy) if policy is not None else None
+
+        if depth < len(segments):
+            for child in (node.children.get(segments[depth]), node.wildcard):
+                if child is None:
+                    continue
+                candidate = self._match(child, segments, depth + 1, method)
+                if candidate is not None and (best is None or candidate[0] > best[0]):
+                    best = candidate
+
+        return best
+
+
+DEFAULT_POLICIES = [
+    RateLimitPolicy("general", "/", 100, 60, roles={"admin": 1000}),
+    RateLimitPolicy("auth", "/api/auth", 5, 60),
+    # bcrypt on every attempt — smoothed over a long window
+    RateLimitPolicy(
+        "login", "/api/auth/login", 10, 900, SLIDING_WINDOW, methods=["POST"]
+    ),
+    RateLimitPolicy(
+        "signup", "/api/auth/signup", 5, 900, SLIDING_WINDOW, methods=["POST"]
+    ),
+    RateLimitPolicy(
+        "password",
+        "/api/auth/change-password",
+        5,
+        900,
+        SLIDING_WINDOW,
+        methods=["POST"],
+    ),
+    # Image processing per upload — evenly spaced, small burst
+    RateLimitPolicy("upload", "/api/users/avatar", 5, 60, GCRA, methods=["POST"]),
+    # Cached catalogue reads are cheap
+    RateLimitPolicy("catalogue", "/api/categories", 300, 60, methods=["GET"]),
+    RateLimitPolicy("restaurants", "/api/restaurants", 300, 60, methods=["GET"]),
+]
@@ -1,115 +1,466 @@
+import asyncio
 import time
 from typing import Optional, Tuple
 
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from jose import JWTError
-from starlette.middleware.base import BaseHTTPMiddleware
-
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from config.environmentConfig import settings
+from middleware.rateLimitPolicies import (
+    DEFAULT_POLICIES,
+    GCRA,
+    TOKEN_BUCKET,
+    PolicyTrie,
+    RateLimitPolicy,
+)
 from service.cacheService import CacheService
 from utilities.logger import logger
 
 
+# Refills and consumes a token bucket stored as a hash {t: tokens, ts: time}.
+# Uses the Redis server clock so every API instance shares one timeline.
+# With ARGV[5] == '0' the cost is recorded even if it overdraws the bucket
+# (used to sync consumption already admitted by a local pre-limiter).
+# Returns {allowed, retry_after, tokens}; floats are returned as strings
+# because Lua numbers are truncated to integers in replies.
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local ttl = tonumber(ARGV[4])
+local strict = ARGV[5] ~= '0'
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 't', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 1
+if tokens < cost then
+    if strict then
+        return {0, tostring((cost - tokens) / rate), tostring(tokens)}
+    end
+    allowed = 0
+end
+
+tokens = math.max(0, tokens - cost)
+redis.call('HSET', KEYS[1], 't', string.format('%.6f', tokens), 'ts', string.format('%.6f', now))
+redis.call('EXPIRE', KEYS[1], ttl)
+return {allowed, '0', tostring(tokens)}
+"""
+
+
+# Generic cell rate algorithm: stores only the theoretical arrival time (TAT).
+# ARGV: emission interval (window / limit), burst (limit), ttl.
+GCRA_LUA = """
+local period = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+tat = math.max(tat, now)
+
+local allow_at = tat - (burst - 1) * period
+if now < allow_at then
+    return {0, tostring(allow_at - now)}
+end
+
+redis.call('SET', KEYS[1], string.format('%.6f', tat + period), 'EX', ttl)
+return {1, '0'}
+"""
+
+# Sliding-window counter: the previous fixed window's count is weighted by
+# how much of it still overlaps the sliding window. Hash {w, c, p}.
+# ARGV: limit, window, ttl.
+SLIDING_WINDOW_LUA = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local current = math.floor(now / window)
+
+local state = redis.call('HMGET', KEYS[1], 'w', 'c', 'p')
+local w = tonumber(state[1])
+local count = tonumber(state[2]) or 0
+local previous = tonumber(state[3]) or 0
+if w == nil or w < current - 1 then
+    count = 0
+    previous = 0
+elseif w == current - 1 then
+    previous = count
+    count = 0
+end
+
+local elapsed = now - current * window
+local weight = 1 - elapsed / window
+if previous * weight + count + 1 > limit then
+    local retry = window - elapsed
+    if previous > 0 and count + 1 <= limit then
+        retry = math.min(retry, (previous * weight + count + 1 - limit) * window / previous)
+    end
+    return {0, tostring(retry)}
+end
+
+redis.call('HSET', KEYS[1], 'w', string.format('%d', current), 'c', count + 1, 'p', previous)
+redis.call('EXPIRE', KEYS[1], ttl)
+return {1, '0'}
+"""
+
+
+# Older releases kept JSON strings under "ratelimit:"; the scripts would hit
+# WRONGTYPE on those and fail open until they expired. Keys also carry the
+# algorithm, so switching a policy's algorithm never reads the other layout.
+KEY_PREFIX = "ratelimit:v2:"
+
+
 class RateLimitStore:
     """
     Storage abstraction for rate limiting.
-    Fail-open by design.
+    Each decision is a single atomic script call, so the limit is exact
+    across API instances. Fail-open by design.
     """
 
     def __init__(self, cache: CacheService):
         self.cache = cache
+        self._script = self._gcra = self._sliding = None
+        if cache.enabled:
+            self._script = cache.client.register_script(TOKEN_BUCKET_LUA)
+            self._gcra = cache.client.register_script(GCRA_LUA)
+            self._sliding = cache.client.register_script(SLIDING_WINDOW_LUA)
+
+    @staticmethod
+    def _ttl(capacity: int, rate: float) -> int:
+        return max(1, int(2 * capacity / rate))
 
     async def consume_token(
         self,
         key: str,
         capacity: int,
         rate: float,
+        cost: int = 1,
     ) -> Tuple[bool, float]:
         """
         Returns (allowed, retry_after_seconds)
         """
-        now = time.time()
+        allowed, retry_after, _ = await self.take_token(key, capacity, rate, cost)
+        return allowed, retry_after
 
-        try:
-            bucket = await self.cache.get(key, as_json=True) or {}
-            tokens = float(bucket.get("tokens", capacity))
-            last_ts = float(bucket.get("ts", now))
-
-            elapsed = max(0.0, now - last_ts)
-            tokens = min(capacity, tokens + elapsed * rate)
+    async def take_token(
+        self,
+        key: str,
+        capacity: int,
+        rate: float,
+        cost: int = 1,
+    ) -> Tuple[bool, float, Optional[float]]:
+        """
+        Like consume_token, plus the tokens left in the shared bucket
+        (None when Redis could not be asked).
+        """
+        if self._script is None:
+            return True, 0.0, None
 
-            if tokens < 1:
-                retry_after = (1 - tokens) / rate
-                return False, retry_after
+        try:
+            allowed, retry_after, tokens = await self._script(
+                keys=[self.cache.key(key)],
+                args=[capacity, rate, cost, self._ttl(capacity, rate), 1],
+            )
+            return bool(allowed), float(retry_after), float(tokens)
 
-            tokens -= 1
+        except Exception as e:
+            logger.warn(f"[RateLimitStore] failure — fail open: {e}")
+            return True, 0.0, None
 
-            await self.cache.set(
-                key,
-                {"tokens": tokens, "ts": now},
-                expire=int(2 * capacity / rate),
-                as_json=True,
-            )
+    async def consume(
+        self, algorithm: str, key: str, limit: int, window: float
+    ) -> Tuple[bool, float]:
+        """
+        Applies one request to `key` under the given algorithm.
+        Returns (allowed, retry_after_seconds).
+        """
+        if algorithm == TOKEN_BUCKET:
+            return await self.consume_token(key, limit, limit / window)
 
+        if self._script is None:
             return True, 0.0
 
+        ttl = max(1, int(2 * window))
+        try:
+            if algorithm == GCRA:
+                allowed, retry_after = await self._gcra(
+                    keys=[self.cache.key(key)], args=[window / limit, limit, ttl]
+                )
+            else:
+                allowed, retry_after = await self._sliding(
+                    keys=[self.cache.key(key)], args=[limit, window, ttl]
+                )
+            return bool(allowed), float(retry_after)
+
         except Exception as e:
             logger.warn(f"[RateLimitStore] failure — fail open: {e}")
             return True, 0.0
 
+    async def record_consumed(
+        self, consumed: dict[str, tuple[int, float, int]]
+    ) -> dict[str, float]:
+        """
+        Records {key: (capacity, rate, count)} in one pipelined round trip.
+        Returns the tokens left in each shared bucket.
+        """
+        if self._script is None or not consumed:
+            return {}
+
+        pipe = self.cache.client.pipeline(transaction=False)
+        for key, (capacity, rate, count) in consumed.items():
+            await self._script(
+                keys=[self.cache.key(key)],
+                args=[capacity, rate, count, self._ttl(capacity, rate), 0],
+                client=pipe,
+            )
+
+        results = await pipe.execute()
+        return {
+            key: float(tokens) for key, (_, _, tokens) in zip(consumed.keys(), results)
+        }
+
+
+class _LocalBucket:
+    __slots__ = ("capacity", "rate", "tokens", "ts", "pending")
+
+    def __init__(self, capacity: int, rate: float, tokens: float, now: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = tokens
+        self.ts = now
+        self.pending = 0
+
+
+class LocalRateLimiter:
+    """
+    Per-process pre-limiter in front of RateLimitStore.
+    Each local bucket mirrors the shared one: it is seeded from, and after
+    every sync reset to, the tokens left in Redis, and refills at the same
+    rate. Requests are decided in memory until `error_budget * capacity`
+    of them are waiting to be flushed; past that, or for a key not seen
+    yet, the caller asks Redis (`consume_shared`). Consumed counts are
+    flushed every `sync_interval` seconds.
+
+    A client can overshoot the shared limit by at most one local budget
+    (plus refill) per process per sync window.
+    """
 
-class RateLimiterMiddleware(BaseHTTPMiddleware):
     def __init__(
         self,
-        app,
-        general_capacity: int = 100,
-        general_refill_window: int = 60,
-        auth_capacity: int = 5,
-        auth_refill_window: int = 60,
+        store: RateLimitStore,
+        sync_interval: float = 0.1,
+        error_budget: float = 0.1,
+    ):
+        self.store = store
+        self.sync_interval = sync_interval
+        self.error_budget = error_budget
+        self._buckets: dict[str, _LocalBucket] = {}
+        self._sync_task: Optional[asyncio.Task] = None
+
+    def _budget(self, capacity: int) -> float:
+        return max(1.0, capacity * self.error_budget)
+
+    def consume(
+        self, key: str, capacity: int, rate: float
+    ) -> Optional[Tuple[bool, float]]:
+        """
+        Returns (allowed, retry_after_seconds) without touching Redis, or
+        None when the decision needs the shared bucket.
+        """
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._sync_loop())
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return None
+
+        now = time.monotonic()
+        bucket.tokens = min(capacity, bucket.tokens + (now - bucket.ts) * rate)
+        bucket.ts = now
+
+        if bucket.tokens < 1:
+            return False, (1 - bucket.tokens) / rate
+        if bucket.pending >= self._budget(capacity):
+            return None
+
+        bucket.tokens -= 1
+        bucket.pending += 1
+        return True, 0.0
+
+    async def consume_shared(
+        self, key: str, capacity: int, rate: float
+    ) -> Tuple[bool, float]:
+        """Decides against Redis and refreshes the local bucket from the reply."""
+        allowed, retry_after, tokens = await self.store.take_token(key, capacity, rate)
+        if tokens is None:
+            return allowed, retry_after
+
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._buckets[key] = _LocalBucket(capacity, rate, tokens, now)
+        else:
+            bucket.tokens = min(capacity, tokens) - bucket.pending
+            bucket.ts = now
+        return allowed, retry_after
+
+    async def sync(self) -> None:
+        now = time.monotonic()
+        consumed: dict[str, tuple[int, float, int]] = {}
+
+        for key, bucket in list(self._buckets.items()):
+            if bucket.pending:
+                consumed[key] = (bucket.capacity, bucket.rate, bucket.pending)
+                bucket.pending = 0
+            elif now - bucket.ts > bucket.capacity / bucket.rate:
+                # Fully refilled and idle — reseeded from Redis on demand
+                del self._buckets[key]
+
+        if not consumed:
+            return
+
+        remaining = await self.store.record_consumed(consumed)
+        synced = time.monotonic()
+        for key, tokens in remaining.items():
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                # Requests admitted while the sync was in flight stay counted
+                bucket.tokens = min(bucket.capacity, tokens) - bucket.pending
+                bucket.ts = synced
+
+    async def _sync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.sync()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warn(f"[LocalRateLimiter] sync failed — fail open: {e}")
+
+    async def close(self) -> None:
+        """Stops the sync loop and flushes what is still pending to Redis."""
+        if self._sync_task is None:
+            return
+
+        self._sync_task.cancel()
+        try:
+            await self._sync_task
+        except asyncio.CancelledError:
+            pass
+        self._sync_task = None
+
+        try:
+            await self.sync()
+        except Exception as e:
+            logger.warn(f"[LocalRateLimiter] final sync failed — dropping counts: {e}")
+
+
+class RateLimiterMiddleware:
+    """
+    Applies the most specific matching RateLimitPolicy to each request,
+    keyed by user id when authenticated and client IP otherwise.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        policies: Optional[list[RateLimitPolicy]] = None,
         excluded_paths: list[str] | None = None,
+        local_enabled: bool = settings.ratelimit_local_enabled,
     ):
-        super().__init__(app)
-        self.excluded_paths = excluded_paths or []
+        self.app = app
+        self.excluded_paths = tuple(excluded_paths or ())
+        self.policies = PolicyTrie(DEFAULT_POLICIES if policies is None else policies)
+
+        self.local_enabled = local_enabled
 
-        self.general_capacity = general_capacity
-        self.auth_capacity = auth_capacity
+        self._store: Optional[RateLimitStore] = None
+        self._local: Optional[LocalRateLimiter] = None
 
-        self.general_rate = general_capacity / general_refill_window
-        self.auth_rate = auth_capacity / auth_refill_window
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
+        request = Request(scope)
         path = request.url.path
 
-        if any(path.startswith(p) for p in self.excluded_paths):
-            return await call_next(request)
+        if self.excluded_paths and path.startswith(self.excluded_paths):
+            await self.app(scope, receive, send)
+            return
+
+        policy = self.policies.match(request.method, path)
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
 
         # --------------------------------------------------
         # Resolve CacheService (fail-open)
         # --------------------------------------------------
         try:
-            container = request.app.state.container
-            cache = await container.resolve("CacheService")
-            store = RateLimitStore(cache)
+            if self._store is None:
+                container = request.app.state.container
+                cache = await container.resolve("CacheService")
+                self._store = RateLimitStore(cache)
+                if self.local_enabled:
+                    self._local = LocalRateLimiter(
+                        self._store,
+                        sync_interval=settings.ratelimit_sync_interval_ms / 1000,
+                        error_budget=settings.ratelimit_local_error_budget,
+                    )
+                    # Lifespan shutdown closes it before the pools go away
+                    request.app.state.local_rate_limiter = self._local
+            store = self._store
         except Exception as e:
             logger.warn(f"[RateLimiter] Cache unavailable — bypassing: {e}")
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # --------------------------------------------------
-        # Determine identity (user > ip)
+        # Determine identity (user > ip) and effective limit
         # --------------------------------------------------
-        identity = self._resolve_identity(request)
-
-        limiter_type, capacity, rate = self._determine_limiter(path)
-        key = f"ratelimit:{limiter_type}:{identity}"
-
-        allowed, retry_after = await store.consume_token(
-            key=key,
-            capacity=capacity,
-            rate=rate,
-        )
+        auth = getattr(request.state, "auth", None)
+        claims = auth.claims if auth is not None and auth.claims else {}
+
+        limit = policy.limit_for(claims.get("role"), claims.get("id"))
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        identity = self._resolve_identity(request, claims)
+        key = f"{KEY_PREFIX}{policy.algorithm}:{policy.name}:{identity}"
+
+        if self._local is not None and policy.algorithm == TOKEN_BUCKET:
+            rate = limit / policy.window
+            decision = self._local.consume(key, limit, rate)
+            if decision is None:
+                decision = await self._local.consume_shared(key, limit, rate)
+            allowed, retry_after = decision
+        else:
+            allowed, retry_after = await store.consume(
+                policy.algorithm, key, limit, policy.window
+            )
 
         if not allowed:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "detail": "Rate limit exceeded",
@@ -117,31 +468,15 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
                 },
                 headers={"Retry-After": str(int(retry_after))},
             )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
-
-    def _resolve_identity(self, request: Request) -> str:
-        auth = request.headers.get("authorization")
-
-        if auth and auth.startswith("Bearer "):
-            token = auth[7:]
-            try:
-                container = request.app.state.container
-                token_service = container.resolve_sync("BasicTokenService")
-                payload = token_service.decodeAccessToken(token)
-
-                user_id = payload["id"]
-                if user_id:
-                    return f"user:{user_id}"
+        await self.app(scope, receive, send)
 
-            except Exception:
-                pass
+    def _resolve_identity(self, request: Request, claims: dict) -> str:
+        user_id = claims.get("id")
+        if user_id:
+            return f"user:{user_id}"
 
         ip = request.client.host if request.client else "unknown"
         return f"ip:{ip}"
-
-    def _determine_limiter(self, path: str):
-        if path.startswith("/api/auth/"):
-            return ("auth", self.auth_capacity, self.auth_rate)
-
-        return ("general", self.general_capacity, self.general_rate)
@@ -0,0 +1,64 @@
+import logging
+import random
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from config.environmentConfig import settings
+from utilities.logger import logger
+from utilities.requestContext import current_request
+
+
+class RequestScopeMiddleware:
+    """
+    Opens an IoC container scope per HTTP request and exposes it as
+    `request.state.scope` for the lifetime of the request. The request
+    itself is published through `current_request` for singletons.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        trace_sample_rate: float = settings.container_trace_sample_rate,
+    ):
+        self.app = app
+        # Only sample when the debug output would actually be emitted
+        self.trace_sample_rate = (
+            trace_sample_rate if logger.isEnabledFor(logging.DEBUG) else 0.0
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        container = scope["app"].state.container
+        request_token = current_request.set(Request(scope, receive))
+
+        try:
+            async with container.create_scope() as request_scope:
+                scope.setdefault("state", {})["scope"] = request_scope
+
+                try:
+                    await self.app(scope, receive, send)
+                except Exception as e:
+                    logger.error(f"[Scope] Error during request: {e}", exc_info=True)
+                    raise
+
+                if self.trace_sample_rate and random.random() < self.trace_sample_rate:
+                    self._trace(scope, request_scope)
+        finally:
+            current_request.reset(request_token)
+
+    @staticmethod
+    def _trace(scope: Scope, request_scope: dict) -> None:
+        try:
+            services = ", ".join(
+                f"{name}={type(instance).__name__}"
+                for name, instance in request_scope.items()
+            )
+            logger.debug(
+                f"[Scope] {scope['method']} {scope['path']} resolved: {services or '-'}"
+            )
+        except Exception as e:
+            logger.error(f"[Scope] Failed to inspect scope: {e}")
@@ -1,9 +1,14 @@
 import asyncio
 import random
-from typing import Any, Awaitable, Callable
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Optional, Sequence
 
+from beanie import PydanticObjectId
+from beanie.operators import In
+from pymongo import UpdateOne
 from pymongo.errors import (
     AutoReconnect,
+    BulkWriteError,
     DuplicateKeyError,
     NetworkTimeout,
     NotPrimaryError,
@@ -12,16 +17,77 @@ from pymongo.errors import (
     ServerSelectionTimeoutError,
 )
 
-from utilities.circuitBreaker import CircuitBreaker
+from utilities.circuitBreaker import CircuitBreaker, breakers
 from utilities.logger import logger
 
+DEFAULT_BATCH_SIZE = 500
+
+
+def _batches(items: Sequence, size: int) -> Iterable[tuple[int, Sequence]]:
+    for start in range(0, len(items), size):
+        yield start, items[start : start + size]
+
+
+class BulkResult:
+    """
+    Outcome of a bulk operation. `errors` holds one entry per failed item
+    with its index in the caller's input, so partial success is visible.
+    `write_concern_errors` are batches the server applied but could not
+    confirm at the requested write concern.
+    """
+
+    __slots__ = (
+        "inserted_ids",
+        "matched",
+        "modified",
+        "errors",
+        "write_concern_errors",
+    )
+
+    def __init__(self):
+        self.inserted_ids: list = []
+        self.matched = 0
+        self.modified = 0
+        self.errors: list[dict] = []
+        self.write_concern_errors: list[dict] = []
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors and not self.write_concern_errors
+
+    def add_errors(self, write_errors: Iterable[dict], offset: int) -> None:
+        for error in write_errors:
+            self.errors.append(
+                {
+                    "index": offset + error["index"],
+                    "code": error.get("code"),
+                    "message": error.get("errmsg"),
+                }
+            )
+
+    def add_write_concern_errors(self, errors: Iterable[dict]) -> None:
+        for error in errors:
+            self.write_concern_errors.append(
+                {"code": error.get("code"), "message": error.get("errmsg")}
+            )
+
+    def to_dict(self) -> dict:
+        return {
+            "inserted": len(self.inserted_ids),
+            "matched": self.matched,
+            "modified": self.modified,
+            "errors": self.errors,
+            "write_concern_errors": self.write_concern_errors,
+        }
+
 
 class BaseRepository:
     """
     MongoDB repository base with:
       - retry + exponential backoff
       - jitter
-      - circuit breaker
+      - circuit breakers per operation kind ("read" / "write"), shared
+        by every repository in the process
       - clear retry semantics
     """
 
@@ -38,7 +104,10 @@ class BaseRepository:
         self.base_delay = base_delay
         self.backoff_factor = backoff_factor
         self.max_delay = max_delay
-        self.breaker = circuit_breaker or CircuitBreaker()
+        self.breakers = {
+            kind: circuit_breaker or breakers.get(f"mongo.{kind}")
+            for kind in ("read", "write")
+        }
 
     def is_transient(self, e: Exception) -> bool:
         if isinstance(
@@ -74,9 +143,11 @@ class BaseRepository:
         func: Callable[[], Awaitable[Any]],
         *,
         retries: int | None = None,
+        kind: str = "read",
     ) -> Any:
-        if not self.breaker.allow():
-            raise RuntimeError("MongoDB circuit breaker OPEN — fast failing")
+        breaker = self.breakers[kind]
+        if not breaker.allow():
+            raise RuntimeError(f"MongoDB {kind} circuit breaker OPEN — fast failing")
 
         attempts = retries if retries is not None else self.retries
         attempt = 0
@@ -84,11 +155,13 @@ class BaseRepository:
         while True:
             try:
                 result = await func()
-                self.breaker.record_success()
+                breaker.record_success()
                 return result
 
             except Exception as e:
                 if self.is_non_retriable(e):
+                    # Mongo answered; the request itself was wrong
+                    breaker.record_success()
                     logger.debug(
                         "[Repository] Non-retriable Mongo error",
                         exc_info=True,
@@ -96,7 +169,7 @@ class BaseRepository:
                     raise
 
                 if not self.is_transient(e) or attempt >= attempts:
-                    self.breaker.record_failure()
+                    breaker.record_failure()
                     logger.error(
                         "[Repository] Mongo operation failed",
                         exc_info=True,
@@ -118,3 +191,146 @@ class BaseRepository:
 
                 await asyncio.sleep(delay)
                 attempt += 1
+
+    async def findManyByIds(
+        self,
+        model,
+        ids: Iterable[Any],
+        *,
+        projection=None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list:
+        """Documents for `ids` in the order given; missing ids are skipped."""
+        unique = list(dict.fromkeys(ids))
+        found: dict = {}
+
+        for _, batch in _batches(unique, batch_size):
+            docs = await self.executeAsync(
+                lambda batch=batch: model.find(
+                    In(model.id, batch), projection_model=projection
+                ).to_list()
+            )
+            found.update((doc.id, doc) for doc in docs)
+
+        return [found[i] for i in unique if i in found]
+
+    async def insertManyDocuments(
+        self,
+        model,
+        documents: Sequence,
+        *,
+        ordered: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> BulkResult:
+        """
+        Inserts in batches of `batch_size`. Ordered mode stops at the first
+        failing item; unordered mode inserts everything it can and reports
+        the rest. Ids are assigned up front so a retried batch cannot insert
+        a document twice.
+        """
+        for document in documents:
+            if document.id is None:
+                document.id = PydanticObjectId()
+
+        collection = model.get_pymongo_collection()
+        result = BulkResult()
+
+        for start, batch in _batches(documents, batch_size):
+            attempts = 0
+
+            async def op(batch=batch):
+                nonlocal attempts
+                attempts += 1
+
+                pending = list(enumerate(batch))
+                if attempts > 1:
+                    # A lost acknowledgement can hide writes that went through
+                    existing = set(
+                        await collection.distinct(
+                            "_id", {"_id": {"$in": [doc.id for doc in batch]}}
+                        )
+                    )
+                    pending = [(i, doc) for i, doc in pending if doc.id not in existing]
+
+                try:
+                    if pending:
+                        await model.insert_many(
+                            [doc for _, doc in pending], ordered=ordered
+                        )
+                    return [doc.id for doc in batch], [], []
+                except BulkWriteError as e:
+                    errors = [
+                        {**error, "index": pending[error["index"]][0]}
+                        for error in e.details.get("writeErrors", [])
+                    ]
+                    failed = {error["index"] for error in errors}
+                    if ordered and failed:
+                        # The server stops at the first failure
+                        first = min(failed)
+                        inserted = [doc.id for doc in batch[:first]]
+                    else:
+                        inserted = [
+                            doc.id for i, doc in enumerate(batch) if i not in failed
+                        ]
+                    return inserted, errors, e.details.get("writeConcernErrors", [])
+
+            inserted, errors, concern = await self.executeAsync(op, kind="write")
+            result.inserted_ids.extend(inserted)
+            result.add_errors(errors, start)
+            result.add_write_concern_errors(concern)
+
+            if ordered and errors:
+                break
+
+        return result
+
+    async def bulkUpdateDocuments(
+        self,
+        model,
+        updates: Mapping[Any, dict] | Sequence[tuple[Any, dict]],
+        *,
+        ordered: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        stamp_field: Optional[str] = "updated_at",
+    ) -> BulkResult:
+        """`$set` each (id, fields) pair through bulk_write; safe to retry."""
+        pairs = list(updates.items() if isinstance(updates, Mapping) else updates)
+        collection = model.get_pymongo_collection()
+        now = datetime.utcnow()
+
+        requests = []
+        for doc_id, fields in pairs:
+            fields = dict(fields)
+            if stamp_field:
+                fields[stamp_field] = now
+            requests.append(UpdateOne({"_id": doc_id}, {"$set": fields}))
+
+        result = BulkResult()
+
+        for start, batch in _batches(requests, batch_size):
+
+            async def op(batch=batch):
+                try:
+                    outcome = await collection.bulk_write(batch, ordered=ordered)
+                    return outcome.matched_count, outcome.modified_count, [], []
+                except BulkWriteError as e:
+                    details = e.details
+                    return (
+                        details.get("nMatched", 0),
+                        details.get("nModified", 0),
+                        details.get("writeErrors", []),
+                        details.get("writeConcernErrors", []),
+                    )
+
+            matched, modified, errors, concern = await self.executeAsync(
+                op, kind="write"
+            )
+            result.matched += matched
+            result.modified += modified
+            result.add_errors(errors, start)
+            result.add_write_concern_errors(concern)
+
+            if ordered and errors:
+                break
+
+        return result
@@ -1,12 +1,14 @@
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, Mapping, Optional, Sequence, Type
 
 from beanie import PydanticObjectId
 from pymongo.errors import DuplicateKeyError
 
 from templates.userTemplate import User
 from utilities.logger import logger
+from utilities.pagination import Page, fetch_page, page_size, stream_documents
+from utilities.projection import ProjectionModel
 
-from .baseRepository import BaseRepository
+from .baseRepository import DEFAULT_BATCH_SIZE, BaseRepository, BulkResult
 
 
 class UserRepository(BaseRepository):
@@ -47,7 +49,7 @@ class UserRepository(BaseRepository):
             return await user.insert()
 
         try:
-            return await self.executeAsync(op)
+            return await self.executeAsync(op, kind="write")
         except DuplicateKeyError:
             logger.warning("[UserRepository] Duplicate key while creating user")
             raise
@@ -70,7 +72,7 @@ class UserRepository(BaseRepository):
 
             return await User.get(user_id)
 
-        return await self.executeAsync(op)
+        return await self.executeAsync(op, kind="write")
 
     async def delete(self, user_id: PydanticObjectId) -> bool:
         async def op():
@@ -81,16 +83,99 @@ class UserRepository(BaseRepository):
             await user.delete()
             return True
 
-        return await self.executeAsync(op)
+        return await self.executeAsync(op, kind="write")
 
-    async def getById(self, user_id: PydanticObjectId) -> Optional[User]:
-        return await self.executeAsync(lambda: User.get(user_id))
+    async def getById(
+        self,
+        user_id: PydanticObjectId,
+        projection: Optional[Type[ProjectionModel]] = None,
+    ) -> Optional[User]:
+        if projection is None:
+            return await self.executeAsync(lambda: User.get(user_id))
+        return await self.executeAsync(
+            lambda: User.find_one(User.id == user_id, projection_model=projection)
+        )
+
+    async def getAll(
+        self,
+        *,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        projection: Optional[Type[ProjectionModel]] = None,
+    ) -> Page:
+        size = page_size(limit)
+        rows = await self.executeAsync(
+            lambda: fetch_page(User, limit=size, cursor=cursor, projection=projection)
+        )
+        total = await self.executeAsync(User.count) if include_total else None
+        return Page.from_rows(rows, size, total=total)
 
-    async def getAll(self) -> Iterable[User]:
-        return await self.executeAsync(lambda: User.find_all().to_list())
+    async def streamAll(
+        self, projection: Optional[Type[ProjectionModel]] = None
+    ) -> AsyncIterator[User]:
+        # Not retried: a cursor cannot be resumed once documents were yielded
+        breaker = self.breakers["read"]
+        if not breaker.allow():
+            raise RuntimeError("MongoDB read circuit breaker OPEN — fast failing")
+
+        try:
+            async for user in stream_documents(User, projection=projection):
+                yield user
+        except Exception as e:
+            if self.is_transient(e):
+                breaker.record_failure()
+            raise
+        breaker.record_success()
+
+    async def getManyByIds(
+        self,
+        user_ids: Iterable[PydanticObjectId],
+        projection: Optional[Type[ProjectionModel]] = None,
+    ) -> list[User]:
+        return await self.findManyByIds(User, user_ids, projection=projection)
 
-    async def getByEmail(self, email: str) -> Optional[User]:
-        return await self.executeAsync(lambda: User.find_one(User.email == email))
+    async def insertMany(
+        self,
+        users: Sequence[User | Dict[str, Any]],
+        *,
+        ordered: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> BulkResult:
+        documents = [u if isinstance(u, User) else User(**u) for u in users]
+        result = await self.insertManyDocuments(
+            User, documents, ordered=ordered, batch_size=batch_size
+        )
+        if result.errors:
+            logger.warning(
+                f"[UserRepository] insertMany: {len(result.errors)} of "
+                f"{len(documents)} users not inserted"
+            )
+        return result
+
+    async def bulkUpdate(
+        self,
+        updates: Mapping[PydanticObjectId, Dict[str, Any]],
+        *,
+        ordered: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> BulkResult:
+        result = await self.bulkUpdateDocuments(
+            User, updates, ordered=ordered, batch_size=batch_size
+        )
+        if result.errors:
+            logger.warning(
+                f"[UserRepository] bulkUpdate: {len(result.errors)} of "
+                f"{len(updates)} updates failed"
+            )
+        return result
+
+    async def getByEmail(
+        self, email: str, projection: Optional[Type[ProjectionModel]] = None
+    ) -> Optional[User]:
+        return await self.executeAsync(
+            lambda: User.find_one(User.email == email, projection_model=projection)
+        )
 
     async def getByGoogleId(self, google_id: str) -> Optional[User]:
         return await self.executeAsync(
@@ -22,4 +22,9 @@ async def init_mongo():
         raise
 
 
+def close_mongo():
+    _client.close()
+    logger.info("[MongoDB] Client closed")
+
+
 mongo_client = _client
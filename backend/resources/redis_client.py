@@ -6,15 +6,59 @@ from utilities.logger import logger
 REDIS_URL = settings.redis_url
 MODE = settings.mode
 
-redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=False)
+# A blocking pool makes bursts queue for up to `redis_pool_timeout` seconds
+# instead of failing with "Too many connections" or opening throwaway sockets.
+redis_pool = redis.BlockingConnectionPool.from_url(
+    REDIS_URL,
+    max_connections=settings.redis_max_connections,
+    timeout=settings.redis_pool_timeout,
+    socket_timeout=settings.redis_socket_timeout,
+    socket_connect_timeout=settings.redis_connect_timeout,
+    socket_keepalive=settings.redis_keepalive,
+    health_check_interval=settings.redis_health_check_interval,
+    retry_on_timeout=True,
+    decode_responses=False,
+)
 
+redis_client = redis.Redis(connection_pool=redis_pool)
 
-async def init_redis():
+
+def _pool_count(attr: str) -> int | None:
+    # Private redis-py state; its type has changed across releases
     try:
-        if MODE in {"ci", "testing", "test"}:
-            logger.info(f"Skipping Redis connection (mode={MODE})")
+        return len(getattr(redis_pool, attr))
+    except Exception:
+        return None
+
+
+def redis_pool_stats() -> dict:
+    in_use = _pool_count("_in_use_connections")
+    idle = _pool_count("_available_connections")
+    return {
+        "max_connections": getattr(redis_pool, "max_connections", None),
+        "in_use": in_use,
+        "idle": idle,
+        "created": None if in_use is None or idle is None else in_use + idle,
+    }
+
+
+async def init_redis():
+    if MODE in {"ci", "testing", "test"}:
+        logger.info(f"Skipping Redis connection (mode={MODE})")
+        return
 
+    try:
         await redis_client.ping()
+        logger.info(f"[Redis] Connected (max_connections={redis_pool.max_connections})")
     except Exception as e:
         logger.error(f"Redis connection failed: {e}")
         raise
+
+
+async def close_redis():
+    try:
+        await redis_client.aclose()
+        await redis_pool.disconnect()
+        logger.info("[Redis] Connection pool closed")
+    except Exception as e:
+        logger.error(f"[Redis] Closing connection pool failed: {e}")
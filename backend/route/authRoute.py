@@ -23,7 +23,6 @@ async def get_auth_controller(request: Request) -> AuthController:
         scope = request.state.scope
 
         controller = await container.resolve("AuthController", scope)
-        controller.request = request
 
         return controller
 
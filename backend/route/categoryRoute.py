@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, Request
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request
 
 from controller.categoryController import CategoryController
 from dtos.categoryDtos import CreateCategoryRequest, UpdateCategoryRequest
 from middleware.authMiddleware import get_current_user
 from utilities.errorRaiser import raise_error
 from utilities.logger import logger
+from utilities.pagination import MAX_PAGE_SIZE
 
 
 async def get_category_controller(request: Request) -> CategoryController:
@@ -17,7 +20,6 @@ async def get_category_controller(request: Request) -> CategoryController:
         scope = request.state.scope
 
         controller = await container.resolve("CategoryController", scope)
-        controller.request = request
 
         return controller
 
@@ -65,5 +67,19 @@ async def getCategory(
 
 
 @categoryRouter.get("/")
-async def getAllCategories(ctrl: CategoryController = Depends(get_category_controller)):
-    return await ctrl.getCategories()
+async def getAllCategories(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    total: bool = False,
+    stream: Optional[str] = Query(None, description="ndjson or json"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields"),
+    ctrl: CategoryController = Depends(get_category_controller),
+):
+    """
+    Categories ordered by name, one page at a time. Pass the returned
+    `next_cursor` back as `cursor` for the next page; `total=true` adds the
+    overall count and `fields=a,b` returns only those fields
+    (plus id and name).
+    `stream` returns every category as a streamed response.
+    """
+    return await ctrl.getCategories(limit, cursor, total, stream, fields)
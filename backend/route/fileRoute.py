@@ -17,7 +17,6 @@ async def get_file_controller(request: Request) -> FileController:
         scope = request.state.scope
 
         controller = await container.resolve("FileController", scope)
-        controller.request = request
 
         return controller
 
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends
+
+from middleware.authMiddleware import requireRole
+from resources.redis_client import redis_pool_stats
+from utilities.circuitBreaker import breakers
+from utilities.metrics import metrics
+
+metricsRouter = APIRouter(tags=["Metrics"])
+
+
+@metricsRouter.get("/", dependencies=[Depends(requireRole("admin"))])
+async def getMetrics():
+    """
+    Snapshot of the in-process metrics registry, Redis pool usage and
+    circuit breakers for this API process.
+    """
+    return {
+        "enabled": metrics.enabled,
+        "metrics": metrics.snapshot(),
+        "redis_pool": redis_pool_stats(),
+        "circuit_breakers": breakers.snapshot(),
+    }
@@ -13,7 +13,6 @@ async def get_order_controller(request: Request) -> OrderController:
 
     async with container.create_scope() as scope:
         controller = await container.resolve("OrderController", scope)
-        controller.request = request
         return controller
 
 
@@ -13,7 +13,6 @@ async def get_payment_controller(request: Request) -> PaymentController:
 
     async with container.create_scope() as scope:
         controller = await container.resolve("PaymentController", scope)
-        controller.request = request
         return controller
 
 
@@ -0,0 +1,47 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+
+from controller.restaurantController import RestaurantController
+from utilities.errorRaiser import raise_error
+from utilities.logger import logger
+from utilities.pagination import MAX_PAGE_SIZE
+
+
+async def get_restaurant_controller(request: Request) -> RestaurantController:
+    """
+    Resolve a scoped RestaurantController from the IoC container stored
+    in app.state, ensuring per-request lifecycle and dependency resolution.
+    """
+    try:
+        container = request.app.state.container
+        scope = request.state.scope
+
+        controller = await container.resolve("RestaurantController", scope)
+
+        return controller
+
+    except Exception as e:
+        logger.error(f"[RestaurantRoute] Resolving RestaurantController failed: {e}")
+        raise_error(e)
+
+
+restaurantRouter = APIRouter(tags=["Restaurant"])
+
+
+@restaurantRouter.get("/")
+async def getRestaurants(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    total: bool = False,
+    stream: Optional[str] = Query(None, description="ndjson or json"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields"),
+    ctrl: RestaurantController = Depends(get_restaurant_controller),
+):
+    """
+    Restaurants in creation order, one page at a time. Pass the returned
+    `next_cursor` back as `cursor` for the next page; `total=true` adds the
+    overall count and `fields=a,b` returns only those fields (plus id).
+    `stream` returns every restaurant as a streamed response.
+    """
+    return await ctrl.getRestaurants(limit, cursor, total, stream, fields)
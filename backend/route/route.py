@@ -3,8 +3,10 @@ from fastapi import APIRouter
 from route.authRoute import authRouter
 from route.categoryRoute import categoryRouter
 from route.fileRoute import fileRouter
+from route.metricsRoute import metricsRouter
 from route.orderRoute import orderRouter
 from route.paymentRoute import paymentRouter
+from route.restaurantRoute import restaurantRouter
 from route.userRoute import userRouter
 
 serverRouter = APIRouter()
@@ -14,3 +16,5 @@ serverRouter.include_router(fileRouter, prefix="/files")
 serverRouter.include_router(orderRouter, prefix="/orders")
 serverRouter.include_router(paymentRouter, prefix="/payment")
 serverRouter.include_router(categoryRouter, prefix="/categories")
+serverRouter.include_router(restaurantRouter, prefix="/restaurants")
+serverRouter.include_router(metricsRouter, prefix="/admin/metrics")
@@ -19,7 +19,6 @@ async def get_user_controller(request: Request) -> UserController:
         scope = request.state.scope
 
         controller = await container.resolve("UserController", scope)
-        controller.request = request
 
         return controller
 
@@ -5,6 +5,7 @@ from service.emailService import EmailService
 from service.oauthService import OAuthService
 from service.tokenService import TokenService
 from service.webService import WebService
+from templates.userTemplate import UserCredentials, UserIdentity
 from utilities.errorRaiser import (
     AppHttpException,
     BadRequestException,
@@ -41,7 +42,7 @@ class AuthService:
             if not is_valid_captcha:
                 raise UnauthorizedException("Invalid captcha")
 
-            user = await self.user_repository.getByEmail(email)
+            user = await self.user_repository.getByEmail(email, UserCredentials)
 
             hash_to_check = user.password if user and user.password else self.DUMMY_HASH
             password_ok = self.verifyPassword(password, hash_to_check)
@@ -65,7 +66,7 @@ class AuthService:
             if not is_valid_captcha:
                 raise UnauthorizedException("Invalid captcha")
 
-            existing_user = await self.user_repository.getByEmail(email)
+            existing_user = await self.user_repository.getByEmail(email, UserIdentity)
             if existing_user:
                 raise ConflictException(f"The email '{email}' is already registered.")
 
@@ -182,7 +183,7 @@ class AuthService:
                     "The server is not ready to handle the request"
                 )
 
-            user = await self.user_repository.getByEmail(email)
+            user = await self.user_repository.getByEmail(email, UserIdentity)
             if not user:
                 return
             if user.provider in ["google", "microsoft"]:
@@ -211,7 +212,7 @@ class AuthService:
             if not data:
                 raise BadRequestException("Invalid or expired token")
 
-            user = await self.user_repository.getByEmail(data["email"])
+            user = await self.user_repository.getByEmail(data["email"], UserIdentity)
             if not user:
                 raise NotFoundException("User not found")
 
@@ -1,13 +1,19 @@
+import hashlib
+import time
+from types import MappingProxyType
+from typing import Any, Mapping
+
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 
 from config.environmentConfig import settings
 from utilities.errorRaiser import ForbiddenException, UnauthorizedException
+from utilities.lruCache import LRUCache
 
 
 class BasicTokenService:
-    def __init__(self):
+    def __init__(self, verified_cache_size: int = settings.auth_token_cache_size):
         self.algorithm = settings.algorithm
 
         self.JWT_SECRET_ACCESS = settings.secret_key
@@ -16,12 +22,33 @@ class BasicTokenService:
 
         self.require_auth_token = OAuth2PasswordBearer(tokenUrl="token")
 
-    def decodeAccessToken(self, token: str) -> dict:
+        # sha256(token) -> read-only claims, kept until the token's own `exp`
+        self._verified = LRUCache(maxsize=verified_cache_size)
+
+    def decodeAccessToken(self, token: str) -> Mapping[str, Any]:
+        """
+        Returns the token's claims as a read-only mapping; the same object
+        is handed to every request carrying this token until it expires.
+        """
         if not token:
             raise UnauthorizedException("Missing access token")
+
+        digest = hashlib.sha256(token.encode()).digest()
+        claims = self._verified.get(digest)
+        if claims is not None:
+            return claims
+
         try:
-            return jwt.decode(
-                token, self.JWT_SECRET_ACCESS, algorithms=[self.algorithm]
+            claims = MappingProxyType(
+                jwt.decode(token, self.JWT_SECRET_ACCESS, algorithms=[self.algorithm])
             )
         except JWTError:
             raise UnauthorizedException("Invalid access token")
+
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            ttl = exp - time.time()
+            if ttl > 0:
+                self._verified.set(digest, claims, ttl=ttl)
+
+        return claims
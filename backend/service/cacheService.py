@@ -1,21 +1,146 @@
+import asyncio
 import json
+import math
 import pickle
-from contextlib import asynccontextmanager
+import random
+import struct
+import time
+import uuid
+from contextlib import asynccontextmanager, suppress
 from datetime import timedelta
-from typing import Any, Awaitable, Callable, Optional, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import redis.asyncio as redis
 from beanie import Document
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
+from config.environmentConfig import settings
 from resources.redis_client import redis_client
+from utilities.cacheCodecs import (
+    CODECS,
+    CODECS_BY_TAG,
+    COMPRESSORS_BY_TAG,
+    get_codec,
+    get_compressor,
+    get_json_codec,
+)
 from utilities.logger import logger
+from utilities.lruCache import LRUCache
+from utilities.metrics import SIZE_BUCKETS, metrics
+
+# Stored values are framed as:
+#   magic | format version | codec tag | compression tag
+#   | expires_at | stale_at | delta | payload
+# Values without the magic byte are legacy plain JSON/pickle.
+_ENTRY_MAGIC = 0xCE
+_ENTRY_VERSION = 3
+_ENTRY_HEADER = struct.Struct("!BBBBddf")
+
+# Tag generation counters; bumping one orphans every key built from it
+_GEN_PREFIX = "gen:"
+
+# Reads the tag generations and the value they select in one round trip.
+# KEYS are the generation keys; ARGV[1] is the namespaced key prefix up to
+# the generations. The value key is computed here, so it cannot be declared
+# up front — fine on standalone Redis, not on Cluster.
+TAGGED_GET_LUA = """
+local gens = {}
+for i = 1, #KEYS do
+    gens[i] = tostring(tonumber(redis.call('GET', KEYS[i]) or '0'))
+end
+local suffix = table.concat(gens, '.')
+return {suffix, redis.call('GET', ARGV[1] .. suffix)}
+"""
+
+_REQUESTS = metrics.counter(
+    "cache_requests_total", "Cache operations by operation, key prefix and result"
+)
+_LATENCY = metrics.histogram(
+    "cache_latency_seconds", "Redis round-trip time by operation and key prefix"
+)
+_VALUE_BYTES = metrics.histogram(
+    "cache_value_bytes", "Cached value sizes by operation and key prefix", SIZE_BUCKETS
+)
+
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _prefix(key: str) -> str:
+    return key.split(":", 1)[0]
+
+
+class _NotFound:
+    """
+    Sentinel for a cached "does not exist" result. Falsy, so callers that
+    only test truthiness still treat it as a miss.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "NOT_FOUND"
+
+
+NOT_FOUND = _NotFound()
+
+# Codec tag reserved for negative entries; they carry no payload
+_NEGATIVE_TAG = 0
+
+
+@lru_cache(maxsize=None)
+def model_adapter(model: type, many: bool = False) -> TypeAdapter:
+    """Cached TypeAdapter for `model` or `list[model]`."""
+    return TypeAdapter(list[model] if many else model)
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    expires_at: float = 0.0
+    stale_at: float = 0.0
+    delta: float = 0.0
+
+    @property
+    def fresh_until(self) -> float:
+        return self.stale_at or self.expires_at
+
+    def is_stale(self) -> bool:
+        return bool(self.stale_at) and time.time() >= self.stale_at
 
 
 class CacheService:
     """
     Redis-backed cache service.
     FAIL-OPEN by design: cache failures never break requests.
+
+    Keys matching `local_prefixes` are also kept in an in-process LRU (L1)
+    in front of Redis. Writes and deletes on those keys are broadcast over
+    Redis pub/sub so every other API process drops its L1 copy.
+
+    Entries can be tagged (e.g. "restaurant", "restaurant:<id>", "menu").
+    The current generation of every tag, plus the schema version, is
+    embedded in the stored key, so `invalidate_tags` is one INCR per tag.
+
+    Lookups for missing records can be cached with `set_negative`; reads
+    of those keys return the `NOT_FOUND` sentinel instead of None.
+
+    `expire` is the hard TTL after which Redis drops a value. An optional
+    `stale_after` soft TTL marks it stale earlier: `getOrSet` keeps serving
+    a stale value and refreshes it once in the background.
     """
 
     def __init__(
@@ -24,15 +149,198 @@ class CacheService:
         namespace: str = "easyfood",
         default_expire: Optional[int] = None,
         enabled: bool = True,
+        local_enabled: bool = settings.cache_local_enabled,
+        local_maxsize: int = settings.cache_local_maxsize,
+        local_ttl: float = settings.cache_local_ttl,
+        local_prefixes: tuple[str, ...] = tuple(settings.cache_local_prefixes),
+        codec: str = settings.cache_codec,
+        compression: Optional[str] = settings.cache_compression,
+        compress_min_bytes: int = settings.cache_compress_min_bytes,
+        schema_version: str = settings.cache_schema_version,
+        negative_ttl: int = settings.cache_negative_ttl,
     ):
         self.client = client
         self.namespace = namespace
         self.default_expire = default_expire
         self.enabled = enabled and client is not None
 
+        self.codec = get_codec(codec)
+        self.json_codec = get_json_codec()
+        self.compressor = get_compressor(compression)
+        self.compress_min_bytes = compress_min_bytes
+        self.schema_version = schema_version
+        self.negative_ttl = negative_ttl
+
+        self.local = LRUCache(local_maxsize, local_ttl) if local_enabled else None
+        self.local_prefixes = tuple(local_prefixes) + (_GEN_PREFIX,)
+        self.instance_id = uuid.uuid4().hex
+        self.channel = f"{namespace}:cache:invalidate"
+        self._listener: Optional[asyncio.Task] = None
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self._tagged_get = (
+            client.register_script(TAGGED_GET_LUA) if client is not None else None
+        )
+
     def key(self, key: str) -> str:
         return f"{self.namespace}:{key}"
 
+    # --------------------------------------------------
+    # L1 (in-process) layer
+    # --------------------------------------------------
+    def _is_local(self, key: str) -> bool:
+        return self.local is not None and key.startswith(self.local_prefixes)
+
+    async def _read(self, key: str) -> Optional[bytes]:
+        observe = metrics.enabled
+
+        if self._is_local(key):
+            raw = self.local.get(key)
+            if raw is not None:
+                if observe:
+                    self._record("get", key, "local_hit")
+                return raw
+
+        started = time.perf_counter() if observe else 0.0
+        raw = await self.client.get(self.key(key))
+
+        if observe:
+            result = "miss" if raw is None else "hit"
+            self._record("get", key, result, started, raw and len(raw))
+        if raw is not None and self._is_local(key):
+            self.local.set(key, raw)
+        return raw
+
+    async def _read_many(self, keys: list[str]) -> dict[str, Optional[bytes]]:
+        found: dict[str, Optional[bytes]] = {}
+        remote: list[str] = []
+
+        for key in keys:
+            raw = self.local.get(key) if self._is_local(key) else None
+            if raw is not None:
+                found[key] = raw
+            else:
+                remote.append(key)
+
+        if remote:
+            observe = metrics.enabled
+            started = time.perf_counter() if observe else 0.0
+            values = await self.client.mget([self.key(k) for k in remote])
+
+            if observe:
+                _LATENCY.observe(
+                    time.perf_counter() - started, op="mget", prefix=_prefix(remote[0])
+                )
+            for key, raw in zip(remote, values):
+                found[key] = raw
+                if observe:
+                    self._record("mget", key, "miss" if raw is None else "hit")
+                if raw is not None and self._is_local(key):
+                    self.local.set(key, raw)
+
+        return {key: found.get(key) for key in keys}
+
+    # --------------------------------------------------
+    # Metrics
+    # --------------------------------------------------
+    def _record(
+        self,
+        op: str,
+        key: str,
+        result: str,
+        started: Optional[float] = None,
+        size: Optional[int] = None,
+    ) -> None:
+        prefix = _prefix(key)
+        _REQUESTS.inc(op=op, prefix=prefix, result=result)
+        if started is not None:
+            _LATENCY.observe(time.perf_counter() - started, op=op, prefix=prefix)
+        if size:
+            _VALUE_BYTES.observe(size, op=op, prefix=prefix)
+
+    def _record_error(self, op: str, key: str) -> None:
+        if metrics.enabled:
+            self._record(op, key, "error")
+
+    async def _drop_local(self, *keys: str) -> None:
+        for key in keys:
+            if self._is_local(key):
+                self.local.delete(key)
+        await self._publish_invalidation(*keys)
+
+    async def _publish_invalidation(self, *keys: str) -> None:
+        keys = [k for k in keys if self._is_local(k)]
+        if not keys:
+            return
+
+        try:
+            message = json.dumps({"origin": self.instance_id, "keys": keys})
+            await self.client.publish(self.channel, message)
+        except Exception as e:
+            logger.warn(f"[CacheService] invalidation publish failed: {e}")
+
+    def _on_invalidation(self, data: Any) -> None:
+        try:
+            message = json.loads(data)
+        except Exception:
+            self.local.clear()
+            return
+
+        if message.get("origin") == self.instance_id:
+            return
+
+        for key in message.get("keys", []):
+            self.local.delete(key)
+
+    async def _listen(self) -> None:
+        delay = 0.5
+        while True:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                # Anything cached before (re)subscribing may have missed messages
+                self.local.clear()
+                delay = 0.5
+
+                # Poll with a timeout below the pool's socket_timeout so an
+                # idle channel is not mistaken for a dead connection
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is not None:
+                        self._on_invalidation(message.get("data"))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warn(
+                    f"[CacheService] invalidation listener failed — "
+                    f"retrying in {delay:.1f}s: {e}"
+                )
+                self.local.clear()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+            finally:
+                with suppress(Exception):
+                    await pubsub.aclose()
+
+    async def start_listener(self) -> None:
+        if self.local is None or not self.enabled or self._listener is not None:
+            return
+
+        self._listener = asyncio.create_task(self._listen())
+        logger.info(f"[CacheService] L1 invalidation listener on '{self.channel}'")
+
+    async def stop_listener(self) -> None:
+        if self._listener is None:
+            return
+
+        self._listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._listener
+        self._listener = None
+
     def _encode(self, value: Any) -> Any:
         if isinstance(value, (Document, BaseModel)):
             return value.model_dump(mode="json")
@@ -42,61 +350,487 @@ class CacheService:
             return {k: self._encode(v) for k, v in value.items()}
         return value
 
+    def _codec_for(self, as_json: bool):
+        return self.codec if as_json else CODECS["pickle"]
+
     def serialize(self, value: Any, as_json: bool = True) -> bytes:
-        encoded = self._encode(value)
-        return json.dumps(encoded).encode("utf-8") if as_json else pickle.dumps(encoded)
+        return self._codec_for(as_json).dumps(self._encode(value))
 
     def deserialize(self, raw: Optional[bytes], as_json: bool = True) -> Any:
+        """Decodes legacy (unframed) values."""
         if raw is None:
             return None
         return json.loads(raw) if as_json else pickle.loads(raw)
 
-    async def get(self, key: str, as_json: bool = True) -> Any:
+    def _expire_seconds(self, expire: Optional[Union[int, timedelta]]) -> Optional[int]:
+        if isinstance(expire, timedelta):
+            expire = int(expire.total_seconds())
+        return expire or self.default_expire
+
+    def _frame(
+        self,
+        value: Any,
+        as_json: bool,
+        expires_at: float,
+        stale_at: float,
+        delta: float,
+        adapter: Optional[TypeAdapter] = None,
+    ) -> bytes:
+        if value is NOT_FOUND:
+            codec_tag, payload = _NEGATIVE_TAG, b""
+        elif adapter is not None:
+            codec_tag, payload = self.json_codec.tag, adapter.dump_json(value)
+        else:
+            codec_tag = self._codec_for(as_json).tag
+            payload = self.serialize(value, as_json)
+
+        compression = 0
+        if self.compressor is not None and len(payload) >= self.compress_min_bytes:
+            payload = self.compressor.compress(payload)
+            compression = self.compressor.tag
+
+        header = _ENTRY_HEADER.pack(
+            _ENTRY_MAGIC,
+            _ENTRY_VERSION,
+            codec_tag,
+            compression,
+            expires_at,
+            stale_at,
+            delta,
+        )
+        return header + payload
+
+    def _unframe(
+        self,
+        raw: bytes,
+        as_json: bool,
+        adapter: Optional[TypeAdapter] = None,
+    ) -> Optional[CacheEntry]:
+        """
+        Returns the decoded entry, or None for entries written in a format
+        this process cannot read, or pickled entries read with `as_json`
+        (treated as a miss).
+
+        With an `adapter`, JSON payloads are validated straight from bytes
+        into models, skipping the intermediate dict.
+        """
+        if raw[:1] != bytes((_ENTRY_MAGIC,)):
+            if adapter is not None and as_json:
+                return CacheEntry(adapter.validate_json(raw))
+            return CacheEntry(self.deserialize(raw, as_json))
+
+        _, version, codec_tag, compression, expires_at, stale_at, delta = (
+            _ENTRY_HEADER.unpack_from(raw)
+        )
+        if version == _ENTRY_VERSION and codec_tag == _NEGATIVE_TAG:
+            return CacheEntry(NOT_FOUND, expires_at, stale_at, delta)
+
+        codec = CODECS_BY_TAG.get(codec_tag)
+        if version != _ENTRY_VERSION or codec is None:
+            return None
+
+        # Only callers that asked for pickle may unpickle: anyone able to
+        # write to Redis could otherwise run code through a JSON read
+        if codec.name == "pickle" and as_json and self.codec is not codec:
+            logger.warn("[CacheService] pickle entry on a JSON read — treating as miss")
+            return None
+
+        payload = raw[_ENTRY_HEADER.size :]
+        if compression:
+            compressor = COMPRESSORS_BY_TAG.get(compression)
+            if compressor is None:
+                return None
+            payload = compressor.decompress(payload)
+
+        if adapter is None:
+            value = codec.loads(payload)
+        elif codec.is_json:
+            value = adapter.validate_json(payload)
+        else:
+            value = adapter.validate_python(codec.loads(payload))
+
+        return CacheEntry(value, expires_at, stale_at, delta)
+
+    def _pack(
+        self,
+        value: Any,
+        expire: Optional[Union[int, timedelta]],
+        as_json: bool,
+        delta: float = 0.0,
+        stale_after: Optional[Union[int, timedelta]] = None,
+        adapter: Optional[TypeAdapter] = None,
+    ) -> tuple[bytes, Optional[int]]:
+        now = time.time()
+        expire = self._expire_seconds(expire)
+        if isinstance(stale_after, timedelta):
+            stale_after = stale_after.total_seconds()
+
+        expires_at = now + expire if expire else 0.0
+        stale_at = now + stale_after if stale_after else 0.0
+        raw = self._frame(value, as_json, expires_at, stale_at, delta, adapter)
+        return raw, expire
+
+    async def _get_entry(
+        self,
+        key: str,
+        as_json: bool = True,
+        adapter: Optional[TypeAdapter] = None,
+    ) -> Optional[CacheEntry]:
         if not self.enabled:
             return None
 
         try:
-            raw = await self.client.get(self.key(key))
-            return self.deserialize(raw, as_json)
+            raw = await self._read(key)
+            return None if raw is None else self._unframe(raw, as_json, adapter)
         except Exception as e:
-            logger.warn(f"[CacheService] get failed — bypassing cache: {e}")
+            self._record_error("get", key)
+            logger.warn(f"[CacheService] get failed — bypassing cache: {e!r}")
             return None
 
-    async def set(
+    async def _get_tagged_entry(
+        self,
+        key: str,
+        tags: Optional[Sequence[str]],
+        as_json: bool = True,
+        adapter: Optional[TypeAdapter] = None,
+    ) -> tuple[Optional[str], Optional[CacheEntry]]:
+        """
+        Resolves the tagged key and reads its entry. Returns (None, None)
+        when the generations cannot be read (caller skips the cache).
+
+        The generations and the value come back from a single script call.
+        When L1 already holds every generation, only the value is read.
+        """
+        gen_keys = [self._gen_key(tag) for tag in sorted(set(tags or ()))]
+        if not gen_keys or (
+            self.local is not None
+            and all(self.local.get(g) is not None for g in gen_keys)
+        ):
+            key = await self._tagged(key, tags)
+            if key is None:
+                return None, None
+            return key, await self._get_entry(key, as_json, adapter)
+
+        if not self.enabled:
+            return None, None
+
+        base = f"{key}@{self.schema_version}:"
+        observe = metrics.enabled
+        started = time.perf_counter() if observe else 0.0
+
+        try:
+            suffix, raw = await self._tagged_get(
+                keys=[self.key(k) for k in gen_keys], args=[self.key(base)]
+            )
+        except Exception as e:
+            self._record_error("get", key)
+            logger.warn(f"[CacheService] tagged get failed — bypassing cache: {e!r}")
+            return None, None
+
+        suffix = suffix.decode() if isinstance(suffix, bytes) else suffix
+        key = base + suffix
+        if self.local is not None:
+            # Missing generations are cached as 0; bumps drop them everywhere
+            for gen_key, generation in zip(gen_keys, suffix.split(".")):
+                self.local.set(gen_key, generation.encode())
+            if raw is not None and self._is_local(key):
+                self.local.set(key, raw)
+        if observe:
+            result = "miss" if raw is None else "hit"
+            self._record("get", key, result, started, raw and len(raw))
+
+        try:
+            entry = None if raw is None else self._unframe(raw, as_json, adapter)
+        except Exception as e:
+            self._record_error("get", key)
+            logger.warn(f"[CacheService] get failed — bypassing cache: {e!r}")
+            entry = None
+        return key, entry
+
+    async def _set_entry(
         self,
         key: str,
         value: Any,
         expire: Optional[Union[int, timedelta]] = None,
         as_json: bool = True,
+        delta: float = 0.0,
+        stale_after: Optional[Union[int, timedelta]] = None,
+        adapter: Optional[TypeAdapter] = None,
     ) -> bool:
         if not self.enabled:
             return False
 
         try:
-            if isinstance(expire, timedelta):
-                expire = int(expire.total_seconds())
-            expire = expire or self.default_expire
-
-            await self.client.set(
-                self.key(key),
-                self.serialize(value, as_json),
-                ex=expire,
+            raw, expire = self._pack(
+                value, expire, as_json, delta, stale_after, adapter
             )
+
+            observe = metrics.enabled
+            started = time.perf_counter() if observe else 0.0
+            await self.client.set(self.key(key), raw, ex=expire)
+            if observe:
+                self._record("set", key, "ok", started, len(raw))
+
+            if self._is_local(key):
+                self.local.set(key, raw, ttl=expire)
+            await self._publish_invalidation(key)
             return True
         except Exception as e:
+            self._record_error("set", key)
             logger.warn(f"[CacheService] set failed — ignoring: {e}")
             return False
 
-    async def delete(self, key: str) -> bool:
+    # --------------------------------------------------
+    # Tags & generations
+    # --------------------------------------------------
+    def _gen_key(self, tag: str) -> str:
+        return f"{_GEN_PREFIX}{tag}"
+
+    async def _tagged(self, key: str, tags: Optional[Sequence[str]]) -> Optional[str]:
+        """
+        Returns the concrete key for the current generation of `tags`,
+        or None when the generations cannot be read (caller skips the cache).
+        """
+        if not tags:
+            return key
+        if not self.enabled:
+            return None
+
+        try:
+            gen_keys = [self._gen_key(tag) for tag in sorted(set(tags))]
+            raws = await self._read_many(gen_keys)
+            generations = ".".join(str(int(raw or 0)) for raw in raws.values())
+            return f"{key}@{self.schema_version}:{generations}"
+        except Exception as e:
+            logger.warn(f"[CacheService] tag lookup failed — bypassing cache: {e}")
+            return None
+
+    async def invalidate_tags(self, *tags: str) -> bool:
+        """
+        Invalidates every entry carrying any of `tags` by bumping their
+        generation. Orphaned entries age out through their TTL.
+        """
+        if not self.enabled or not tags:
+            return False
+
+        try:
+            async with self.pipeline() as pipe:
+                for tag in dict.fromkeys(tags):
+                    pipe.incr(self._gen_key(tag))
+            return pipe.ok
+        except Exception as e:
+            logger.warn(f"[CacheService] invalidate_tags failed — ignoring: {e}")
+            return False
+
+    async def get(
+        self,
+        key: str,
+        as_json: bool = True,
+        tags: Optional[Sequence[str]] = None,
+    ) -> Any:
+        key, entry = await self._get_tagged_entry(key, tags, as_json)
+        if key is None:
+            return None
+
+        return None if entry is None else entry.value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        as_json: bool = True,
+        tags: Optional[Sequence[str]] = None,
+        stale_after: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        key = await self._tagged(key, tags)
+        if key is None:
+            return False
+
+        return await self._set_entry(
+            key, value, expire, as_json, stale_after=stale_after
+        )
+
+    async def set_negative(
+        self,
+        key: str,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+    ) -> bool:
+        """
+        Remembers that `key` has no backing record for a short while.
+        Reads return NOT_FOUND until it expires or is deleted/invalidated.
+        """
+        return await self.set(key, NOT_FOUND, expire or self.negative_ttl, tags=tags)
+
+    # --------------------------------------------------
+    # Typed models
+    # --------------------------------------------------
+    async def _get_typed(
+        self, key: str, adapter: TypeAdapter, tags: Optional[Sequence[str]]
+    ) -> Any:
+        key, entry = await self._get_tagged_entry(key, tags, adapter=adapter)
+        if key is None:
+            return None
+
+        return None if entry is None else entry.value
+
+    async def _set_typed(
+        self,
+        key: str,
+        value: Any,
+        adapter: TypeAdapter,
+        expire: Optional[Union[int, timedelta]],
+        tags: Optional[Sequence[str]],
+        stale_after: Optional[Union[int, timedelta]],
+    ) -> bool:
+        key = await self._tagged(key, tags)
+        if key is None:
+            return False
+
+        return await self._set_entry(
+            key, value, expire, stale_after=stale_after, adapter=adapter
+        )
+
+    async def get_model(
+        self, key: str, model: Type[M], tags: Optional[Sequence[str]] = None
+    ) -> Union[M, _NotFound, None]:
+        """
+        Returns a validated `model` instance decoded straight from the cached
+        JSON bytes, NOT_FOUND for a negative entry, or None on a miss.
+        """
+        return await self._get_typed(key, model_adapter(model), tags)
+
+    async def get_models(
+        self, key: str, model: Type[M], tags: Optional[Sequence[str]] = None
+    ) -> Optional[list[M]]:
+        return await self._get_typed(key, model_adapter(model, many=True), tags)
+
+    async def set_model(
+        self,
+        key: str,
+        value: BaseModel,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        stale_after: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        adapter = model_adapter(type(value))
+        return await self._set_typed(key, value, adapter, expire, tags, stale_after)
+
+    async def set_models(
+        self,
+        key: str,
+        values: list[M],
+        model: Type[M],
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        stale_after: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        adapter = model_adapter(model, many=True)
+        return await self._set_typed(key, values, adapter, expire, tags, stale_after)
+
+    async def delete(self, key: str, tags: Optional[Sequence[str]] = None) -> bool:
         if not self.enabled:
             return False
 
+        key = await self._tagged(key, tags)
+        if key is None:
+            return False
+
         try:
-            return bool(await self.client.delete(self.key(key)))
+            if self._is_local(key):
+                self.local.delete(key)
+
+            observe = metrics.enabled
+            started = time.perf_counter() if observe else 0.0
+            deleted = bool(await self.client.delete(self.key(key)))
+            if observe:
+                self._record("delete", key, "hit" if deleted else "miss", started)
+
+            await self._publish_invalidation(key)
+            return deleted
         except Exception as e:
+            self._record_error("delete", key)
             logger.warn(f"[CacheService] delete failed — ignoring: {e}")
             return False
 
+    # --------------------------------------------------
+    # Batched operations
+    # --------------------------------------------------
+    async def get_many(self, keys: list[str], as_json: bool = True) -> dict[str, Any]:
+        """
+        Returns {key: value} for every requested key (None on miss),
+        in a single round trip for everything not already in L1.
+        """
+        if not self.enabled or not keys:
+            return {key: None for key in keys}
+
+        try:
+            raws = await self._read_many(list(keys))
+            values = {}
+            for key, raw in raws.items():
+                entry = None if raw is None else self._unframe(raw, as_json)
+                values[key] = None if entry is None else entry.value
+            return values
+        except Exception as e:
+            logger.warn(f"[CacheService] get_many failed — bypassing cache: {e}")
+            return {key: None for key in keys}
+
+    async def set_many(
+        self,
+        items: dict[str, Any],
+        expire: Optional[
+            Union[int, timedelta, dict[str, Optional[Union[int, timedelta]]]]
+        ] = None,
+        as_json: bool = True,
+    ) -> bool:
+        """
+        Writes all items in one pipelined round trip.
+        `expire` is either one TTL for every key or a {key: ttl} mapping.
+        """
+        if not self.enabled or not items:
+            return False
+
+        try:
+            async with self.pipeline() as pipe:
+                for key, value in items.items():
+                    ttl = expire.get(key) if isinstance(expire, dict) else expire
+                    pipe.set(key, value, ttl, as_json)
+            return pipe.ok
+        except Exception as e:
+            logger.warn(f"[CacheService] set_many failed — ignoring: {e}")
+            return False
+
+    async def delete_many(self, keys: list[str]) -> int:
+        if not self.enabled or not keys:
+            return 0
+
+        try:
+            for key in keys:
+                if self._is_local(key):
+                    self.local.delete(key)
+
+            deleted = await self.client.delete(*[self.key(k) for k in keys])
+            await self._publish_invalidation(*keys)
+            return int(deleted)
+        except Exception as e:
+            logger.warn(f"[CacheService] delete_many failed — ignoring: {e}")
+            return 0
+
+    @asynccontextmanager
+    async def pipeline(self):
+        """
+        Queues namespaced commands and sends them in one round trip on exit.
+
+            async with cache.pipeline() as pipe:
+                pipe.set("a", 1, expire=60)
+                pipe.get("b")
+            pipe.results  # [True, <value of b>]
+        """
+        pipe = CachePipeline(self)
+        yield pipe
+        await pipe.execute()
+
     async def exists(self, key: str) -> bool:
         if not self.enabled:
             return False
@@ -122,7 +856,9 @@ class CacheService:
             return None
 
         try:
-            return await self.client.incr(self.key(key), amount)
+            value = await self.client.incr(self.key(key), amount)
+            await self._drop_local(key)
+            return value
         except Exception as e:
             logger.warn(f"[CacheService] incr failed — ignoring: {e}")
             return None
@@ -132,7 +868,9 @@ class CacheService:
             return None
 
         try:
-            return await self.client.decr(self.key(key), amount)
+            value = await self.client.decr(self.key(key), amount)
+            await self._drop_local(key)
+            return value
         except Exception as e:
             logger.warn(f"[CacheService] decr failed — ignoring: {e}")
             return None
@@ -144,8 +882,17 @@ class CacheService:
         timeout: int = 10,
         blocking_timeout: int = 5,
     ):
+        """
+        Yields True when the distributed lock is held, False when it could
+        not be acquired in time or the cache is unavailable (fail-open).
+
+        Contract change: this used to yield None on the fail-open paths and
+        not yield at all when the lock was busy, so `async with` raised
+        "generator didn't yield". It now always yields a bool; callers must
+        check it rather than assume the body runs under the lock.
+        """
         if not self.enabled:
-            yield
+            yield False
             return
 
         try:
@@ -157,12 +904,11 @@ class CacheService:
             acquired = await lock.acquire()
         except Exception as e:
             logger.warn(f"[CacheService] lock acquire failed — bypassing: {e}")
-            yield
+            yield False
             return
 
         try:
-            if acquired:
-                yield
+            yield acquired
         finally:
             try:
                 if acquired:
@@ -170,23 +916,289 @@ class CacheService:
             except Exception:
                 pass
 
+    def _should_refresh_early(self, entry: CacheEntry, beta: float) -> bool:
+        """
+        Probabilistic early expiration (XFetch): the closer a key is to
+        going stale and the more expensive it was to compute, the more
+        likely a reader recomputes it ahead of time.
+        """
+        if beta <= 0 or not entry.fresh_until or not entry.delta:
+            return False
+
+        jitter = -entry.delta * beta * math.log(1.0 - random.random())
+        return time.time() + jitter >= entry.fresh_until
+
+    async def _single_flight(self, key: str, factory: Callable[[], Awaitable[Any]]):
+        """
+        Coalesces concurrent fills of the same key in this process onto one
+        shared future so only the first caller runs the factory. If that
+        caller is cancelled, a waiting follower runs the factory instead.
+        """
+        while (future := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                # The leader's caller went away; the next waiter takes over
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            # Cancelling the shared future would cancel every follower too
+            future.set_exception(_LeaderCancelled())
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _fill(
+        self, key: str, spec: "_FillSpec", stale: Optional[CacheEntry]
+    ) -> Any:
+        if not spec.lock:
+            return await self._compute(key, spec)
+
+        # A refresh of an existing value never waits on another filler
+        blocking_timeout = 0 if stale is not None else spec.lock_timeout
+
+        async with self.acquire_lock(
+            f"lock:{key}",
+            timeout=spec.lock_timeout,
+            blocking_timeout=blocking_timeout,
+        ) as acquired:
+            if not acquired and stale is not None:
+                return stale.value
+
+            # Another process may have filled the key while we waited
+            if stale is None:
+                entry = await self._get_entry(key, spec.as_json, spec.adapter)
+                if entry is not None:
+                    return entry.value
+
+            return await self._compute(key, spec)
+
+    async def _compute(self, key: str, spec: "_FillSpec") -> Any:
+        started = time.monotonic()
+        value = await spec.callback()
+        delta = time.monotonic() - started
+
+        if value is not None:
+            await self._set_entry(
+                key,
+                value,
+                spec.expire,
+                spec.as_json,
+                delta,
+                spec.stale_after,
+                spec.adapter,
+            )
+        elif spec.negative_ttl:
+            await self._set_entry(key, NOT_FOUND, spec.negative_ttl, spec.as_json)
+
+        return value
+
+    def _refresh_in_background(
+        self, key: str, spec: "_FillSpec", stale: CacheEntry
+    ) -> None:
+        if key in self._refreshing or key in self._inflight:
+            return
+
+        async def refresh():
+            try:
+                await self._single_flight(key, lambda: self._fill(key, spec, stale))
+            except Exception as e:
+                logger.warn(f"[CacheService] background refresh of '{key}' failed: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
     async def getOrSet(
         self,
         key: str,
         callback: Callable[[], Awaitable[Any]],
         expire: Optional[Union[int, timedelta]] = None,
         as_json: bool = True,
+        lock: bool = False,
+        lock_timeout: int = 10,
+        beta: float = 1.0,
+        tags: Optional[Sequence[str]] = None,
+        stale_after: Optional[Union[int, timedelta]] = None,
+        negative_ttl: Optional[int] = None,
+        model: Optional[Type[BaseModel]] = None,
+        many: bool = False,
     ) -> Any:
-        value = await self.get(key, as_json)
-        if value is not None:
-            return value
+        """
+        Read-through cache. Returns None when the callback found nothing.
+
+        lock:         also serialize fills across processes with a Redis lock
+        beta:         XFetch aggressiveness; 0 disables early recomputation
+        tags:         invalidation tags, see `invalidate_tags`
+        stale_after:  soft TTL; past it the stale value is returned at once
+                      and refreshed in the background until `expire`
+        negative_ttl: cache a None result as NOT_FOUND for this many seconds
+        model/many:   store and return validated `model` instances (or lists)
+        """
+        adapter = model_adapter(model, many) if model is not None else None
+        key, entry = await self._get_tagged_entry(key, tags, as_json, adapter)
+        if key is None:
+            return await callback()
+
+        spec = _FillSpec(
+            callback,
+            expire,
+            as_json,
+            lock,
+            lock_timeout,
+            stale_after,
+            negative_ttl,
+            adapter,
+        )
+
+        if entry is not None and entry.is_stale():
+            self._refresh_in_background(key, spec, entry)
+            value = entry.value
+        elif entry is not None and not self._should_refresh_early(entry, beta):
+            value = entry.value
+        else:
+            value = await self._single_flight(key, lambda: self._fill(key, spec, entry))
+
+        return None if value is NOT_FOUND else value
+
+    async def shutdown(self) -> None:
+        await self.stop_listener()
+
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Tasks cancelled before they started never reach their cleanup
+        self._refreshing.clear()
+
+
+class _LeaderCancelled(Exception):
+    """Set on a single-flight future whose leading caller was cancelled."""
+
+
+class _FillSpec(NamedTuple):
+    callback: Callable[[], Awaitable[Any]]
+    expire: Optional[Union[int, timedelta]]
+    as_json: bool
+    lock: bool
+    lock_timeout: int
+    stale_after: Optional[Union[int, timedelta]]
+    negative_ttl: Optional[int]
+    adapter: Optional[TypeAdapter]
+
+
+class CachePipeline:
+    """
+    Pipelined batch of cache commands bound to a CacheService.
+    Same namespacing, framing and fail-open semantics as the service.
+    """
+
+    def __init__(self, cache: CacheService):
+        self.cache = cache
+        self.results: list[Any] = []
+        self.ok = False
+        self._pipe = cache.client.pipeline(transaction=False) if cache.enabled else None
+        self._decoders: list[Callable[[Any], Any]] = []
+        self._local_writes: dict[str, tuple[bytes, Optional[int]]] = {}
+        self._touched: list[str] = []
+
+    def _queue(self, decoder: Callable[[Any], Any] = lambda r: r) -> None:
+        self._decoders.append(decoder)
+
+    def get(self, key: str, as_json: bool = True) -> "CachePipeline":
+        if self._pipe is not None:
+            self._pipe.get(self.cache.key(key))
+
+        def decode(raw):
+            entry = None if raw is None else self.cache._unframe(raw, as_json)
+            return None if entry is None else entry.value
+
+        self._queue(decode)
+        return self
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        as_json: bool = True,
+    ) -> "CachePipeline":
+        if self._pipe is not None:
+            raw, ttl = self.cache._pack(value, expire, as_json)
+            self._pipe.set(self.cache.key(key), raw, ex=ttl)
+            if self.cache._is_local(key):
+                self._local_writes[key] = (raw, ttl)
+            self._touched.append(key)
+
+        self._queue(bool)
+        return self
+
+    def delete(self, *keys: str) -> "CachePipeline":
+        if self._pipe is not None:
+            self._pipe.delete(*[self.cache.key(k) for k in keys])
+            for key in keys:
+                self._local_writes.pop(key, None)
+            self._touched.extend(keys)
+
+        self._queue(int)
+        return self
+
+    def incr(self, key: str, amount: int = 1) -> "CachePipeline":
+        if self._pipe is not None:
+            self._pipe.incr(self.cache.key(key), amount)
+            self._local_writes.pop(key, None)
+            self._touched.append(key)
+
+        self._queue()
+        return self
+
+    def expire(self, key: str, seconds: Union[int, timedelta]) -> "CachePipeline":
+        if self._pipe is not None:
+            self._pipe.expire(self.cache.key(key), seconds)
+
+        self._queue(bool)
+        return self
+
+    async def execute(self) -> list[Any]:
+        self.results = [None] * len(self._decoders)
+        if self._pipe is None or not self._decoders:
+            return self.results
 
         try:
-            value = await callback()
-        except Exception:
-            raise
+            raw_results = await self._pipe.execute(raise_on_error=False)
+        except Exception as e:
+            logger.warn(f"[CacheService] pipeline failed — ignoring: {e}")
+            return self.results
 
-        if value is not None:
-            await self.set(key, value, expire, as_json)
+        self.ok = True
+        for index, (decode, raw) in enumerate(zip(self._decoders, raw_results)):
+            if isinstance(raw, Exception):
+                self.ok = False
+                logger.warn(f"[CacheService] pipeline command failed: {raw}")
+                continue
+            try:
+                self.results[index] = decode(raw)
+            except Exception as e:
+                logger.warn(f"[CacheService] pipeline decode failed: {e}")
 
-        return value
+        local = self.cache.local
+        for key in self._touched:
+            if self.cache._is_local(key):
+                local.delete(key)
+        for key, (raw, ttl) in self._local_writes.items():
+            local.set(key, raw, ttl=ttl)
+
+        await self.cache._publish_invalidation(*dict.fromkeys(self._touched))
+        return self.results
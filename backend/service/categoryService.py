@@ -1,51 +1,106 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import List, Optional
+from typing import AsyncIterator, Optional
 
 from service.cacheService import CacheService
 from templates.categoryTemplate import Category
 from utilities.errorRaiser import BadRequestException, NotFoundException
+from utilities.pagination import Page, fetch_page, page_size, stream_documents
+from utilities.projection import projection_for, projection_key
+
+SORT_KEY = "name"
 
 
 class CategoryService:
-    def __init__(self, cache_service: CacheService, ttl_seconds: int = 300):
+    def __init__(
+        self,
+        cache_service: CacheService,
+        ttl_seconds: int = 300,
+        grace_seconds: int = 300,
+    ):
         self.cache = cache_service
         self.ttl = ttl_seconds
-
-    def _key_all(self) -> str:
-        return "category:all"
+        self.grace = grace_seconds
 
     def _key_one(self, cid: str) -> str:
         return f"category:{cid}"
 
-    async def getAllCategory(self) -> List[Category]:
-        key = self._key_all()
-        cached = self.cache.get(key)
+    def _key_first_page(self, size: int, fields: str) -> str:
+        return f"category:page:{size}:{fields}"
 
-        if cached:
-            return self.cache.decodeModel(cached, Category)
+    def _key_count(self) -> str:
+        return "category:count"
 
-        categories = await Category.find_all().to_list()
+    def _tag_all(self) -> str:
+        return "category"
 
-        self.cache.set(
-            key,
-            categories,
-            expire=timedelta(seconds=self.ttl),
-        )
-        return categories
+    def _tag_one(self, cid: str) -> str:
+        return f"category:{cid}"
 
-    async def getCategory(self, category_id: str) -> Category:
-        key = self._key_one(category_id)
-        cached = self.cache.get(key)
-        if cached:
-            return self.cache.decodeModel(cached, Category)
+    async def getCategoryPage(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        fields: Optional[str] = None,
+    ) -> Page:
+        size = page_size(limit)
+        projection = projection_for(Category, fields, required=[SORT_KEY])
+
+        def fetch():
+            return fetch_page(
+                Category,
+                limit=size,
+                cursor=cursor,
+                sort=SORT_KEY,
+                projection=projection,
+            )
+
+        # Only the first page is hot enough to cache; later pages are
+        # index-bounded range reads
+        if cursor:
+            rows = await fetch()
+        else:
+            rows = await self.cache.getOrSet(
+                self._key_first_page(size, projection_key(projection)),
+                fetch,
+                expire=timedelta(seconds=self.ttl + self.grace),
+                stale_after=self.ttl,
+                tags=[self._tag_all()],
+                model=projection or Category,
+                many=True,
+            )
+
+        total = None
+        if include_total:
+            total = await self.cache.getOrSet(
+                self._key_count(),
+                Category.count,
+                expire=timedelta(seconds=self.ttl + self.grace),
+                stale_after=self.ttl,
+                tags=[self._tag_all()],
+            )
+
+        return Page.from_rows(rows, size, sort=SORT_KEY, total=total)
+
+    def streamCategories(self, fields: Optional[str] = None) -> AsyncIterator[Category]:
+        projection = projection_for(Category, fields)
+        return stream_documents(Category, sort=SORT_KEY, projection=projection)
 
-        category = await Category.get(category_id)
+    async def getCategory(self, category_id: str) -> Category:
+        category = await self.cache.getOrSet(
+            self._key_one(category_id),
+            lambda: Category.get(category_id),
+            expire=timedelta(seconds=self.ttl + self.grace),
+            stale_after=self.ttl,
+            tags=[self._tag_one(category_id)],
+            negative_ttl=self.cache.negative_ttl,
+            model=Category,
+        )
         if not category:
             raise NotFoundException(f"Category '{category_id}' does not exist")
 
-        self.cache.set(key, category, expire=self.ttl)
         return category
 
     async def createCategory(
@@ -58,7 +113,9 @@ class CategoryService:
         category = Category(name=name, description=description)
         await category.insert()
 
-        self.cache.delete(self._key_all())
+        await self.cache.invalidate_tags(
+            self._tag_all(), self._tag_one(str(category.id))
+        )
         return category
 
     async def updateCategory(self, category_id: str, name=None, description=None):
@@ -77,8 +134,7 @@ class CategoryService:
 
         await category.save()
 
-        self.cache.set(self._key_one(category_id), category, expire=self.ttl)
-        self.cache.delete(self._key_all())
+        await self.cache.invalidate_tags(self._tag_all(), self._tag_one(category_id))
 
         return category
 
@@ -89,7 +145,6 @@ class CategoryService:
 
         await category.delete()
 
-        self.cache.delete(self._key_one(category_id))
-        self.cache.delete(self._key_all())
+        await self.cache.invalidate_tags(self._tag_all(), self._tag_one(category_id))
 
         return True
@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from fastapi import UploadFile
 
@@ -15,6 +15,8 @@ from utilities.errorRaiser import (
     NotFoundException,
 )
 from utilities.logger import logger
+from utilities.pagination import Page, fetch_page, page_size, stream_documents
+from utilities.projection import projection_for, projection_key
 
 
 class RestaurantService(BaseService):
@@ -25,57 +27,101 @@ class RestaurantService(BaseService):
         category_service: Optional[CategoryService] = None,
         file_service: Optional[FileService] = None,
         ttl_seconds: int = 300,
+        grace_seconds: int = 300,
     ):
         self.user_service = user_service
         self.category_service = category_service
         self.cache_service = cache_service
         self.file_service = file_service
         self.ttl = ttl_seconds
-
-    def _key_all(self) -> str:
-        return "restaurant:all"
+        self.grace = grace_seconds
 
     def _key_one(self, cid: str) -> str:
         return f"restaurant:{cid}"
 
-    async def getRestaurants(self):
-        try:
-            key = self._key_all()
-            cached = self.cache_service.get(key)
+    def _key_first_page(self, size: int, fields: str) -> str:
+        return f"restaurant:page:{size}:{fields}"
 
-            if cached:
-                return self.cache_service.decodeModel(cached, Restaurant)
+    def _key_count(self) -> str:
+        return "restaurant:count"
 
-            restaurants = await Restaurant.find_all().to_list()
+    def _tag_all(self) -> str:
+        return "restaurant"
 
-            self.cache_service.set(
-                key,
-                restaurants,
-                expire=timedelta(seconds=self.ttl),
-            )
-            return restaurants
+    def _tag_one(self, cid: str) -> str:
+        return f"restaurant:{cid}"
+
+    async def getRestaurantPage(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        fields: Optional[str] = None,
+    ) -> Page:
+        try:
+            size = page_size(limit)
+            projection = projection_for(Restaurant, fields)
+
+            def fetch():
+                return fetch_page(
+                    Restaurant, limit=size, cursor=cursor, projection=projection
+                )
+
+            if cursor:
+                rows = await fetch()
+            else:
+                rows = await self.cache_service.getOrSet(
+                    self._key_first_page(size, projection_key(projection)),
+                    fetch,
+                    expire=timedelta(seconds=self.ttl + self.grace),
+                    stale_after=self.ttl,
+                    tags=[self._tag_all()],
+                    model=projection or Restaurant,
+                    many=True,
+                )
+
+            total = None
+            if include_total:
+                total = await self.cache_service.getOrSet(
+                    self._key_count(),
+                    Restaurant.count,
+                    expire=timedelta(seconds=self.ttl + self.grace),
+                    stale_after=self.ttl,
+                    tags=[self._tag_all()],
+                )
+
+            return Page.from_rows(rows, size, total=total)
 
         except AppHttpException:
             raise
 
         except Exception as e:
             logger.error(
-                f"[RestaurantService] getRestaurants failed: {e}", exc_info=True
+                f"[RestaurantService] getRestaurantPage failed: {e}", exc_info=True
             )
             raise InternalErrorException("Internal server error")
 
+    def streamRestaurants(
+        self, fields: Optional[str] = None
+    ) -> AsyncIterator[Restaurant]:
+        return stream_documents(
+            Restaurant, projection=projection_for(Restaurant, fields)
+        )
+
     async def getRestaurant(self, restaurant_id):
         try:
-            key = self._key_one(restaurant_id)
-            cached = self.cache_service.get(key)
-            if cached:
-                return self.cache_service.decodeModel(cached, Restaurant)
-
-            restaurant = await Restaurant.get(restaurant_id)
+            restaurant = await self.cache_service.getOrSet(
+                self._key_one(restaurant_id),
+                lambda: Restaurant.get(restaurant_id),
+                expire=timedelta(seconds=self.ttl + self.grace),
+                stale_after=self.ttl,
+                tags=[self._tag_one(restaurant_id)],
+                negative_ttl=self.cache_service.negative_ttl,
+                model=Restaurant,
+            )
             if not restaurant:
                 raise NotFoundException(f"Restaurant '{restaurant_id}' does not exist")
 
-            self.cache_service.set(key, restaurant, expire=self.ttl)
             return restaurant
 
         except AppHttpException:
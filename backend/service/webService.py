@@ -51,6 +51,22 @@ class WebService:
         self.timeout = httpx.Timeout(5.0, connect=3.0)
         self.max_retries = 3
 
+        # Shared so TLS connections to Google/PayPal are reused across calls
+        self.client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+
+    async def warmup(self) -> None:
+        """Opens pooled connections to PayPal ahead of the first payment."""
+        try:
+            await self.client.head(self.paypal_base_url)
+        except httpx.HTTPError as e:
+            logger.warn(f"[WebService] warmup failed: {e}")
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
     def is_recaptcha_available(self) -> bool:
         return bool(self.recaptcha_secret)
 
@@ -64,16 +80,15 @@ class WebService:
             return True
 
         async def op():
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                r = await client.post(
-                    "https://www.google.com/recaptcha/api/siteverify",
-                    data={
-                        "secret": self.recaptcha_secret,
-                        "response": token,
-                    },
-                )
-                r.raise_for_status()
-                return r.json()
+            r = await self.client.post(
+                "https://www.google.com/recaptcha/api/siteverify",
+                data={
+                    "secret": self.recaptcha_secret,
+                    "response": token,
+                },
+            )
+            r.raise_for_status()
+            return r.json()
 
         try:
             result = await retry_async(
@@ -92,14 +107,13 @@ class WebService:
 
     async def _get_paypal_token(self) -> str:
         async def op():
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                r = await client.post(
-                    f"{self.paypal_base_url}/v1/oauth2/token",
-                    auth=(self.paypal_client_id, self.paypal_secret),
-                    data={"grant_type": "client_credentials"},
-                )
-                r.raise_for_status()
-                return r.json()["access_token"]
+            r = await self.client.post(
+                f"{self.paypal_base_url}/v1/oauth2/token",
+                auth=(self.paypal_client_id, self.paypal_secret),
+                data={"grant_type": "client_credentials"},
+            )
+            r.raise_for_status()
+            return r.json()["access_token"]
 
         try:
             token = await retry_async(
@@ -128,14 +142,13 @@ class WebService:
         }
 
         async def op():
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                r = await client.post(
-                    f"{self.paypal_base_url}/v2/checkout/orders",
-                    headers={"Authorization": f"Bearer {token}"},
-                    json=payload,
-                )
-                r.raise_for_status()
-                return r.json()
+            r = await self.client.post(
+                f"{self.paypal_base_url}/v2/checkout/orders",
+                headers={"Authorization": f"Bearer {token}"},
+                json=payload,
+            )
+            r.raise_for_status()
+            return r.json()
 
         try:
             result = await retry_async(
@@ -153,13 +166,12 @@ class WebService:
         token = await self._get_paypal_token()
 
         async def op():
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                r = await client.post(
-                    f"{self.paypal_base_url}/v2/checkout/orders/{order_id}/capture",
-                    headers={"Authorization": f"Bearer {token}"},
-                )
-                r.raise_for_status()
-                return r.json()
+            r = await self.client.post(
+                f"{self.paypal_base_url}/v2/checkout/orders/{order_id}/capture",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            r.raise_for_status()
+            return r.json()
 
         try:
             result = await retry_async(
@@ -172,3 +184,30 @@ class WebService:
         except Exception as e:
             logger.error(f"[WebService] Capture failed for {order_id}: {e}")
             raise
+
+    async def getPayPalOrder(self, order_id: str) -> dict:
+        """
+        Fetches a checkout order. Uncaptured CAPTURE-intent orders cannot be
+        voided and expire on their own; check `status` before giving up.
+        """
+        token = await self._get_paypal_token()
+
+        async def op():
+            r = await self.client.get(
+                f"{self.paypal_base_url}/v2/checkout/orders/{order_id}",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            r.raise_for_status()
+            return r.json()
+
+        try:
+            result = await retry_async(
+                op,
+                retries=self.max_retries,
+                retry_on=(httpx.RequestError, httpx.HTTPStatusError),
+            )
+            logger.info(f"[WebService] PayPal order {order_id} fetched")
+            return result
+        except Exception as e:
+            logger.error(f"[WebService] Fetching order {order_id} failed: {e}")
+            raise
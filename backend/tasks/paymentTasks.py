@@ -1,12 +1,12 @@
 import math
-from datetime import datetime
 
 from config.celeryConfig import celery_app
-from container.containerWorkerBootstrap import container
+from container.containerWorkerBootstrap import get_container, run_async
 from service.webService import WebService
 from utilities.logger import logger
 
 MAX_RETRIES = 5
+PAYPAL_TIMEOUT = 60
 
 
 def _retry_with_backoff(task, exc, countdown_base=10):
@@ -25,40 +25,51 @@ def _retry_with_backoff(task, exc, countdown_base=10):
         return {"status": "purged", "error": str(exc)}
 
 
-@celery_app.task(bind=True, name="cancel_payment_task", max_retries=MAX_RETRIES)
-def cancel_payment_task(self, paypal_order_id: str, order_id: int):
-    """
-    Cancels a pending PayPal order and updates the local database record.
-    """
-    logger.info(f"[Celery] Attempting to cancel PayPal order {paypal_order_id}")
+async def _web_service() -> WebService:
+    return await get_container().resolve("WebService")
 
-    try:
-        web_service: WebService = container.resolve("WebService")
 
-        token = web_service.getPaypalToken()
-        result = web_service.cancelPayPalOrder(paypal_order_id, token)
+async def _get_paypal_order(paypal_order_id: str) -> dict:
+    web_service = await _web_service()
+    return await web_service.getPayPalOrder(paypal_order_id)
+
+
+async def _capture_paypal_order(paypal_order_id: str) -> dict:
+    web_service = await _web_service()
+    return await web_service.capturePaypalOrder(paypal_order_id)
+
 
-        with get_db() as db:
-            order = db.query(Order).filter(Order.id == order_id).first()
-            if not order:
-                logger.error(f"[Celery] Order {order_id} not found")
-                return {"status": "error"}
+# Orders are not persisted yet (OrderService is a stub), so these tasks
+# report the PayPal outcome in their result and write no order status.
 
-            if order.status == OrderStatus.PAID:
-                logger.info(f"[Celery] Order {order_id} already paid; skipping cancel.")
-                return {"status": "skipped"}
 
-            order.status = OrderStatus.CANCELLED
-            order.updated_at = datetime.utcnow()
-            db.flush()
+@celery_app.task(bind=True, name="abandon_payment_task", max_retries=MAX_RETRIES)
+def abandon_payment_task(self, paypal_order_id: str, order_id: int):
+    """
+    Gives up on a PayPal order that was not captured. Checkout orders cannot
+    be voided, so this confirms the order is still uncaptured and leaves it
+    to expire on PayPal's side.
+    """
+    logger.info(f"[Celery] Abandoning PayPal order {paypal_order_id}")
+
+    try:
+        order = run_async(_get_paypal_order(paypal_order_id), PAYPAL_TIMEOUT)
+
+        if order.get("status") == "COMPLETED":
+            logger.warning(
+                f"[Celery] PayPal order {paypal_order_id} was captured; "
+                f"not abandoning Order {order_id}"
+            )
+            return {"status": "captured", "paypal_order_id": paypal_order_id}
 
         logger.info(
-            f"[Celery] Cancelled PayPal order {paypal_order_id} for Order {order_id}"
+            f"[Celery] PayPal order {paypal_order_id} for Order {order_id} "
+            f"left to expire ({order.get('status')})"
         )
         return {
-            "status": "cancelled",
+            "status": "abandoned",
             "paypal_order_id": paypal_order_id,
-            "result": result,
+            "paypal_status": order.get("status"),
         }
 
     except Exception as e:
@@ -68,51 +79,25 @@ def cancel_payment_task(self, paypal_order_id: str, order_id: int):
 @celery_app.task(bind=True, name="finalize_payment_task", max_retries=MAX_RETRIES)
 def finalize_payment_task(self, paypal_order_id: str, order_id: int):
     """
-    Captures a pending PayPal order. If capture succeeds,
-    schedules process_payment_task; otherwise cancels the order.
+    Captures a pending PayPal order. If the capture does not complete,
+    schedules abandon_payment_task.
     """
     logger.info(f"[Celery] Finalizing PayPal order {paypal_order_id}")
 
     try:
-        web_service: WebService = container.resolve("WebService")
-        capture = web_service.capturePaypalOrder(paypal_order_id)
+        capture = run_async(_capture_paypal_order(paypal_order_id), PAYPAL_TIMEOUT)
 
         if capture.get("status") == "COMPLETED":
             logger.info(
-                f"[Celery] PayPal order {paypal_order_id} captured successfully."
+                f"[Celery] PayPal order {paypal_order_id} for Order {order_id} "
+                "captured successfully."
             )
-            process_payment_task.apply_async(args=[order_id])
-            return {"status": "captured"}
+            return {"status": "captured", "paypal_order_id": paypal_order_id}
 
         logger.warning(f"[Celery] Capture failed for {paypal_order_id}: {capture}")
-        cancel_payment_task.apply_async(args=[paypal_order_id, order_id])
-        return {"status": "cancelled"}
+        abandon_payment_task.apply_async(args=[paypal_order_id, order_id])
+        return {"status": "abandoned", "paypal_order_id": paypal_order_id}
 
     except Exception as e:
         logger.error(f"[Celery] Finalize failed for {paypal_order_id}: {e}")
         return _retry_with_backoff(self, e)
-
-
-@celery_app.task(bind=True, name="process_payment_task", max_retries=MAX_RETRIES)
-def process_payment_task(self, order_id: int):
-    """
-    Updates the database to mark an order as fully paid.
-    """
-    logger.info(f"[Celery] Marking order {order_id} as PAID.")
-
-    try:
-        with get_db() as db:
-            order = db.query(Order).filter(Order.id == order_id).first()
-            if not order:
-                logger.error(f"[Celery] Order {order_id} not found")
-                return {"status": "error"}
-
-            order.status = OrderStatus.PAID
-            order.updated_at = datetime.utcnow()
-            db.flush()
-
-        logger.info(f"[Celery] Order {order_id} finalized as PAID.")
-        return {"status": "success", "order_id": order_id}
-
-    except Exception as e:
-        return _retry_with_backoff(self, e)
@@ -7,6 +7,8 @@ from beanie import Document
 from pydantic import EmailStr, Field
 from pymongo import IndexModel
 
+from utilities.projection import ProjectionModel
+
 
 class User(Document):
     email: EmailStr
@@ -48,3 +50,20 @@ class User(Document):
                 partialFilterExpression={"microsoft_id": {"$type": "string"}},
             ),
         ]
+
+
+class UserCredentials(ProjectionModel):
+    """What a local login reads: the hash plus the fields returned on success."""
+
+    email: EmailStr
+    password: Optional[str] = None
+    role: str = "user"
+    username: Optional[str] = None
+    avatar: Optional[str] = None
+
+
+class UserIdentity(ProjectionModel):
+    """Enough to tell whether, and how, an email is registered."""
+
+    email: EmailStr
+    provider: str = "local"
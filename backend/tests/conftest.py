@@ -0,0 +1,7 @@
+import os
+
+# Settings refuse to load without these; tests never reach the real services
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017/easyfood")
+os.environ.setdefault("CELERY_BROKER_URL", "redis://localhost:6379/1")
+os.environ.setdefault("CELERY_RESULT_BACKEND", "redis://localhost:6379/2")
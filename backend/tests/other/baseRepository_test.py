@@ -0,0 +1,168 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from repository.baseRepository import BaseRepository
+from utilities.circuitBreaker import CircuitBreaker
+
+
+class _Query:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self):
+        return self.docs
+
+
+class _Collection:
+    def __init__(self, model):
+        self.model = model
+        self.bulk_calls: list[tuple[list, bool]] = []
+
+    async def distinct(self, field, query):
+        wanted = set(query["_id"]["$in"])
+        return [doc_id for doc_id in self.model.stored if doc_id in wanted]
+
+    async def bulk_write(self, requests, ordered):
+        self.bulk_calls.append((requests, ordered))
+        if self.model.bulk_error is not None:
+            raise self.model.bulk_error
+        return SimpleNamespace(
+            matched_count=len(requests), modified_count=len(requests)
+        )
+
+
+class _Model:
+    """Records inserts; `fail_at` positions fail with a duplicate key error."""
+
+    id = "_id"
+
+    def __init__(self, fail_at=(), write_concern_error=False, bulk_error=None):
+        self.fail_at = set(fail_at)
+        self.write_concern_error = write_concern_error
+        self.bulk_error = bulk_error
+        self.stored: dict = {}
+        self.collection = _Collection(self)
+
+    def get_pymongo_collection(self):
+        return self.collection
+
+    def find(self, query, projection_model=None):
+        ids = query["_id"]["$in"]
+        return _Query([self.stored[i] for i in ids if i in self.stored])
+
+    async def insert_many(self, docs, ordered):
+        errors = []
+        for i, doc in enumerate(docs):
+            if doc.id in self.fail_at:
+                errors.append({"index": i, "code": 11000, "errmsg": "duplicate key"})
+                if ordered:
+                    break
+                continue
+            self.stored[doc.id] = doc
+
+        concern = [{"code": 64, "errmsg": "waiting for replication timed out"}]
+        if errors or self.write_concern_error:
+            raise BulkWriteError(
+                {
+                    "writeErrors": errors,
+                    "writeConcernErrors": concern if self.write_concern_error else [],
+                }
+            )
+
+
+def _docs(count: int) -> list:
+    return [SimpleNamespace(id=f"d{i}") for i in range(count)]
+
+
+def _repo() -> BaseRepository:
+    return BaseRepository(retries=0, circuit_breaker=CircuitBreaker("test.repo"))
+
+
+def test_find_many_by_ids_keeps_order_and_skips_missing():
+    model = _Model()
+    for doc in _docs(5):
+        model.stored[doc.id] = doc
+
+    found = asyncio.run(
+        _repo().findManyByIds(model, ["d3", "missing", "d1", "d3"], batch_size=2)
+    )
+
+    assert [doc.id for doc in found] == ["d3", "d1"]
+
+
+def test_ordered_insert_stops_at_first_failure():
+    model = _Model(fail_at={"d2"})
+
+    result = asyncio.run(
+        _repo().insertManyDocuments(model, _docs(6), ordered=True, batch_size=4)
+    )
+
+    assert result.inserted_ids == ["d0", "d1"]
+    assert [error["index"] for error in result.errors] == [2]
+    assert not result.ok
+    assert set(model.stored) == {"d0", "d1"}
+
+
+def test_unordered_insert_reports_every_failure_with_input_index():
+    model = _Model(fail_at={"d1", "d5"})
+
+    result = asyncio.run(
+        _repo().insertManyDocuments(model, _docs(6), ordered=False, batch_size=4)
+    )
+
+    assert result.inserted_ids == ["d0", "d2", "d3", "d4"]
+    assert [error["index"] for error in result.errors] == [1, 5]
+    assert result.errors[0]["code"] == 11000
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_insert_write_concern_error_is_reported(ordered):
+    model = _Model(write_concern_error=True)
+
+    result = asyncio.run(_repo().insertManyDocuments(model, _docs(3), ordered=ordered))
+
+    assert result.inserted_ids == ["d0", "d1", "d2"]
+    assert result.errors == []
+    assert result.write_concern_errors == [
+        {"code": 64, "message": "waiting for replication timed out"}
+    ]
+    assert not result.ok
+
+
+def test_bulk_update_reports_partial_failure_and_write_concern_errors():
+    error = BulkWriteError(
+        {
+            "nMatched": 2,
+            "nModified": 1,
+            "writeErrors": [{"index": 1, "code": 121, "errmsg": "validation failed"}],
+            "writeConcernErrors": [{"code": 64, "errmsg": "timed out"}],
+        }
+    )
+    model = _Model(bulk_error=error)
+
+    result = asyncio.run(
+        _repo().bulkUpdateDocuments(
+            model, {"a": {"x": 1}, "b": {"x": 2}, "c": {"x": 3}}
+        )
+    )
+
+    assert (result.matched, result.modified) == (2, 1)
+    assert result.errors == [{"index": 1, "code": 121, "message": "validation failed"}]
+    assert result.write_concern_errors == [{"code": 64, "message": "timed out"}]
+    requests, ordered = model.collection.bulk_calls[0]
+    assert ordered is False
+    assert "updated_at" in requests[0]._doc["$set"]
+
+
+def test_bulk_update_success():
+    model = _Model()
+
+    result = asyncio.run(
+        _repo().bulkUpdateDocuments(model, [("a", {"x": 1})], stamp_field=None)
+    )
+
+    assert result.ok
+    assert result.to_dict()["matched"] == 1
@@ -0,0 +1,580 @@
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+from pydantic import BaseModel
+
+from service.cacheService import NOT_FOUND, CacheEntry, CacheService, _FillSpec
+from utilities.cacheCodecs import CODECS, COMPRESSORS
+from utilities.metrics import metrics
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def _cache(server=None, **kwargs) -> CacheService:
+    kwargs.setdefault("local_enabled", False)
+    kwargs.setdefault("compression", None)
+    return CacheService(client=fakeredis.FakeAsyncRedis(server=server), **kwargs)
+
+
+def _l1_cache(server=None, **kwargs) -> CacheService:
+    kwargs.setdefault("local_prefixes", ("category:",))
+    return _cache(server, local_enabled=True, **kwargs)
+
+
+async def _eventually(check, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if await check():
+            return True
+        await asyncio.sleep(0.02)
+    return False
+
+
+# --------------------------------------------------
+# L1 and invalidation
+# --------------------------------------------------
+def test_l1_serves_local_prefixes_without_redis():
+    async def run():
+        cache = _l1_cache()
+        await cache.set("category:1", {"name": "Pizza"})
+        await cache.set("user:1", {"name": "Ana"})
+        await cache.client.flushall()
+        return await cache.get("category:1"), await cache.get("user:1")
+
+    assert asyncio.run(run()) == ({"name": "Pizza"}, None)
+
+
+def test_l1_is_filled_on_read_and_dropped_on_delete():
+    async def run():
+        cache = _l1_cache()
+        await cache.client.set(cache.key("category:1"), b'"raw"')
+        first = await cache.get("category:1")
+        in_l1 = "category:1" in cache.local
+        await cache.delete("category:1")
+        return first, in_l1, "category:1" in cache.local
+
+    assert asyncio.run(run()) == ("raw", True, False)
+
+
+def test_writes_invalidate_other_instances_l1():
+    async def run():
+        server = fakeredis.FakeServer()
+        writer, reader = _l1_cache(server), _l1_cache(server)
+        await reader.start_listener()
+        try:
+            await asyncio.sleep(0.1)  # let the listener subscribe
+            await writer.set("category:1", "old")
+            assert await reader.get("category:1") == "old"
+
+            await writer.set("category:1", "new")
+
+            async def refreshed():
+                return await reader.get("category:1") == "new"
+
+            return await _eventually(refreshed)
+        finally:
+            await reader.shutdown()
+
+    assert asyncio.run(run())
+
+
+# --------------------------------------------------
+# Stampede protection
+# --------------------------------------------------
+def test_single_flight_coalesces_concurrent_fills():
+    async def run():
+        cache = _cache()
+        calls = 0
+
+        async def fill():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(
+            *(cache._single_flight("k", fill) for _ in range(5))
+        )
+        return calls, results
+
+    assert asyncio.run(run()) == (1, [1] * 5)
+
+
+def test_single_flight_leader_cancellation_hands_over_to_a_follower():
+    async def run():
+        cache = _cache()
+        started = asyncio.Event()
+        calls = 0
+
+        async def fill():
+            nonlocal calls
+            calls += 1
+            started.set()
+            await asyncio.sleep(0.01)
+            return "value"
+
+        leader = asyncio.create_task(cache._single_flight("k", fill))
+        await started.wait()
+        followers = [
+            asyncio.create_task(cache._single_flight("k", fill)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        results = await asyncio.gather(*followers)
+        return calls, results, cache._inflight
+
+    calls, results, inflight = asyncio.run(run())
+    assert results == ["value"] * 3
+    assert calls == 2
+    assert inflight == {}
+
+
+def test_get_or_set_runs_the_callback_once_for_concurrent_misses():
+    async def run():
+        cache = _cache()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"n": calls}
+
+        results = await asyncio.gather(
+            *(cache.getOrSet("k", load, expire=60, lock=True) for _ in range(5))
+        )
+        return calls, results, await cache.get("k")
+
+    calls, results, cached = asyncio.run(run())
+    assert calls == 1
+    assert results == [{"n": 1}] * 5
+    assert cached == {"n": 1}
+
+
+def test_acquire_lock_yields_whether_it_is_held():
+    async def run():
+        cache = _cache()
+        async with cache.acquire_lock("lock:k", timeout=5) as first:
+            async with cache.acquire_lock("lock:k", blocking_timeout=0) as second:
+                pass
+        async with cache.acquire_lock("lock:k", blocking_timeout=0) as after:
+            pass
+        async with _cache(enabled=False).acquire_lock("lock:k") as disabled:
+            pass
+        return first, second, after, disabled
+
+    assert asyncio.run(run()) == (True, False, True, False)
+
+
+def test_xfetch_refreshes_early_only_near_expiry():
+    cache = _cache()
+    now = time.time()
+    near = CacheEntry("v", expires_at=now + 0.01, delta=5.0)
+    far = CacheEntry("v", expires_at=now + 3600, delta=0.001)
+
+    assert cache._should_refresh_early(near, beta=1.0)
+    assert not cache._should_refresh_early(far, beta=1.0)
+    assert not cache._should_refresh_early(near, beta=0)
+
+
+# --------------------------------------------------
+# Batched operations
+# --------------------------------------------------
+def test_get_many_and_set_many_round_trip():
+    async def run():
+        cache = _cache()
+        ok = await cache.set_many({"a": 1, "b": [2]}, expire={"a": 60, "b": None})
+        values = await cache.get_many(["a", "b", "missing"])
+        return ok, values, await cache.ttl("a"), await cache.ttl("b")
+
+    ok, values, ttl_a, ttl_b = asyncio.run(run())
+    assert ok
+    assert values == {"a": 1, "b": [2], "missing": None}
+    assert 0 < ttl_a <= 60
+    assert ttl_b == -1
+
+
+def test_delete_many_counts_deleted_keys():
+    async def run():
+        cache = _cache()
+        await cache.set_many({"a": 1, "b": 2})
+        return await cache.delete_many(["a", "b", "c"]), await cache.exists("a")
+
+    assert asyncio.run(run()) == (2, False)
+
+
+def test_pipeline_returns_results_in_order():
+    async def run():
+        cache = _cache()
+        await cache.set("b", {"x": 1})
+        async with cache.pipeline() as pipe:
+            pipe.set("a", "one", expire=60).get("b").incr("n", 2).delete("b")
+            pipe.get("b")
+        return pipe.ok, pipe.results
+
+    ok, results = asyncio.run(run())
+    assert ok
+    assert results == [True, {"x": 1}, 2, True, None]
+
+
+def test_pipeline_updates_and_invalidates_l1():
+    async def run():
+        cache = _l1_cache()
+        await cache.set("category:1", "old")
+        async with cache.pipeline() as pipe:
+            pipe.set("category:1", "new")
+            pipe.delete("category:2")
+        await cache.client.flushall()
+        return await cache.get("category:1")
+
+    assert asyncio.run(run()) == "new"
+
+
+def test_disabled_cache_fails_open():
+    async def run():
+        cache = _cache(enabled=False)
+        return (
+            await cache.set("a", 1),
+            await cache.get("a"),
+            await cache.get_many(["a"]),
+            await cache.getOrSet("a", lambda: asyncio.sleep(0, "computed")),
+        )
+
+    assert asyncio.run(run()) == (False, None, {"a": None}, "computed")
+
+
+# --------------------------------------------------
+# Codecs and framing
+# --------------------------------------------------
+@pytest.mark.parametrize("writer_codec", sorted(set(CODECS) - {"pickle"}))
+def test_entries_stay_readable_after_a_codec_switch(writer_codec):
+    async def run():
+        server = fakeredis.FakeServer()
+        await _cache(server, codec=writer_codec).set("k", {"a": [1, 2]})
+        return await _cache(server, codec="json").get("k")
+
+    assert asyncio.run(run()) == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize("compression", sorted(COMPRESSORS))
+def test_large_values_are_compressed_and_readable_without_it(compression):
+    value = {"text": "pizza " * 1000}
+
+    async def run():
+        server = fakeredis.FakeServer()
+        writer = _cache(server, compression=compression, compress_min_bytes=100)
+        await writer.set("k", value)
+        stored = await writer.client.get(writer.key("k"))
+        return len(stored), await _cache(server).get("k")
+
+    size, read = asyncio.run(run())
+    assert size < len("pizza " * 1000)
+    assert read == value
+
+
+def test_legacy_unframed_json_is_still_read():
+    async def run():
+        cache = _cache()
+        await cache.client.set(cache.key("k"), b'{"a": 1}')
+        return await cache.get("k")
+
+    assert asyncio.run(run()) == {"a": 1}
+
+
+def test_unknown_codec_tag_is_a_miss():
+    async def run():
+        cache = _cache()
+        await cache.set("k", {"a": 1})
+        raw = bytearray(await cache.client.get(cache.key("k")))
+        raw[2] = 250  # codec tag byte
+        await cache.client.set(cache.key("k"), bytes(raw))
+        return await cache.get("k")
+
+    assert asyncio.run(run()) is None
+
+
+UNPICKLED = []
+
+
+def _unpickled(value):
+    UNPICKLED.append(value)
+    return value
+
+
+class _Payload:
+    def __reduce__(self):
+        return (_unpickled, ("payload",))
+
+
+def test_pickle_entry_is_a_miss_for_json_reads():
+    async def run():
+        cache = _cache()
+        await cache.set("k", _Payload(), as_json=False)
+        as_json = await cache.get("k")
+        ran_on_json_read = list(UNPICKLED)
+        return as_json, ran_on_json_read, await cache.get("k", as_json=False)
+
+    UNPICKLED.clear()
+    as_json, ran_on_json_read, as_pickle = asyncio.run(run())
+    assert as_json is None
+    assert ran_on_json_read == []
+    assert as_pickle == "payload"
+
+
+def test_pickle_round_trip_when_requested():
+    async def run():
+        cache = _cache()
+        await cache.set("k", {1, 2}, as_json=False)
+        return await cache.get("k", as_json=False)
+
+    assert asyncio.run(run()) == {1, 2}
+
+
+# --------------------------------------------------
+# Tags and generations
+# --------------------------------------------------
+def test_invalidate_tags_orphans_only_tagged_entries():
+    async def run():
+        cache = _cache()
+        await cache.set("menu:1", "m1", tags=["restaurant:1", "menu"])
+        await cache.set("menu:2", "m2", tags=["restaurant:2", "menu"])
+        await cache.invalidate_tags("restaurant:1")
+        return (
+            await cache.get("menu:1", tags=["menu", "restaurant:1"]),
+            await cache.get("menu:2", tags=["menu", "restaurant:2"]),
+        )
+
+    assert asyncio.run(run()) == (None, "m2")
+
+
+def test_schema_version_is_part_of_tagged_keys():
+    async def run():
+        server = fakeredis.FakeServer()
+        await _cache(server, schema_version="1").set("k", "v1", tags=["t"])
+        return await _cache(server, schema_version="2").get("k", tags=["t"])
+
+    assert asyncio.run(run()) is None
+
+
+@pytest.mark.parametrize("l1", [False, True])
+def test_tagged_hit_reads_generations_and_value(l1):
+    async def run():
+        cache = _l1_cache(local_prefixes=()) if l1 else _cache()
+        await cache.set("k", {"a": 1}, tags=["t", "u"])
+        commands = []
+        execute = cache.client.execute_command
+
+        async def record(*args, **kwargs):
+            commands.append(args[0])
+            return await execute(*args, **kwargs)
+
+        cache.client.execute_command = record
+        await cache.get("k", tags=["u", "t"])  # loads the script once
+        commands.clear()
+        return await cache.get("k", tags=["u", "t"]), commands
+
+    value, commands = asyncio.run(run())
+    assert value == {"a": 1}
+    # One script call without L1; with L1 the generations are local hits
+    assert commands == (["GET"] if l1 else ["EVALSHA"])
+
+
+def test_invalidation_reaches_generations_cached_in_l1():
+    async def run():
+        cache = _l1_cache()
+        await cache.set("k", "v", tags=["t"])
+        before = await cache.get("k", tags=["t"])
+        await cache.invalidate_tags("t")
+        return before, await cache.get("k", tags=["t"])
+
+    assert asyncio.run(run()) == ("v", None)
+
+
+# --------------------------------------------------
+# Stale-while-revalidate
+# --------------------------------------------------
+def test_stale_value_is_served_while_refreshing_once():
+    async def run():
+        cache = _cache()
+        version = 0
+
+        async def load():
+            nonlocal version
+            version += 1
+            await asyncio.sleep(0.02)
+            return version
+
+        def read():
+            return cache.getOrSet(
+                "k", load, expire=60, stale_after=timedelta(milliseconds=50), beta=0
+            )
+
+        first = await read()
+        await asyncio.sleep(0.06)
+        stale = await asyncio.gather(read(), read(), read())
+        await asyncio.gather(*cache._refreshing.values())
+        return first, stale, await read(), version
+
+    first, stale, fresh, loads = asyncio.run(run())
+    assert first == 1
+    assert stale == [1, 1, 1]
+    assert fresh == 2
+    assert loads == 2
+
+
+def test_shutdown_cancels_background_refreshes():
+    async def run():
+        cache = _cache()
+
+        async def slow():
+            await asyncio.sleep(10)
+
+        stale = CacheEntry("old", stale_at=time.time() - 1)
+        spec = _FillSpec(slow, 60, True, False, 10, None, None, None)
+        cache._refresh_in_background("k", spec, stale)
+        task = cache._refreshing["k"]
+        await cache.shutdown()
+        return task.cancelled(), cache._refreshing
+
+    assert asyncio.run(run()) == (True, {})
+
+
+# --------------------------------------------------
+# Metrics
+# --------------------------------------------------
+def _series(name: str) -> dict:
+    return {
+        tuple(sorted(s["labels"].items())): s
+        for s in metrics.snapshot()[name]["series"]
+    }
+
+
+def test_requests_are_counted_by_prefix_and_result(monkeypatch):
+    monkeypatch.setattr(metrics, "enabled", True)
+    metrics.reset()
+
+    async def run():
+        cache = _l1_cache()
+        await cache.set("category:1", "x")
+        await cache.get("category:1")
+        await cache.get("user:1")
+        await cache.client.set(cache.key("user:2"), b'"y"')
+        await cache.get("user:2")
+
+    asyncio.run(run())
+    requests = _series("cache_requests_total")
+
+    def count(op, prefix, result):
+        labels = (("op", op), ("prefix", prefix), ("result", result))
+        return requests[labels]["value"]
+
+    assert count("set", "category", "ok") == 1
+    assert count("get", "category", "local_hit") == 1
+    assert count("get", "user", "miss") == 1
+    assert count("get", "user", "hit") == 1
+    assert (
+        _series("cache_latency_seconds")[(("op", "get"), ("prefix", "user"))]["count"]
+        == 2
+    )
+
+
+# --------------------------------------------------
+# Negative caching
+# --------------------------------------------------
+def test_set_negative_reads_back_as_not_found():
+    async def run():
+        cache = _cache(negative_ttl=30)
+        await cache.set_negative("user:missing")
+        return await cache.get("user:missing"), await cache.ttl("user:missing")
+
+    value, ttl = asyncio.run(run())
+    assert value is NOT_FOUND
+    assert not value
+    assert 0 < ttl <= 30
+
+
+def test_get_or_set_remembers_missing_records():
+    async def run():
+        cache = _cache()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            return None
+
+        first = await cache.getOrSet("user:missing", load, expire=60, negative_ttl=5)
+        second = await cache.getOrSet("user:missing", load, expire=60, negative_ttl=5)
+        return first, second, calls, await cache.ttl("user:missing")
+
+    first, second, calls, ttl = asyncio.run(run())
+    assert (first, second, calls) == (None, None, 1)
+    assert 0 < ttl <= 5
+
+
+def test_none_is_not_cached_without_negative_ttl():
+    async def run():
+        cache = _cache()
+        await cache.getOrSet("user:missing", lambda: asyncio.sleep(0), expire=60)
+        return await cache.exists("user:missing")
+
+    assert asyncio.run(run()) is False
+
+
+# --------------------------------------------------
+# Typed models
+# --------------------------------------------------
+class _Dish(BaseModel):
+    name: str
+    price: float
+
+
+def test_models_round_trip_as_validated_instances():
+    async def run():
+        cache = _cache()
+        await cache.set_model("dish:1", _Dish(name="Pho", price=12))
+        await cache.set_models("dish:all", [_Dish(name="Pho", price=12)], _Dish)
+        return await cache.get_model("dish:1", _Dish), await cache.get_models(
+            "dish:all", _Dish
+        )
+
+    one, many = asyncio.run(run())
+    assert one == _Dish(name="Pho", price=12.0)
+    assert many == [one]
+
+
+def test_get_or_set_with_model_returns_instances_on_hits():
+    async def run():
+        cache = _cache()
+
+        async def load():
+            return [{"name": "Pho", "price": "12.5"}]
+
+        await cache.getOrSet("dish:all", load, expire=60, model=_Dish, many=True)
+        return await cache.getOrSet("dish:all", load, expire=60, model=_Dish, many=True)
+
+    assert asyncio.run(run()) == [_Dish(name="Pho", price=12.5)]
+
+
+def test_entry_that_no_longer_validates_is_a_miss():
+    async def run():
+        cache = _cache()
+        await cache.set("dish:1", {"name": "Pho"})
+        return await cache.get_model("dish:1", _Dish)
+
+    assert asyncio.run(run()) is None
+
+
+def test_negative_entry_reads_as_not_found_for_models():
+    async def run():
+        cache = _cache()
+        await cache.set_negative("dish:9")
+        return await cache.get_model("dish:9", _Dish)
+
+    assert asyncio.run(run()) is NOT_FOUND
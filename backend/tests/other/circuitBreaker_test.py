@@ -0,0 +1,163 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from utilities import circuitBreaker
+from utilities.circuitBreaker import CircuitBreaker, CircuitState, SharedCircuitState
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(
+        circuitBreaker, "time", SimpleNamespace(monotonic=clock.monotonic)
+    )
+    return clock
+
+
+def _breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        "test",
+        failure_rate=0.5,
+        minimum_calls=4,
+        window_seconds=30,
+        recovery_timeout=10,
+        half_open_max_calls=2,
+    )
+
+
+def _opened(clock: _Clock) -> CircuitBreaker:
+    breaker = _breaker()
+    for _ in range(4):
+        breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    clock.now += 10
+    return breaker
+
+
+def test_opens_once_failure_rate_reached_over_minimum_calls(clock):
+    breaker = _breaker()
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.allow() is False
+
+
+def test_failures_outside_the_window_do_not_count(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 31
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_admits_only_max_probes(clock):
+    breaker = _opened(clock)
+
+    assert breaker.allow() is True
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+
+
+def test_probe_failure_reopens(clock):
+    breaker = _opened(clock)
+    assert breaker.allow() is True
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.allow() is False
+
+
+def test_closes_after_max_probe_successes(clock):
+    breaker = _opened(clock)
+    assert breaker.allow() and breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.snapshot()["calls"] == 0
+    assert breaker.allow() is True
+
+
+class _Pipeline:
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        return False
+
+    def pttl(self, key):
+        pass
+
+    async def execute(self):
+        await self.redis.during_execute()
+        return [5000]
+
+
+async def _nothing():
+    pass
+
+
+class _Redis:
+    """Answers every PTTL with 5s and runs a hook while the read is in flight."""
+
+    def __init__(self):
+        self.during_execute = _nothing
+
+    def pipeline(self, transaction=False):
+        return _Pipeline(self)
+
+    async def delete(self, key):
+        return 1
+
+
+def test_sync_adopts_open_breakers_from_redis():
+    async def run():
+        shared = SharedCircuitState(_Redis())
+        shared.watch("db")
+        await shared.sync()
+        return shared._open_until.get("db")
+
+    assert asyncio.run(run()) > time.monotonic()
+
+
+def test_sync_in_flight_during_close_does_not_reopen():
+    async def run():
+        redis = _Redis()
+        shared = SharedCircuitState(redis)
+        shared.watch("db")
+
+        async def close_locally():
+            shared.publish_closed("db")
+            await asyncio.gather(*shared._pending)
+
+        redis.during_execute = close_locally
+        await shared.sync()
+        return shared._open_until.get("db")
+
+    assert asyncio.run(run()) is None
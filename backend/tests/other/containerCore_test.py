@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from container import containerCore
+
+
+@pytest.fixture
+def closed(monkeypatch) -> list[str]:
+    closed = []
+
+    async def close_redis():
+        closed.append("Redis")
+
+    def close_mongo():
+        closed.append("MongoDB")
+
+    monkeypatch.setattr(containerCore, "close_redis", close_redis)
+    monkeypatch.setattr(containerCore, "close_mongo", close_mongo)
+    monkeypatch.setattr(containerCore.settings, "startup_redis_timeout", 0.05)
+    monkeypatch.setattr(containerCore.settings, "startup_mongo_timeout", 0.05)
+    return closed
+
+
+async def _ready():
+    return None
+
+
+async def _refused():
+    raise ConnectionError("refused")
+
+
+async def _hangs():
+    await asyncio.sleep(10)
+
+
+def _init(monkeypatch, redis, mongo) -> None:
+    monkeypatch.setattr(containerCore, "init_redis", redis)
+    monkeypatch.setattr(containerCore, "init_mongo", mongo)
+
+
+def test_nothing_is_closed_when_both_connect(monkeypatch, closed):
+    _init(monkeypatch, _ready, _ready)
+
+    asyncio.run(containerCore.init_connections())
+
+    assert closed == []
+
+
+def test_connected_sibling_is_closed_when_one_fails(monkeypatch, closed):
+    _init(monkeypatch, _ready, _refused)
+
+    with pytest.raises(ConnectionError, match="refused"):
+        asyncio.run(containerCore.init_connections())
+
+    assert closed == ["Redis"]
+
+
+def test_timeout_closes_the_sibling_and_is_reported(monkeypatch, closed):
+    _init(monkeypatch, _hangs, _ready)
+
+    with pytest.raises(TimeoutError, match="Redis did not become ready"):
+        asyncio.run(containerCore.init_connections())
+
+    assert closed == ["MongoDB"]
+
+
+def test_first_error_is_raised_when_both_fail(monkeypatch, closed):
+    _init(monkeypatch, _refused, _hangs)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(containerCore.init_connections())
+
+    assert closed == []
+
+
+def test_close_failure_does_not_mask_the_startup_error(monkeypatch, closed):
+    def close_mongo():
+        raise RuntimeError("already closed")
+
+    monkeypatch.setattr(containerCore, "close_mongo", close_mongo)
+    _init(monkeypatch, _refused, _ready)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(containerCore.init_connections())
@@ -0,0 +1,59 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Runs in a fresh interpreter so modules imported by other tests don't count
+_RESOLVE_ONE = textwrap.dedent(
+    """
+    import asyncio, json, sys
+
+    from container.container import Container
+    from container.containerControllers import register_controllers
+    from container.containerRepositories import register_repositories
+    from container.containerServices import register_services
+
+    async def main():
+        container = Container()
+        register_repositories(container)
+        register_services(container, default_lifetime="scoped")
+        register_controllers(container)
+        container.promote_stateless()
+        await container.build()
+        async with container.create_scope() as scope:
+            await container.resolve("CategoryController", scope)
+
+    asyncio.run(main())
+    print(json.dumps(sorted(
+        m for m in sys.modules if m.startswith(("controller.", "service.", "repository."))
+    )))
+    """
+)
+
+
+def test_resolving_one_controller_imports_only_its_dependencies():
+    result = subprocess.run(
+        [sys.executable, "-c", _RESOLVE_ONE],
+        cwd=BACKEND,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    assert "controller.categoryController" in loaded
+    assert "service.categoryService" in loaded
+    assert (
+        not {
+            "controller.restaurantController",
+            "controller.userController",
+            "service.restaurantService",
+            "service.userService",
+            "service.paymentService",
+            "service.emailService",
+        }
+        & loaded
+    )
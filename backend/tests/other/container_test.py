@@ -0,0 +1,272 @@
+import asyncio
+from collections import deque
+
+import pytest
+
+from container.container import Container
+from container.containerLifetimes import stateful_reason
+
+
+@pytest.fixture
+def container(monkeypatch) -> Container:
+    # Container is a process-wide singleton; every test gets its own
+    monkeypatch.setattr(Container, "_instance", None)
+    return Container()
+
+
+def _register(container: Container, name: str, cls, lifetime="singleton", **deps):
+    async def factory(container, scope):
+        resolved = {
+            arg: await container.resolve(dep, scope) for arg, dep in deps.items()
+        }
+        return cls(**resolved)
+
+    container.register(name, factory, lifetime, cls=cls, deps=deps)
+
+
+class Settings:
+    def __init__(self):
+        self.region = "eu"
+
+
+class Repository:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+class Service:
+    def __init__(self, repository: Repository, settings: Settings):
+        self.repository = repository
+        self.settings = settings
+
+    def region(self) -> str:
+        return self.settings.region
+
+
+class Remembers:
+    def __init__(self):
+        self.last = None
+
+    def handle(self, value):
+        self.last = value
+
+
+class Collects:
+    def __init__(self):
+        self.seen = []
+
+    def handle(self, value):
+        self.seen.append(value)
+
+
+class Queues:
+    def __init__(self):
+        self.pending: deque = deque()
+
+    def handle(self, value):
+        self.pending.appendleft(value)
+
+
+class SetsAttributes:
+    def handle(self, name, value):
+        setattr(self, name, value)
+
+
+class ChildOfStateful(Remembers):
+    pass
+
+
+class UsesDependency:
+    def __init__(self, repository: Repository):
+        self.repository = repository
+        self.options = {}
+
+    def save(self, item):
+        # Calling a dependency's `update` is not a change to self
+        self.repository.update(item)
+        return self.options.get("strict", False)
+
+
+def test_compile_plans_dependencies_before_dependents(container):
+    _register(container, "Settings", Settings)
+    _register(container, "Repository", Repository, settings="Settings")
+    _register(
+        container, "Service", Service, repository="Repository", settings="Settings"
+    )
+    container.compile()
+
+    assert [step.name for step in container._plans["Service"]] == [
+        "Settings",
+        "Repository",
+        "Service",
+    ]
+    assert container._plans["Service"][-1].deps == (
+        ("repository", "Repository"),
+        ("settings", "Settings"),
+    )
+
+
+def test_compiled_plan_builds_shared_dependencies_once(container):
+    _register(container, "Settings", Settings)
+    _register(container, "Repository", Repository, settings="Settings")
+    _register(
+        container, "Service", Service, repository="Repository", settings="Settings"
+    )
+    container.compile()
+
+    service = asyncio.run(container.resolve("Service"))
+
+    assert service.repository.settings is service.settings
+    assert container._instances["Settings"] is service.settings
+    assert asyncio.run(container.resolve("Service")) is service
+
+
+def test_compiled_plan_accepts_class_paths(container):
+    container.register(
+        "Settings", lambda c, s: None, cls=f"{__name__}:Settings", deps={}
+    )
+    container.compile()
+
+    assert isinstance(asyncio.run(container.resolve("Settings")), Settings)
+    assert container._plans["Settings"][0].cls is Settings
+
+
+def test_opaque_async_factories_are_awaited(container):
+    async def factory(container, scope):
+        return Settings()
+
+    container.register("Settings", factory)
+    _register(container, "Repository", Repository, settings="Settings")
+    container.compile()
+
+    repository = asyncio.run(container.resolve("Repository"))
+
+    assert isinstance(repository.settings, Settings)
+
+
+def test_transient_is_rebuilt_on_every_resolve(container):
+    _register(container, "Settings", Settings)
+    _register(container, "Repository", Repository, "transient", settings="Settings")
+    container.compile()
+
+    async def resolve_twice():
+        return await container.resolve("Repository"), await container.resolve(
+            "Repository"
+        )
+
+    first, second = asyncio.run(resolve_twice())
+
+    assert first is not second
+    assert first.settings is second.settings
+    assert "Repository" not in container._instances
+
+
+def test_scoped_is_shared_within_a_scope_only(container):
+    _register(container, "Settings", Settings)
+    _register(container, "Repository", Repository, "scoped", settings="Settings")
+    container.compile()
+
+    async def resolve_in_two_scopes():
+        async with container.create_scope() as scope:
+            first = await container.resolve("Repository", scope)
+            again = await container.resolve("Repository", scope)
+        async with container.create_scope() as scope:
+            other = await container.resolve("Repository", scope)
+        return first, again, other
+
+    first, again, other = asyncio.run(resolve_in_two_scopes())
+
+    assert first is again
+    assert first is not other
+
+
+def test_scoped_dependency_requires_a_scope(container):
+    _register(container, "Settings", Settings, "scoped")
+    _register(container, "Repository", Repository, "transient", settings="Settings")
+    container.compile()
+
+    with pytest.raises(RuntimeError, match="Scope required.*'Settings'"):
+        asyncio.run(container.resolve("Repository"))
+
+
+def test_compile_reports_dependency_cycles(container):
+    _register(container, "Repository", Repository, settings="Service")
+    _register(
+        container, "Service", Service, repository="Repository", settings="Service"
+    )
+
+    with pytest.raises(RuntimeError, match="Dependency cycle: Repository -> Service"):
+        container.compile()
+
+
+def test_compile_reports_missing_dependencies(container):
+    _register(container, "Repository", Repository, settings="Settings")
+
+    with pytest.raises(
+        KeyError, match="'Repository' depends on unregistered 'Settings'"
+    ):
+        container.compile()
+
+
+def test_build_exits_on_an_invalid_graph(container):
+    _register(container, "Repository", Repository, settings="Settings")
+
+    with pytest.raises(SystemExit):
+        asyncio.run(container.build())
+
+
+@pytest.mark.parametrize(
+    "cls, reason",
+    [
+        (Settings, None),
+        (Service, None),
+        (UsesDependency, None),
+        (Remembers, "Remembers.handle assigns self.last"),
+        (Collects, "Collects.handle mutates self.seen"),
+        (Queues, "Queues.handle mutates self.pending"),
+        (SetsAttributes, "SetsAttributes.handle mutates self.__dict__"),
+        (ChildOfStateful, "Remembers.handle assigns self.last"),
+    ],
+)
+def test_stateful_reason(cls, reason):
+    assert stateful_reason(cls) == reason
+    assert stateful_reason(f"{__name__}:{cls.__name__}") == reason
+
+
+def test_promotion_keeps_stateful_classes_and_their_dependents(container):
+    _register(container, "Settings", Settings, "scoped")
+    _register(container, "Repository", Repository, "transient", settings="Settings")
+    _register(container, "Collects", Collects, "scoped")
+    _register(container, "Remembers", Remembers, "transient")
+    _register(container, "UsesCollects", Repository, "scoped", settings="Collects")
+    _register(container, "Excluded", Settings, "scoped")
+    container.register("Opaque", lambda c, s: Settings(), "scoped")
+
+    promoted = container.promote_stateless(exclude={"Excluded"})
+
+    assert promoted == ["Settings", "Repository"]
+    assert container._lifetimes == {
+        "Settings": "singleton",
+        "Repository": "singleton",
+        "Collects": "scoped",
+        "Remembers": "transient",
+        "UsesCollects": "scoped",
+        "Excluded": "scoped",
+        "Opaque": "scoped",
+    }
+
+
+def test_promoted_services_resolve_without_a_scope(container):
+    _register(container, "Settings", Settings, "scoped")
+    _register(container, "Repository", Repository, "scoped", settings="Settings")
+    container.promote_stateless()
+    container.compile()
+
+    async def resolve_twice():
+        async with container.create_scope() as scope:
+            scoped = await container.resolve("Repository", scope)
+        return scoped, await container.resolve("Repository")
+
+    scoped, unscoped = asyncio.run(resolve_twice())
+
+    assert scoped is unscoped
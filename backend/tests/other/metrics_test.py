@@ -0,0 +1,18 @@
+from utilities.metrics import MetricsRegistry
+
+
+def test_reset_clears_values_in_place():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total")
+    latency = registry.histogram("latency_seconds")
+    requests.inc(route="/a")
+    latency.observe(0.01, route="/a")
+
+    registry.reset()
+
+    assert registry.counter("requests_total") is requests
+    assert registry.snapshot()["requests_total"]["series"] == []
+
+    requests.inc(route="/a")
+    assert registry.snapshot()["requests_total"]["series"][0]["value"] == 1.0
+    assert registry.snapshot()["latency_seconds"]["series"] == []
@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+
+from utilities.errorRaiser import BadRequestException
+from utilities.pagination import (
+    MAX_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    page_size,
+)
+
+
+def _doc(name: str) -> SimpleNamespace:
+    return SimpleNamespace(id=ObjectId(), name=name)
+
+
+def test_cursor_round_trip():
+    doc_id = ObjectId()
+    cursor = encode_cursor("name", "Pizza", doc_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "name") == ("Pizza", doc_id)
+
+
+def test_cursor_from_another_sort_is_rejected():
+    cursor = encode_cursor("name", "Pizza", ObjectId())
+
+    with pytest.raises(BadRequestException):
+        decode_cursor(cursor, "_id")
+
+
+def test_garbage_cursor_is_rejected():
+    with pytest.raises(BadRequestException):
+        decode_cursor("not-a-cursor", "name")
+
+
+def test_keyset_filter_resumes_after_cursor():
+    doc_id = ObjectId()
+
+    assert keyset_filter("_id", encode_cursor("_id", doc_id, doc_id)) == {
+        "_id": {"$gt": doc_id}
+    }
+    assert keyset_filter("name", encode_cursor("name", "Pizza", doc_id)) == {
+        "$or": [
+            {"name": {"$gt": "Pizza"}},
+            {"name": "Pizza", "_id": {"$gt": doc_id}},
+        ]
+    }
+
+
+def test_page_with_extra_row_points_at_its_last_item():
+    rows = [_doc("a"), _doc("b"), _doc("c")]
+
+    page = Page.from_rows(rows, limit=2, sort="name")
+
+    assert page.items == rows[:2]
+    assert decode_cursor(page.next_cursor, "name") == ("b", rows[1].id)
+
+
+def test_last_page_has_no_cursor():
+    rows = [_doc("a"), _doc("b")]
+
+    page = Page.from_rows(rows, limit=2, sort="name", total=2)
+
+    assert page.next_cursor is None
+    assert page.to_dict(lambda d: d.name) == {
+        "status": "success",
+        "count": 2,
+        "data": ["a", "b"],
+        "next_cursor": None,
+        "total": 2,
+    }
+
+
+def test_page_size_bounds():
+    assert page_size(MAX_PAGE_SIZE + 1) == MAX_PAGE_SIZE
+    with pytest.raises(BadRequestException):
+        page_size(0)
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("celery")
+
+from tasks import paymentTasks  # noqa: E402
+
+
+class _WebService:
+    def __init__(self, capture_status: str, order_status: str = "APPROVED"):
+        self.capture_status = capture_status
+        self.order_status = order_status
+        self.calls: list[str] = []
+
+    async def capturePaypalOrder(self, order_id: str) -> dict:
+        self.calls.append(f"capture:{order_id}")
+        return {"status": self.capture_status}
+
+    async def getPayPalOrder(self, order_id: str) -> dict:
+        self.calls.append(f"get:{order_id}")
+        return {"status": self.order_status}
+
+
+@pytest.fixture
+def web(monkeypatch):
+    def install(**kwargs) -> _WebService:
+        service = _WebService(**kwargs)
+
+        async def resolve():
+            return service
+
+        monkeypatch.setattr(paymentTasks, "_web_service", resolve)
+        monkeypatch.setattr(
+            paymentTasks, "run_async", lambda coro, timeout=None: asyncio.run(coro)
+        )
+        return service
+
+    return install
+
+
+def test_finalize_captures_through_paypal(web):
+    service = web(capture_status="COMPLETED")
+
+    result = paymentTasks.finalize_payment_task.run("PP-1", 7)
+
+    assert result == {"status": "captured", "paypal_order_id": "PP-1"}
+    assert service.calls == ["capture:PP-1"]
+
+
+def test_finalize_abandons_an_incomplete_capture(web, monkeypatch):
+    web(capture_status="PENDING")
+    scheduled = []
+    monkeypatch.setattr(
+        paymentTasks.abandon_payment_task,
+        "apply_async",
+        lambda args: scheduled.append(args),
+    )
+
+    result = paymentTasks.finalize_payment_task.run("PP-1", 7)
+
+    assert result["status"] == "abandoned"
+    assert scheduled == [["PP-1", 7]]
+
+
+def test_abandon_does_not_claim_a_captured_order(web):
+    web(capture_status="COMPLETED", order_status="COMPLETED")
+
+    assert paymentTasks.abandon_payment_task.run("PP-1", 7)["status"] == "captured"
+
+
+def test_abandon_leaves_uncaptured_order_to_expire(web):
+    service = web(capture_status="COMPLETED", order_status="APPROVED")
+
+    result = paymentTasks.abandon_payment_task.run("PP-1", 7)
+
+    assert result["status"] == "abandoned"
+    assert result["paypal_status"] == "APPROVED"
+    assert service.calls == ["get:PP-1"]
@@ -0,0 +1,44 @@
+import pytest
+
+from middleware.rateLimitPolicies import GCRA, PolicyTrie, RateLimitPolicy
+
+GENERAL = RateLimitPolicy("general", "/", 100, 60)
+ITEMS = RateLimitPolicy("items", "/api/items/{id}", 50, 60)
+ITEM_SEARCH = RateLimitPolicy("search", "/api/items/search", 20, 60)
+ITEM_WRITES = RateLimitPolicy("writes", "/api/items/{id}", 5, 60, methods=["post"])
+UPLOAD = RateLimitPolicy("upload", "/api/items/{id}/image", 2, 60, GCRA)
+
+
+@pytest.fixture
+def trie() -> PolicyTrie:
+    return PolicyTrie([GENERAL, ITEMS, ITEM_WRITES, ITEM_SEARCH, UPLOAD])
+
+
+def test_literal_segment_beats_wildcard(trie):
+    assert trie.match("GET", "/api/items/search") is ITEM_SEARCH
+    assert trie.match("GET", "/api/items/42") is ITEMS
+
+
+def test_deepest_pattern_wins_and_covers_subpaths(trie):
+    assert trie.match("POST", "/api/items/42/image") is UPLOAD
+    assert trie.match("GET", "/api/items/42/image/thumb") is UPLOAD
+    assert trie.match("GET", "/api/orders") is GENERAL
+
+
+def test_method_specific_policy_before_catch_all(trie):
+    assert trie.match("post", "/api/items/42") is ITEM_WRITES
+    assert trie.match("GET", "/api/items/42") is ITEMS
+
+
+def test_no_match_without_root_policy():
+    assert PolicyTrie([ITEMS]).match("GET", "/api/orders") is None
+
+
+def test_overrides_and_exemptions():
+    policy = RateLimitPolicy(
+        "general", "/", 100, 60, roles={"admin": None}, users={"u1": 10}
+    )
+
+    assert policy.limit_for() == 100
+    assert policy.limit_for(role="admin") is None
+    assert policy.limit_for(role="admin", user_id="u1") == 10
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from middleware.rateLimitPolicies import GCRA, SLIDING_WINDOW, TOKEN_BUCKET
+from middleware.rateLimiterMiddleware import LocalRateLimiter, RateLimitStore
+from service.cacheService import CacheService
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def _store() -> RateLimitStore:
+    cache = CacheService(client=fakeredis.FakeAsyncRedis(), local_enabled=False)
+    return RateLimitStore(cache)
+
+
+def _consume_three(algorithm: str) -> list[tuple[bool, float]]:
+    # 2 requests per minute: the third comes too early under every algorithm
+    async def run():
+        store = _store()
+        return [await store.consume(algorithm, "rl:test", 2, 60) for _ in range(3)]
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("algorithm", [TOKEN_BUCKET, GCRA])
+def test_script_allows_burst_then_denies_with_retry_after(algorithm):
+    first, second, third = _consume_three(algorithm)
+
+    assert first == (True, 0.0)
+    assert second == (True, 0.0)
+    assert third[0] is False
+    # One request's share of the window: 60s / 2
+    assert third[1] == pytest.approx(30, abs=1)
+
+
+def test_sliding_window_denies_until_the_window_slides():
+    first, second, third = _consume_three(SLIDING_WINDOW)
+
+    assert first == (True, 0.0)
+    assert second == (True, 0.0)
+    assert third[0] is False
+    assert 0 < third[1] <= 60
+
+
+def test_script_failure_fails_open():
+    async def run():
+        store = _store()
+        await store.cache.client.set(store.cache.key("rl:test"), b"legacy")
+        return await store.consume(TOKEN_BUCKET, "rl:test", 1, 60)
+
+    assert asyncio.run(run()) == (True, 0.0)
+
+
+async def _admit(local: LocalRateLimiter, key: str, capacity: int, rate: float):
+    # Same decision path as RateLimiterMiddleware
+    decision = local.consume(key, capacity, rate)
+    if decision is None:
+        decision = await local.consume_shared(key, capacity, rate)
+    return decision
+
+
+def test_local_limiter_close_flushes_pending_counts():
+    async def run():
+        store = _store()
+        local = LocalRateLimiter(store, sync_interval=60)
+        results = [await _admit(local, "rl:test", 100, 1.0) for _ in range(4)]
+
+        await local.close()
+
+        tokens = await store.cache.client.hget(store.cache.key("rl:test"), "t")
+        return results, float(tokens)
+
+    results, tokens = asyncio.run(run())
+    assert all(allowed for allowed, _ in results)
+    # One request seeded the bucket from Redis, three were flushed on close
+    assert tokens == pytest.approx(96, abs=0.1)
+
+
+@pytest.mark.parametrize("capacity", [100, 5])
+def test_local_mode_admits_about_the_exact_burst(capacity):
+    rate = capacity / 60
+
+    async def burst(local_mode: bool) -> int:
+        store = _store()
+        local = LocalRateLimiter(store, sync_interval=60, error_budget=0.1)
+        admitted = 0
+        for _ in range(capacity * 2):
+            if local_mode:
+                allowed, _ = await _admit(local, "rl:burst", capacity, rate)
+            else:
+                allowed, _ = await store.consume_token("rl:burst", capacity, rate)
+            admitted += allowed
+        await local.close()
+        return admitted
+
+    exact = asyncio.run(burst(False))
+    local = asyncio.run(burst(True))
+
+    assert exact == capacity
+    # Overshoot is bounded by one error budget (at least one request)
+    assert exact <= local <= exact + max(1, int(capacity * 0.1))
+
+
+def test_local_limiter_refreshes_from_shared_bucket_on_sync():
+    async def run():
+        store = _store()
+        local = LocalRateLimiter(store, sync_interval=60)
+        await _admit(local, "rl:test", 10, 0.001)
+        # Another process drains the shared bucket
+        for _ in range(9):
+            await store.consume_token("rl:test", 10, 0.001)
+
+        assert local.consume("rl:test", 10, 0.001) == (True, 0.0)
+        await local.sync()
+        decision = local.consume("rl:test", 10, 0.001)
+        await local.close()
+        return decision
+
+    allowed, retry_after = asyncio.run(run())
+    assert allowed is False
+    assert retry_after > 0
@@ -0,0 +1,126 @@
+import asyncio
+import hashlib
+import time
+from types import SimpleNamespace
+
+import pytest
+from jose import jwt
+from starlette.requests import Request
+
+from config.environmentConfig import settings
+from middleware.authContextMiddleware import AuthContextMiddleware
+from middleware.authMiddleware import get_current_user
+from service.basicTokenService import BasicTokenService
+from utilities.errorRaiser import UnauthorizedException
+
+CLAIMS = {"id": "u1", "email": "u1@example.com", "role": "customer"}
+
+
+def _token(expires_in: float | None = 600, **claims) -> str:
+    payload = {**CLAIMS, **claims}
+    if expires_in is not None:
+        payload["exp"] = int(time.time() + expires_in)
+    return jwt.encode(payload, settings.secret_key, algorithm=settings.algorithm)
+
+
+@pytest.fixture
+def decodes(monkeypatch) -> list[str]:
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(token, *args, **kwargs):
+        calls.append(token)
+        return decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+    return calls
+
+
+def test_cache_hit_skips_the_signature_check(decodes):
+    service = BasicTokenService()
+    token = _token()
+
+    first = service.decodeAccessToken(token)
+    second = service.decodeAccessToken(token)
+
+    assert decodes == [token]
+    assert second is first
+    assert dict(second) == {**CLAIMS, "exp": first["exp"]}
+
+
+def test_cached_claims_are_read_only(decodes):
+    service = BasicTokenService()
+    token = _token()
+
+    claims = service.decodeAccessToken(token)
+    with pytest.raises(TypeError):
+        claims["role"] = "admin"
+
+    assert service.decodeAccessToken(token)["role"] == "customer"
+
+
+def test_entry_expires_with_the_token(decodes):
+    service = BasicTokenService()
+    token = _token(expires_in=30)
+
+    claims = service.decodeAccessToken(token)
+
+    digest = hashlib.sha256(token.encode()).digest()
+    _, expires_at = service._verified._data[digest]
+    remaining = claims["exp"] - time.time()
+    assert expires_at - time.monotonic() == pytest.approx(remaining, abs=1)
+
+
+def test_tokens_without_exp_are_not_cached(decodes):
+    service = BasicTokenService()
+    token = _token(expires_in=None)
+
+    service.decodeAccessToken(token)
+    service.decodeAccessToken(token)
+
+    assert decodes == [token, token]
+    assert len(service._verified) == 0
+
+
+def test_invalid_and_expired_tokens_are_rejected():
+    service = BasicTokenService()
+
+    for token in ("", "not-a-jwt", _token(expires_in=-60)):
+        with pytest.raises(UnauthorizedException):
+            service.decodeAccessToken(token)
+    assert len(service._verified) == 0
+
+
+def test_middleware_and_dependency_share_one_decode(decodes):
+    service = BasicTokenService()
+    resolves = []
+
+    async def resolve(name, scope=None):
+        resolves.append(name)
+        return service
+
+    app = SimpleNamespace(
+        state=SimpleNamespace(container=SimpleNamespace(resolve=resolve))
+    )
+    token = _token()
+    users = []
+
+    async def endpoint(scope, receive, send):
+        users.append(await get_current_user(Request(scope), token))
+
+    middleware = AuthContextMiddleware(endpoint)
+
+    async def request():
+        scope = {
+            "type": "http",
+            "app": app,
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+        }
+        await middleware(scope, None, None)
+
+    asyncio.run(request())
+    asyncio.run(request())
+
+    assert decodes == [token]
+    assert resolves == ["BasicTokenService"]
+    assert users == [CLAIMS, CLAIMS]
@@ -0,0 +1,160 @@
+import json
+import pickle
+from typing import Any, Callable, Optional
+
+from utilities.logger import logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+
+class Codec:
+    """
+    Serializer for cached values. `tag` is the byte stored in each cache
+    entry so values written with one codec stay readable after a switch.
+    `is_json` codecs produce JSON text that Pydantic can validate directly.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tag: int,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[bytes], Any],
+        is_json: bool = False,
+    ):
+        self.name = name
+        self.tag = tag
+        self.dumps = dumps
+        self.loads = loads
+        self.is_json = is_json
+
+
+class Compressor:
+    def __init__(
+        self,
+        name: str,
+        tag: int,
+        compress: Callable[[bytes], bytes],
+        decompress: Callable[[bytes], bytes],
+    ):
+        self.name = name
+        self.tag = tag
+        self.compress = compress
+        self.decompress = decompress
+
+
+CODECS: dict[str, Codec] = {}
+CODECS_BY_TAG: dict[int, Codec] = {}
+COMPRESSORS: dict[str, Compressor] = {}
+COMPRESSORS_BY_TAG: dict[int, Compressor] = {}
+
+
+def register_codec(codec: Codec) -> None:
+    existing = CODECS_BY_TAG.get(codec.tag)
+    if existing is not None and existing.name != codec.name:
+        raise ValueError(f"Codec tag {codec.tag} already used by '{existing.name}'")
+
+    CODECS[codec.name] = codec
+    CODECS_BY_TAG[codec.tag] = codec
+
+
+def register_compressor(compressor: Compressor) -> None:
+    existing = COMPRESSORS_BY_TAG.get(compressor.tag)
+    if existing is not None and existing.name != compressor.name:
+        raise ValueError(
+            f"Compressor tag {compressor.tag} already used by '{existing.name}'"
+        )
+
+    COMPRESSORS[compressor.name] = compressor
+    COMPRESSORS_BY_TAG[compressor.tag] = compressor
+
+
+def get_codec(name: str) -> Codec:
+    codec = CODECS.get(name)
+    if codec is None:
+        logger.warn(f"[CacheCodecs] Codec '{name}' unavailable — falling back to json")
+        return CODECS["json"]
+    return codec
+
+
+def get_json_codec() -> Codec:
+    return CODECS.get("orjson") or CODECS["json"]
+
+
+def get_compressor(name: Optional[str]) -> Optional[Compressor]:
+    if not name or name == "none":
+        return None
+
+    compressor = COMPRESSORS.get(name)
+    if compressor is None:
+        logger.warn(
+            f"[CacheCodecs] Compressor '{name}' unavailable — storing uncompressed"
+        )
+    return compressor
+
+
+register_codec(
+    Codec(
+        "json",
+        1,
+        lambda v: json.dumps(v).encode("utf-8"),
+        json.loads,
+        is_json=True,
+    )
+)
+
+register_codec(Codec("pickle", 4, pickle.dumps, pickle.loads))
+
+if orjson is not None:
+    register_codec(
+        Codec(
+            "orjson",
+            2,
+            lambda v: orjson.dumps(v, option=orjson.OPT_NON_STR_KEYS),
+            orjson.loads,
+            is_json=True,
+        )
+    )
+
+if msgpack is not None:
+    register_codec(
+        Codec(
+            "msgpack",
+            3,
+            lambda v: msgpack.packb(v, use_bin_type=True),
+            lambda raw: msgpack.unpackb(raw, raw=False),
+        )
+    )
+
+if zstandard is not None:
+    _zstd_compressor = zstandard.ZstdCompressor(level=3)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+    register_compressor(
+        Compressor(
+            "zstd",
+            1,
+            _zstd_compressor.compress,
+            _zstd_decompressor.decompress,
+        )
+    )
+
+if lz4_frame is not None:
+    register_compressor(Compressor("lz4", 2, lz4_frame.compress, lz4_frame.decompress))
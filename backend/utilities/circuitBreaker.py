@@ -1,5 +1,25 @@
+import asyncio
 import time
+from collections import deque
 from enum import Enum
+from typing import Optional
+
+from config.environmentConfig import settings
+from utilities.logger import logger
+from utilities.metrics import metrics
+
+_STATE = metrics.gauge(
+    "circuit_breaker_state", "Breaker state by name: 0 closed, 1 half-open, 2 open"
+)
+_FAILURE_RATE = metrics.gauge(
+    "circuit_breaker_failure_rate", "Failure rate over the rolling window by name"
+)
+_TRANSITIONS = metrics.counter(
+    "circuit_breaker_transitions_total", "Breaker state changes by name and state"
+)
+_REJECTED = metrics.counter(
+    "circuit_breaker_rejected_total", "Calls refused by an open breaker by name"
+)
 
 
 class CircuitState(Enum):
@@ -8,38 +28,318 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"
 
 
+_STATE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class SharedCircuitState:
+    """
+    Open breakers published to Redis as keys that expire with the recovery
+    timeout. Each process refreshes its view every `sync_interval` seconds,
+    so `allow()` never waits on Redis; any Redis error leaves breakers
+    purely local.
+    """
+
+    def __init__(self, redis, sync_interval: float = 1.0, prefix: str = "breaker:"):
+        self.redis = redis
+        self.sync_interval = sync_interval
+        self.prefix = prefix
+        self._names: set[str] = set()
+        self._open_until: dict[str, float] = {}
+        # Last local close per name; syncs started before it are stale
+        self._closed_at: dict[str, float] = {}
+        self._sync_task: Optional[asyncio.Task] = None
+        self._pending: set[asyncio.Task] = set()
+
+    def watch(self, name: str) -> None:
+        self._names.add(name)
+
+    def open_until(self, name: str) -> Optional[float]:
+        """Monotonic time another process's open breaker recovers, if any."""
+        self._ensure_sync()
+        until = self._open_until.get(name)
+        return until if until and until > time.monotonic() else None
+
+    def publish_open(self, name: str, seconds: float) -> None:
+        self._spawn(self.redis.set(self.prefix + name, b"1", px=int(seconds * 1000)))
+
+    def publish_closed(self, name: str) -> None:
+        self._open_until.pop(name, None)
+        self._closed_at[name] = time.monotonic()
+        self._spawn(self._delete(name))
+
+    async def _delete(self, name: str) -> None:
+        await self.redis.delete(self.prefix + name)
+        # A sync that read the key before the delete landed is stale too
+        self._closed_at[name] = time.monotonic()
+
+    def _spawn(self, coro) -> None:
+        try:
+            task = asyncio.get_running_loop().create_task(self._quietly(coro))
+        except RuntimeError:
+            coro.close()
+            return
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _quietly(self, coro) -> None:
+        try:
+            await coro
+        except Exception as e:
+            logger.warn(f"[SharedCircuitState] publish failed — staying local: {e}")
+
+    def _ensure_sync(self) -> None:
+        if self._sync_task is not None and not self._sync_task.done():
+            return
+        try:
+            self._sync_task = asyncio.get_running_loop().create_task(self._sync_loop())
+        except RuntimeError:
+            pass
+
+    async def sync(self) -> None:
+        names = sorted(self._names)
+        if not names:
+            return
+
+        started = time.monotonic()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for name in names:
+                pipe.pttl(self.prefix + name)
+            ttls = await pipe.execute()
+
+        now = time.monotonic()
+        self._open_until = {
+            name: now + ttl / 1000
+            for name, ttl in zip(names, ttls)
+            if ttl > 0 and self._closed_at.get(name, 0.0) < started
+        }
+
+    async def _sync_loop(self) -> None:
+        while True:
+            try:
+                await self.sync()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warn(f"[SharedCircuitState] sync failed — staying local: {e}")
+            await asyncio.sleep(self.sync_interval)
+
+    async def close(self) -> None:
+        if self._sync_task is None:
+            return
+
+        self._sync_task.cancel()
+        try:
+            await self._sync_task
+        except asyncio.CancelledError:
+            pass
+        self._sync_task = None
+
+
 class CircuitBreaker:
+    """
+    Opens when at least `failure_rate` of the calls in the last
+    `window_seconds` failed, once `minimum_calls` were seen. After
+    `recovery_timeout` it half-opens and admits at most `half_open_max_calls`
+    probes at a time; that many successes close it, any failure re-opens it.
+    Probes that never report back free their slot after `recovery_timeout`.
+    """
+
     def __init__(
         self,
-        failure_threshold: int = 5,
+        name: str = "default",
+        failure_rate: float = 0.5,
+        minimum_calls: int = 20,
+        window_seconds: float = 30.0,
         recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 3,
+        shared: Optional[SharedCircuitState] = None,
     ):
-        self.failure_threshold = failure_threshold
+        self.name = name
+        self.failure_rate = failure_rate
+        self.minimum_calls = minimum_calls
+        self.window_seconds = window_seconds
         self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.shared = shared
 
-        self.failures = 0
         self.state = CircuitState.CLOSED
         self.opened_at: float | None = None
 
+        # One [second, successes, failures] bucket per second of the window
+        self._buckets: deque[list] = deque()
+        self._calls = 0
+        self._failures = 0
+
+        self._probes: deque[float] = deque()
+        self._probe_successes = 0
+
+        if shared is not None:
+            shared.watch(name)
+        _STATE.set(0, name=name)
+
+    def _transition(self, state: CircuitState) -> None:
+        if state == self.state:
+            return
+
+        logger.warn(
+            f"[CircuitBreaker] {self.name}: {self.state.value} -> {state.value}"
+        )
+        self.state = state
+        _STATE.set(_STATE_VALUES[state], name=self.name)
+        _TRANSITIONS.inc(name=self.name, state=state.value)
+
+        if state == CircuitState.OPEN:
+            self.opened_at = time.monotonic()
+            self._probes.clear()
+        elif state == CircuitState.HALF_OPEN:
+            self._probe_successes = 0
+        else:
+            self.opened_at = None
+            self._probes.clear()
+            self._buckets.clear()
+            self._calls = self._failures = 0
+
+    def _expire(self, now: float) -> None:
+        horizon = int(now - self.window_seconds)
+        while self._buckets and self._buckets[0][0] <= horizon:
+            _, successes, failures = self._buckets.popleft()
+            self._calls -= successes + failures
+            self._failures -= failures
+
+    def _record(self, failed: bool) -> None:
+        now = time.monotonic()
+        self._expire(now)
+
+        second = int(now)
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+        self._buckets[-1][2 if failed else 1] += 1
+        self._calls += 1
+        self._failures += failed
+
+        _FAILURE_RATE.set(self.current_failure_rate(), name=self.name)
+
+    def current_failure_rate(self) -> float:
+        return self._failures / self._calls if self._calls else 0.0
+
+    def _adopt_shared(self) -> bool:
+        until = self.shared.open_until(self.name) if self.shared else None
+        if until is None:
+            return False
+
+        self._transition(CircuitState.OPEN)
+        self.opened_at = until - self.recovery_timeout
+        return True
+
     def allow(self) -> bool:
+        now = time.monotonic()
+
         if self.state == CircuitState.CLOSED:
-            return True
+            if not self._adopt_shared():
+                return True
 
         if self.state == CircuitState.OPEN:
-            if time.monotonic() - (self.opened_at or 0) >= self.recovery_timeout:
-                self.state = CircuitState.HALF_OPEN
-                return True
+            if now - (self.opened_at or 0) < self.recovery_timeout:
+                _REJECTED.inc(name=self.name)
+                return False
+            self._transition(CircuitState.HALF_OPEN)
+
+        while self._probes and now - self._probes[0] >= self.recovery_timeout:
+            self._probes.popleft()
+
+        if len(self._probes) >= self.half_open_max_calls:
+            _REJECTED.inc(name=self.name)
             return False
 
+        self._probes.append(now)
         return True
 
     def record_success(self):
-        self.failures = 0
-        self.state = CircuitState.CLOSED
-        self.opened_at = None
+        if self.state == CircuitState.HALF_OPEN:
+            if self._probes:
+                self._probes.popleft()
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_max_calls:
+                self._transition(CircuitState.CLOSED)
+                if self.shared:
+                    self.shared.publish_closed(self.name)
+            return
+
+        self._record(failed=False)
 
     def record_failure(self):
-        self.failures += 1
-        if self.failures >= self.failure_threshold:
-            self.state = CircuitState.OPEN
-            self.opened_at = time.monotonic()
+        if self.state == CircuitState.HALF_OPEN:
+            self._open()
+            return
+
+        self._record(failed=True)
+        if (
+            self.state == CircuitState.CLOSED
+            and self._calls >= self.minimum_calls
+            and self.current_failure_rate() >= self.failure_rate
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self._transition(CircuitState.OPEN)
+        if self.shared:
+            self.shared.publish_open(self.name, self.recovery_timeout)
+
+    def snapshot(self) -> dict:
+        self._expire(time.monotonic())
+        return {
+            "state": self.state.value,
+            "calls": self._calls,
+            "failure_rate": round(self.current_failure_rate(), 4),
+            "probes_in_flight": len(self._probes),
+        }
+
+
+class CircuitBreakerRegistry:
+    """
+    One breaker per name per process, e.g. "mongo.read" / "mongo.write",
+    shared by every repository instead of one per instance.
+    """
+
+    def __init__(self):
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._shared: Optional[SharedCircuitState] = None
+
+    def _shared_state(self) -> Optional[SharedCircuitState]:
+        if not settings.circuit_shared_enabled:
+            return None
+        if self._shared is None:
+            from resources.redis_client import redis_client
+
+            self._shared = SharedCircuitState(
+                redis_client, sync_interval=settings.circuit_sync_interval_ms / 1000
+            )
+        return self._shared
+
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(
+                name,
+                failure_rate=settings.circuit_failure_rate,
+                minimum_calls=settings.circuit_minimum_calls,
+                window_seconds=settings.circuit_window_seconds,
+                recovery_timeout=settings.circuit_recovery_timeout,
+                half_open_max_calls=settings.circuit_half_open_max_calls,
+                shared=self._shared_state(),
+            )
+        return breaker
+
+    def snapshot(self) -> dict:
+        return {name: b.snapshot() for name, b in self._breakers.items()}
+
+    async def close(self) -> None:
+        if self._shared is not None:
+            await self._shared.close()
+
+
+breakers = CircuitBreakerRegistry()
@@ -0,0 +1,148 @@
+import threading
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+from config.environmentConfig import settings
+
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(labels: dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+class Counter:
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self.values: dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _labels(labels)
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+    def snapshot(self) -> list[dict]:
+        return [
+            {"labels": dict(labels), "value": value}
+            for labels, value in self.values.items()
+        ]
+
+
+class Gauge(Counter):
+    def set(self, value: float, **labels: str) -> None:
+        self.values[_labels(labels)] = value
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self.values: dict[Labels, list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _labels(labels)
+        series = self.values.get(key)
+        if series is None:
+            # [bucket counts..., +Inf count], sum
+            series = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def snapshot(self) -> list[dict]:
+        result = []
+        for labels, (counts, total) in self.values.items():
+            cumulative, running = {}, 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                running += count
+                cumulative["+Inf" if bound == float("inf") else str(bound)] = running
+
+            result.append(
+                {
+                    "labels": dict(labels),
+                    "count": running,
+                    "sum": total,
+                    "buckets": cumulative,
+                }
+            )
+        return result
+
+
+class MetricsRegistry:
+    """
+    In-process metrics registry.
+    When disabled, instrumented code should check `enabled` first so the
+    hot path pays a single attribute lookup.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = cls(name, *args, **kwargs)
+        return metric
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        return self._get_or_create(Counter, name, description)
+
+    def gauge(self, name: str, description: str = "") -> Gauge:
+        return self._get_or_create(Gauge, name, description)
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        buckets: Optional[Iterable[float]] = None,
+    ) -> Histogram:
+        return self._get_or_create(
+            Histogram, name, description, buckets or LATENCY_BUCKETS
+        )
+
+    def snapshot(self) -> dict:
+        return {
+            name: {
+                "type": type(metric).__name__.lower(),
+                "description": metric.description,
+                "series": metric.snapshot(),
+            }
+            for name, metric in sorted(self._metrics.items())
+        }
+
+    def reset(self) -> None:
+        # Clears values in place: modules hold their metric objects from import
+        with self._lock:
+            for metric in self._metrics.values():
+                metric.values.clear()
+
+
+metrics = MetricsRegistry(enabled=settings.metrics_enabled)
@@ -0,0 +1,172 @@
+import base64
+import binascii
+from typing import Any, AsyncIterator, Callable, Optional, Sequence
+
+from bson import json_util
+from starlette.responses import StreamingResponse
+
+from utilities.errorRaiser import BadRequestException
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+STREAM_BATCH_SIZE = 500
+
+
+def encode_cursor(sort: str, value: Any, doc_id: Any) -> str:
+    """Opaque cursor pointing just past (`value`, `doc_id`) in `sort` order."""
+    raw = json_util.dumps([sort, value, doc_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple[Any, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, doc_id = json_util.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        raise BadRequestException("Invalid pagination cursor")
+
+    if cursor_sort != sort:
+        raise BadRequestException("Pagination cursor does not match this listing")
+
+    return value, doc_id
+
+
+def page_size(limit: Optional[int]) -> int:
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    if limit < 1:
+        raise BadRequestException("limit must be at least 1")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def _sort_spec(sort: str) -> list[tuple[str, int]]:
+    # `_id` breaks ties so the order is total even for non-unique keys
+    return [("_id", 1)] if sort == "_id" else [(sort, 1), ("_id", 1)]
+
+
+def _sort_value(doc, sort: str) -> Any:
+    return doc.id if sort == "_id" else getattr(doc, sort)
+
+
+def keyset_filter(sort: str, cursor: Optional[str]) -> dict:
+    if not cursor:
+        return {}
+
+    value, doc_id = decode_cursor(cursor, sort)
+    if sort == "_id":
+        return {"_id": {"$gt": doc_id}}
+    return {
+        "$or": [
+            {sort: {"$gt": value}},
+            {sort: value, "_id": {"$gt": doc_id}},
+        ]
+    }
+
+
+async def fetch_page(
+    model,
+    *,
+    limit: int,
+    cursor: Optional[str] = None,
+    sort: str = "_id",
+    filters: Optional[dict] = None,
+    projection=None,
+) -> list:
+    """
+    One keyset page of `model`, plus one extra document when more follow.
+    Pass the result to `Page.from_rows`; keeping the raw list makes it
+    cacheable as a plain document list. A `projection` model must include
+    the sort key.
+    """
+    query = {**(filters or {}), **keyset_filter(sort, cursor)}
+    return (
+        await model.find(query, projection_model=projection)
+        .sort(_sort_spec(sort))
+        .limit(limit + 1)
+        .to_list()
+    )
+
+
+class Page:
+    __slots__ = ("items", "next_cursor", "total")
+
+    def __init__(
+        self, items: Sequence, next_cursor: Optional[str], total: Optional[int]
+    ):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.total = total
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence,
+        limit: int,
+        sort: str = "_id",
+        total: Optional[int] = None,
+    ) -> "Page":
+        if len(rows) <= limit:
+            return cls(rows, None, total)
+
+        items = rows[:limit]
+        last = items[-1]
+        return cls(items, encode_cursor(sort, _sort_value(last, sort), last.id), total)
+
+    def to_dict(self, dump: Callable[[Any], Any]) -> dict:
+        body = {
+            "status": "success",
+            "count": len(self.items),
+            "data": [dump(item) for item in self.items],
+            "next_cursor": self.next_cursor,
+        }
+        if self.total is not None:
+            body["total"] = self.total
+        return body
+
+
+async def stream_documents(
+    model,
+    *,
+    sort: str = "_id",
+    filters: Optional[dict] = None,
+    projection=None,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> AsyncIterator:
+    """Yields documents straight off the Mongo cursor, one batch in memory."""
+    query = model.find(
+        filters or {}, projection_model=projection, batch_size=batch_size
+    ).sort(_sort_spec(sort))
+    async for doc in query:
+        yield doc
+
+
+async def _ndjson(docs: AsyncIterator) -> AsyncIterator[bytes]:
+    async for doc in docs:
+        yield doc.model_dump_json().encode() + b"\n"
+
+
+async def _json_array(docs: AsyncIterator) -> AsyncIterator[bytes]:
+    yield b'{"status":"success","data":['
+    first = True
+    async for doc in docs:
+        if not first:
+            yield b","
+        yield doc.model_dump_json().encode()
+        first = False
+    yield b"]}"
+
+
+STREAM_FORMATS = {
+    "ndjson": (_ndjson, "application/x-ndjson"),
+    "json": (_json_array, "application/json"),
+}
+
+
+def stream_response(docs: AsyncIterator, fmt: str = "ndjson") -> StreamingResponse:
+    if fmt not in STREAM_FORMATS:
+        raise BadRequestException(
+            f"stream must be one of: {', '.join(sorted(STREAM_FORMATS))}"
+        )
+
+    encode, media_type = STREAM_FORMATS[fmt]
+    return StreamingResponse(encode(docs), media_type=media_type)
@@ -0,0 +1,81 @@
+from functools import lru_cache
+from typing import Iterable, Optional, Type, get_args, get_origin
+
+from beanie import Link, PydanticObjectId
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+from utilities.errorRaiser import BadRequestException
+
+
+class ProjectionModel(BaseModel):
+    """
+    Base for read-only views of a document. Beanie turns the fields into
+    a Mongo projection, so only these fields are sent and validated.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: Optional[PydanticObjectId] = Field(default=None, alias="_id")
+
+
+def _is_link(annotation) -> bool:
+    if annotation is Link or get_origin(annotation) is Link:
+        return True
+    return any(_is_link(arg) for arg in get_args(annotation))
+
+
+def projectable_fields(document: Type[BaseModel]) -> tuple[str, ...]:
+    return tuple(
+        name
+        for name, info in document.model_fields.items()
+        if name not in {"id", "revision_id"} and not _is_link(info.annotation)
+    )
+
+
+@lru_cache(maxsize=256)
+def _projection_model(
+    document: Type[BaseModel], fields: tuple[str, ...]
+) -> Type[ProjectionModel]:
+    definitions = {
+        name: (Optional[document.model_fields[name].annotation], None)
+        for name in fields
+    }
+    return create_model(
+        f"{document.__name__}Projection_{'_'.join(fields)}",
+        __base__=ProjectionModel,
+        **definitions,
+    )
+
+
+def projection_for(
+    document: Type[BaseModel],
+    fields: Optional[str],
+    required: Iterable[str] = (),
+) -> Optional[Type[ProjectionModel]]:
+    """
+    Projection model for a comma-separated `?fields=` value, or None for the
+    full document. `required` fields (e.g. a pagination sort key) are always
+    included; `id` always is.
+    """
+    if not fields:
+        return None
+
+    allowed = projectable_fields(document)
+    requested = {f.strip() for f in fields.split(",") if f.strip()} - {"id"}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise BadRequestException(
+            f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Allowed: id, {', '.join(allowed)}"
+        )
+
+    selected = requested | (set(required) - {"id", "_id"})
+    # Sorted so the same selection always maps to the same cached model
+    return _projection_model(document, tuple(sorted(selected)))
+
+
+def projection_key(projection: Optional[Type[BaseModel]]) -> str:
+    """Cache-key suffix distinguishing projected reads from full ones."""
+    if projection is None:
+        return "full"
+    return ",".join(sorted(projection.model_fields))
@@ -0,0 +1,17 @@
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.requests import Request
+
+# Set per HTTP request by RequestScopeMiddleware so singletons never hold
+# request data on the instance.
+current_request: ContextVar[Optional[Request]] = ContextVar(
+    "current_request", default=None
+)
+
+
+def get_request() -> Request:
+    request = current_request.get()
+    if request is None:
+        raise RuntimeError("No HTTP request is active in this context")
+    return request